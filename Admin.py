@@ -1,13 +1,23 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
+import altair as alt
 from datetime import datetime, timedelta
+import csv
+import io
+import os
+import tempfile
+import threading
+from collections import deque
+from cachetools import LRUCache
 
 # Try importing the database handler
 try:
     import db_handler
+    import db_metrics
+    import db_health
+    import analytics
+    import exports
     DB_AVAILABLE = True
 except ImportError:
     DB_AVAILABLE = False
@@ -16,74 +26,152 @@ except ImportError:
 # 1. DATA CONTROLLER (OPTIMIZED WITH CACHING)
 # ==========================================
 
-# 1. Cache the DB Availability Check (Runs once)
+# 1. DB Mode (Runs once). A configured DB is always used; whether it is reachable right now is
+# tracked by the db_health monitor, so an outage at startup no longer means mock data forever.
 @st.cache_resource
 def check_db_connection():
-    """Checks if we can actually connect to the DB."""
-    if DB_AVAILABLE:
-        conn = db_handler.get_connection()
-        if conn:
-            conn.close()
-            return True
+    """Checks if a real database is configured and starts its health monitor."""
+    if DB_AVAILABLE and db_handler.is_configured():
+        db_health.start_monitor()
+        return True
     return False
 
 USE_REAL_DB = check_db_connection()
 
+# Last good result of each loader call, served while the DB is down instead of mock data
+_last_known = LRUCache(maxsize=256)
+_last_known_lock = threading.Lock()
+
+def _hybrid(key, real_fn, mock_fn, label):
+    """Real data while the DB is up, the last good result while it is down, mock data otherwise.
+    real_fn must raise when the DB can't be read, so an outage is never kept as the last good result."""
+    if USE_REAL_DB and not db_health.is_down():
+        try:
+            result = real_fn()
+            with _last_known_lock: _last_known[key] = result
+            return result
+        except Exception as e:
+            print(f"{label} Fetch Error: {e}")
+    with _last_known_lock:
+        if key in _last_known: return _last_known[key]
+    return mock_fn()
+
 # 2. Cache KPI Data (Refreshes every 60 seconds)
+def _fetch_kpis():
+    real_stats = db_handler.get_dashboard_kpis() 
+    return {
+        "total_users": real_stats.get('users', 0),
+        "total_admins": real_stats.get('admins', 0),
+        "predictions_24h": real_stats.get('predictions', 0), 
+        "pending_feedback": 0 
+    }
+
 @st.cache_data(ttl=60)
 def get_kpi_data_hybrid():
-    """Fetches real stats if DB is live, else mock."""
-    if USE_REAL_DB:
-        try:
-            real_stats = db_handler.get_dashboard_kpis() 
-            return {
-                "total_users": real_stats.get('users', 0),
-                "total_admins": real_stats.get('admins', 0),
-                "predictions_24h": real_stats.get('predictions', 0), 
-                "pending_feedback": 0 
-            }
-        except Exception as e:
-            print(f"KPI Fetch Error: {e}")
-    return get_kpi_mock()
+    """Fetches real stats if DB is live, else last-known, else mock."""
+    return _hybrid("kpis", _fetch_kpis, get_kpi_mock, "KPI")
 
-# 3. Cache User List (Refreshes every 60 seconds)
+# 3. Cache User Pages (Refreshes every 60 seconds)
 @st.cache_data(ttl=60)
-def get_users_hybrid():
-    """Fetches real users if DB is live, else mock."""
-    if USE_REAL_DB:
-        try:
-            raw_users = db_handler.get_all_users()
-            formatted_users = []
-            for u in raw_users:
-                role_display = "Admin" if u['role'] in ['admin', 'super_admin'] else "User"
-                joined_date = str(u['Joined']) if u['Joined'] else "-"
-                formatted_users.append({
-                    "ID": f"DB-{u['id']}",
-                    "Name": u['username'],
-                    "Email": u['email'],
-                    "Role": role_display, 
-                    "Joined": joined_date,
-                    "Last Login": u.get('Last Login', '-')
-                })
-            return formatted_users
-        except Exception as e:
-            print(f"User Fetch Error: {e}")
-            
-    # Return Mock if DB not connected
-    return init_mock_data()
+def get_users_page_hybrid(roles=None, search="", after_id=None, page_size=50):
+    """Fetches one keyset page of users (filtered in SQL) if DB is live, else mock.
+    Returns (users, next_cursor)."""
+    def fetch():
+        raw_users, next_cursor = db_handler.get_users_page(
+            roles=roles, search=search or None, after_id=after_id, page_size=page_size
+        )
+        formatted_users = []
+        for u in raw_users:
+            role_display = "Admin" if u['role'] in db_handler.ADMIN_ROLES else "User"
+            formatted_users.append({
+                "ID": f"DB-{u['id']}",
+                "Name": u['username'],
+                "Email": u['email'],
+                "Role": role_display, 
+                "Joined": u['Joined'],
+                "Last Login": u['Last Login']
+            })
+        return formatted_users, next_cursor
+    key = ("users", tuple(roles or ()), search, after_id, page_size)
+    # Never offer mock rows against a real DB: their IDs would reach the purge form
+    fallback = (lambda: ([], None)) if USE_REAL_DB else (lambda: get_users_page_mock(roles, search))
+    return _hybrid(key, fetch, fallback, "User")
+
+def get_users_page_mock(roles=None, search=""):
+    users = init_mock_data()
+    if roles:
+        wanted = "Admin" if set(roles) <= {'admin', 'super_admin'} else "User"
+        users = [u for u in users if u['Role'] == wanted]
+    if search:
+        users = [u for u in users if u['Name'].lower().startswith(search.lower()) or u['Email'].lower().startswith(search.lower())]
+    return users, None
+
+# 4. Live Log Tail (per-session ring buffer fed by id deltas)
+LOG_BUFFER = 500
+LOG_POLL_SECONDS = 5
+# Re-read a few ids under the high-water mark: a slower transaction can commit a lower id late
+LOG_OVERLAP = 20
+
+def poll_log_tail():
+    """Appends activity rows newer than the highest id this session has seen and returns the
+    buffer newest first. Only the first call per session reads a full page.
+
+    Raises if the DB can't be read; the session state is only seeded once both first reads
+    succeed, so a failed start never leaves the tail replaying the table from id 0."""
+    if 'log_tail' not in st.session_state:
+        high = db_handler.get_max_log_id()
+        latest, _ = db_handler.get_logs_page(page_size=50)
+        st.session_state.log_tail = deque(reversed(latest), maxlen=LOG_BUFFER)
+        st.session_state.log_tail_high = high
+    tail = st.session_state.log_tail
+    high = st.session_state.log_tail_high
+    seen = {r['ID'] for r in tail}
+    for row in db_handler.get_logs_since(max(high - LOG_OVERLAP, 0)):
+        if row['ID'] not in seen:
+            tail.append(row)
+            high = max(high, row['ID'])
+    st.session_state.log_tail_high = high
+    return sorted(tail, key=lambda r: r['ID'], reverse=True)
 
-# 4. Cache Logs (Refreshes every 30 seconds)
-@st.cache_data(ttl=30)
-def get_logs_hybrid():
-    """Fetches real logs if DB is live, else mock."""
-    if USE_REAL_DB:
-        try:
-            raw_logs = db_handler.get_recent_logs(limit=50)
-            if raw_logs:
-                return pd.DataFrame(raw_logs)
-        except Exception:
-            pass
-    return get_real_login_table_mock()
+@st.cache_data(ttl=60)
+def get_log_page_hybrid(after_id):
+    """One older page of the activity log (keyset on id), for scrolling back past the live buffer."""
+    return db_handler.get_logs_page(after_id=after_id, page_size=50)
+
+# 5. Cache Chart Data (pre-aggregated rollups, refreshed in the background)
+if USE_REAL_DB:
+    analytics.start_refresher()
+
+def _analytics_hybrid(real_fn, mock_fn, label):
+    return _hybrid(label, real_fn, mock_fn, label)
+
+@st.cache_data(ttl=300)
+def get_user_growth_hybrid():
+    return _analytics_hybrid(analytics.user_growth, get_user_growth_data, "Growth")
+
+@st.cache_data(ttl=300)
+def get_predictions_by_role_hybrid():
+    return _analytics_hybrid(analytics.predictions_by_role, get_predictions_by_role_data, "Role Split")
+
+@st.cache_data(ttl=300)
+def get_user_login_stats_hybrid():
+    return _analytics_hybrid(analytics.login_distribution, get_user_login_stats, "Login Stats")
+
+@st.cache_data(ttl=300)
+def get_module_usage_hybrid():
+    return _analytics_hybrid(analytics.module_usage, get_module_usage_data, "Module Usage")
+
+@st.cache_data(ttl=300)
+def get_accuracy_hybrid(days, by):
+    return _hybrid(("Accuracy", days, by), lambda: analytics.prediction_accuracy(days, by), lambda: get_accuracy_mock(by), "Accuracy")
+
+@st.cache_data(ttl=300)
+def get_cohort_retention_hybrid(weeks):
+    return _hybrid(("Cohorts", weeks), lambda: analytics.cohort_retention(weeks), lambda: get_cohort_mock(weeks), "Cohorts")
+
+@st.cache_data(ttl=300)
+def get_signup_funnel_hybrid(weeks):
+    return _hybrid(("Funnel", weeks), lambda: analytics.signup_funnel(weeks), lambda: get_funnel_mock(weeks), "Funnel")
 
 # ==========================================
 # 2. MOCK DATA GENERATORS (Cached for Speed)
@@ -144,7 +232,51 @@ def get_real_login_table_mock():
 
 @st.cache_data
 def get_module_usage_data():
-    return pd.DataFrame({"Module": ['AI Predictor', 'Study Material', 'Job Board', 'Profile'], "Active Users": [120, 85, 45, 30]})
+    return pd.DataFrame({"Module": ['AI Predictor', 'Study Material', 'Job Board', 'Profile'], "Events": [120, 85, 45, 30]})
+
+@st.cache_data
+def get_accuracy_mock(by):
+    groups = {
+        None: ["All"],
+        "job_role": ["Software Developer - GET", "IT Support Specialist - SDA", "Data Analyst - Associate"],
+        "district": ["Pune", "Mumbai Suburban", "Thane", "Other"],
+        "day": list(pd.date_range(end=datetime.now().date(), periods=14).date),
+    }[by]
+    rng = np.random.default_rng(len(groups))
+    return pd.DataFrame({
+        "Group": groups, "Feedback": rng.integers(5, 60, len(groups)),
+        "MAE": rng.normal(45000, 8000, len(groups)).round(1), "MAPE %": rng.normal(12, 3, len(groups)).round(1),
+        "Bias": rng.normal(5000, 12000, len(groups)).round(1),
+    })
+
+def _mock_cohorts(weeks):
+    today = datetime.now().date()
+    return [today - timedelta(days=today.weekday(), weeks=w) for w in range(weeks - 1, -1, -1)]
+
+@st.cache_data
+def get_cohort_mock(weeks):
+    rng = np.random.default_rng(weeks)
+    rows = []
+    for age, cohort in enumerate(reversed(_mock_cohorts(weeks))):
+        size = int(rng.integers(40, 120))
+        for week in range(age + 1):
+            active = size if week == 0 else int(size * 0.55 * 0.8 ** week * rng.uniform(0.8, 1.2))
+            rows.append({"Cohort": cohort, "Week": week, "Users": size, "Active": active})
+    frame = pd.DataFrame(rows).sort_values(["Cohort", "Week"], ignore_index=True)
+    frame["Retention %"] = (100 * frame["Active"] / frame["Users"]).round(1)
+    return frame
+
+@st.cache_data
+def get_funnel_mock(weeks):
+    rng = np.random.default_rng(weeks)
+    rows = []
+    for cohort in _mock_cohorts(weeks):
+        signed_up = int(rng.integers(40, 120))
+        verified = int(signed_up * rng.uniform(0.7, 0.9))
+        predicted = int(verified * rng.uniform(0.5, 0.8))
+        hiring = int(predicted * rng.uniform(0.4, 0.7))
+        rows.append([cohort, signed_up, verified, predicted, hiring, int(hiring * rng.uniform(0.2, 0.5))])
+    return pd.DataFrame(rows, columns=["Cohort", "Signed Up", "Verified", "Predicted", "Opened Hiring", "Clicked Job"])
 
 @st.cache_data
 def get_hiring_notifications():
@@ -215,25 +347,455 @@ def local_css():
         </style>
     """, unsafe_allow_html=True)
 
-def setup_dark_plots():
-    plt.style.use('dark_background')
-    sns.set_theme(style="dark", rc={
-        "axes.facecolor": "#090510", "figure.facecolor": "#090510", "grid.color": "#1F1B2E",
-        "text.color": "#A0A0C0", "xtick.color": "#5E5E75", "ytick.color": "#5E5E75",
-        "axes.labelcolor": "#A0A0C0", "axes.edgecolor": "#090510", "font.family": "monospace"
-    })
+# Charts are Vega-Lite specs rendered in the browser. Each spec is cached by st.cache_data,
+# which keys it on a hash of the (already cached, aggregated) DataFrame it was built from,
+# so a rerun with unchanged data does no chart work on the server at all.
+CHART_COLORS = ["#00E5FF", "#FF00E6", "#39FF14", "#FFEA00", "#7C4DFF"]
+
+def dark_chart(chart):
+    return chart.configure(background="#090510", font="monospace").configure_view(stroke=None).configure_axis(
+        labelColor="#5E5E75", titleColor="#A0A0C0", gridColor="#1F1B2E", domain=False, tickColor="#1F1B2E"
+    ).configure_legend(labelColor="#A0A0C0", titleColor="#A0A0C0").configure_header(labelColor="#A0A0C0", titleColor="#A0A0C0")
+
+@st.cache_data
+def growth_chart_spec(growth_data):
+    base = alt.Chart(growth_data).encode(x=alt.X("Date:T", title=None, axis=alt.Axis(labelAngle=-45)))
+    area = base.mark_area(color="#00E5FF", opacity=0.05).encode(y=alt.Y("New Users:Q"))
+    line = base.mark_line(color="#00E5FF", strokeWidth=2).encode(
+        y="New Users:Q", tooltip=[alt.Tooltip("Date:T"), alt.Tooltip("New Users:Q")]
+    )
+    points = alt.Chart(growth_data.iloc[::4]).mark_point(
+        filled=True, color="#fff", stroke="#00E5FF", strokeWidth=2, size=40
+    ).encode(x="Date:T", y="New Users:Q")
+    return dark_chart((area + line + points).properties(height=320)).to_dict()
+
+@st.cache_data
+def role_donut_spec(role_data):
+    base = alt.Chart(role_data).transform_joinaggregate(Total="sum(Count)").transform_calculate(
+        Share="datum.Count / datum.Total"
+    ).encode(
+        theta=alt.Theta("Count:Q", stack=True),
+        color=alt.Color("Role:N", scale=alt.Scale(range=CHART_COLORS), legend=alt.Legend(orient="bottom", columns=2)),
+    )
+    arcs = base.mark_arc(innerRadius=70, outerRadius=120, stroke="#090510", strokeWidth=3).encode(
+        tooltip=["Role:N", "Count:Q", alt.Tooltip("Share:Q", format=".1%")]
+    )
+    labels = base.mark_text(radius=95, color="#fff", fontSize=10).encode(text=alt.Text("Share:Q", format=".1%"))
+    return dark_chart((arcs + labels).properties(height=320)).to_dict()
+
+@st.cache_data
+def login_violin_spec(login_stats):
+    violin = alt.Chart(login_stats).transform_density(
+        "Total Logins", as_=["Total Logins", "density"], groupby=["Role"]
+    ).mark_area(orient="horizontal", opacity=0.8).encode(
+        y=alt.Y("Total Logins:Q"),
+        x=alt.X("density:Q", stack="center", impute=None, title=None, axis=alt.Axis(labels=False, ticks=False, grid=False)),
+        color=alt.Color("Role:N", scale=alt.Scale(scheme="plasma"), legend=None),
+    ).properties(width=90, height=300).facet(column=alt.Column("Role:N", header=alt.Header(titleOrient="bottom", labelOrient="bottom")))
+    return dark_chart(violin).to_dict()
+
+@st.cache_data
+def module_bar_spec(module_data):
+    base = alt.Chart(module_data).encode(
+        y=alt.Y("Module:N", sort="-x", title=None),
+        x=alt.X("Events:Q", axis=None),
+    )
+    bars = base.mark_bar(color="#39FF14", opacity=0.8)
+    labels = base.mark_text(align="left", dx=5, color="#fff").encode(text="Events:Q")
+    return dark_chart((bars + labels).properties(height=300)).to_dict()
+
+@st.cache_data
+def accuracy_chart_spec(accuracy, by):
+    if by == "day":
+        chart = alt.Chart(accuracy).mark_line(color="#FF00E6", strokeWidth=2, point=True).encode(
+            x=alt.X("Group:T", title=None), y=alt.Y("MAPE %:Q"), tooltip=["Group:T", "Feedback:Q", "MAE:Q", "MAPE %:Q", "Bias:Q"]
+        )
+    else:
+        chart = alt.Chart(accuracy).mark_bar(opacity=0.85).encode(
+            y=alt.Y("Group:N", sort="-x", title=None), x=alt.X("MAPE %:Q"),
+            color=alt.Color("Bias:Q", scale=alt.Scale(scheme="redblue", domainMid=0, reverse=True), title="Bias ₹"),
+            tooltip=["Group:N", "Feedback:Q", "MAE:Q", "MAPE %:Q", "Bias:Q"],
+        )
+    return dark_chart(chart.properties(height=280)).to_dict()
+
+@st.cache_data
+def retention_heatmap_spec(retention):
+    # ISO week-start labels sort correctly as plain strings
+    retention = retention.assign(Cohort=pd.to_datetime(retention["Cohort"]).dt.strftime("%Y-%m-%d"))
+    base = alt.Chart(retention).encode(
+        x=alt.X("Week:O", title="WEEKS SINCE SIGNUP", axis=alt.Axis(labelAngle=0)),
+        y=alt.Y("Cohort:O", title=None, sort="descending"),
+    )
+    cells = base.mark_rect(stroke="#090510", strokeWidth=2).encode(
+        color=alt.Color("Retention %:Q", scale=alt.Scale(scheme="plasma", domain=[0, 100]), legend=None),
+        tooltip=["Cohort:O", "Week:O", "Users:Q", "Active:Q", "Retention %:Q"],
+    )
+    labels = base.mark_text(color="#fff", fontSize=10).encode(text=alt.Text("Retention %:Q", format=".0f"))
+    return dark_chart((cells + labels).properties(height=320)).to_dict()
+
+@st.cache_data
+def funnel_chart_spec(funnel_totals):
+    base = alt.Chart(funnel_totals).encode(
+        y=alt.Y("Step:N", sort=None, title=None),
+        x=alt.X("Users:Q", axis=None),
+    )
+    bars = base.mark_bar(color="#FF00E6", opacity=0.8).encode(tooltip=["Step:N", "Users:Q", alt.Tooltip("Conversion:Q", format=".1%")])
+    labels = base.mark_text(align="left", dx=5, color="#fff").encode(text=alt.Text("Conversion:Q", format=".0%"))
+    return dark_chart((bars + labels).properties(height=260)).to_dict()
+
+def health_chart_spec(probes):
+    # Not cached: the probe history changes on every refresh
+    frame = pd.DataFrame(probes)
+    base = alt.Chart(frame).encode(x=alt.X("Time:T", title=None))
+    line = base.mark_line(color="#00E5FF", strokeWidth=2).encode(
+        y=alt.Y("Latency ms:Q"), tooltip=["Time:T", "Latency ms:Q"]
+    )
+    failures = base.transform_filter("!datum.OK").mark_rule(color="#FF0055", opacity=0.6).encode(tooltip=["Time:T", "Error:N"])
+    slow = alt.Chart(pd.DataFrame({"y": [db_health.SLOW_MS]})).mark_rule(color="#FFEA00", strokeDash=[4, 4]).encode(y="y:Q")
+    return dark_chart((line + failures + slow).properties(height=200)).to_dict()
+
+def render_chart(spec):
+    # theme=None keeps our dark config instead of Streamlit's default chart theme
+    st.vega_lite_chart(spec, use_container_width=True, theme=None)
+
+# ==========================================
+# 4. PAGE SECTIONS (each one a fragment)
+# ==========================================
+# Every section fetches its own data and reruns on its own: paging users, purging a node or
+# switching a log view only re-executes that fragment, never the charts or the other panels.
+# Tabbed views use a radio so only the visible view's data is fetched.
+@st.fragment
+def render_metrics_hud():
+    kpi = get_kpi_data_hybrid()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("ACTIVE UNITS", kpi['total_users'], "SYNCED")
+    c2.metric("CONTROLLERS", kpi['total_admins'], "SECURE")
+    c3.metric("AI QUERIES", kpi['predictions_24h'], "HIGH LOAD")
+    c4.metric("PENDING FB", kpi['pending_feedback'], "WAITING") 
+
+@st.fragment
+def render_charts():
+    # --- VISUALIZATION (Live rollups when the DB is connected, simulated data otherwise) ---
+    col_a, col_b = st.columns([2, 1])
+    with col_a:
+        st.markdown("### 📈 NETWORK TRAFFIC")
+        render_chart(growth_chart_spec(get_user_growth_hybrid()))
+
+    with col_b:
+        st.markdown("### 🧩 ROLE DISTRIBUTION")
+        render_chart(role_donut_spec(get_predictions_by_role_hybrid()))
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # --- ROW 2 ---
+    col_c, col_d = st.columns(2)
+    with col_c:
+        st.markdown("### 🧬 USER DENSITY")
+        st.caption("Login Frequency Heatmap")
+        render_chart(login_violin_spec(get_user_login_stats_hybrid()))
+
+    with col_d:
+        st.markdown("### ⚡ MODULE LOAD")
+        st.caption("System Resource Allocation")
+        render_chart(module_bar_spec(get_module_usage_hybrid()))
+
+ACCURACY_WINDOWS = {"7 DAYS": 7, "30 DAYS": 30, "90 DAYS": 90, "ALL TIME": None}
+ACCURACY_GROUPS = {"JOB ROLE": "job_role", "DISTRICT": "district", "DAY": "day"}
+
+@st.fragment
+def render_model_accuracy():
+    st.markdown("### 🎯 MODEL ACCURACY")
+    st.caption("Predicted salary center vs. offers reported through feedback · bias > 0 means over-prediction")
+    c_win, c_by = st.columns(2)
+    days = ACCURACY_WINDOWS[c_win.radio("WINDOW", list(ACCURACY_WINDOWS), index=1, horizontal=True, key="acc_window")]
+    by = ACCURACY_GROUPS[c_by.radio("GROUP BY", list(ACCURACY_GROUPS), horizontal=True, key="acc_group")]
+    overall = get_accuracy_hybrid(days, None)
+    if overall.empty:
+        st.info("NO FEEDBACK WITH REPORTED OFFERS IN THIS WINDOW")
+        return
+    total = overall.iloc[0]
+    a1, a2, a3, a4 = st.columns(4)
+    a1.metric("FEEDBACK", int(total["Feedback"]))
+    a2.metric("MAE", f"₹ {total['MAE']:,.0f}")
+    a3.metric("MAPE", f"{total['MAPE %']:.1f}%")
+    a4.metric("BIAS", f"₹ {total['Bias']:+,.0f}")
+    accuracy = get_accuracy_hybrid(days, by)
+    render_chart(accuracy_chart_spec(accuracy, by))
+    st.dataframe(accuracy, width=1000)
+
+COHORT_WINDOWS = {"8 WEEKS": 8, "12 WEEKS": 12, "26 WEEKS": 26}
+
+@st.fragment
+def render_cohorts():
+    st.markdown("### 🧭 COHORTS & FUNNEL")
+    st.caption("Weekly signup cohorts · share active in each later week, and how far each cohort got")
+    weeks = COHORT_WINDOWS[st.radio("COHORTS", list(COHORT_WINDOWS), index=1, horizontal=True,
+                                    label_visibility="collapsed", key="cohort_window")]
+    retention = get_cohort_retention_hybrid(weeks)
+    funnel = get_signup_funnel_hybrid(weeks)
+    if funnel.empty:
+        st.info("NO SIGNUPS IN THIS WINDOW")
+        return
+    totals = funnel.drop(columns="Cohort").sum()
+    funnel_totals = pd.DataFrame({"Step": totals.index, "Users": totals.to_numpy(dtype="int64")})
+    funnel_totals["Conversion"] = funnel_totals["Users"] / max(int(totals.iloc[0]), 1)
+    col_r, col_f = st.columns([3, 2])
+    with col_r:
+        st.caption("RETENTION % BY COHORT")
+        if retention.empty: st.info("NO ACTIVITY RECORDED FOR THESE COHORTS")
+        else: render_chart(retention_heatmap_spec(retention))
+    with col_f:
+        st.caption("SIGNUP FUNNEL")
+        render_chart(funnel_chart_spec(funnel_totals))
+    if st.toggle("COHORT TABLE", key="show_cohort_table"):
+        st.dataframe(funnel, width=1000)
+
+@st.fragment(run_every=LOG_POLL_SECONDS)
+def render_system_logs():
+    st.markdown("### 💾 SYSTEM LOGS")
+    view = st.radio("LOG VIEW", ["ACCESS LOGS", "TRANSMISSIONS"], horizontal=True, label_visibility="collapsed", key="log_view")
+    if view == "TRANSMISSIONS":
+        st.dataframe(get_hiring_notifications(), width=1000)
+        return
+    if not USE_REAL_DB:
+        st.dataframe(get_real_login_table_mock(), width=1000)
+        return
+
+    # Empty stack = live tail; each entry is the keyset cursor of an older page being viewed
+    history = st.session_state.setdefault('log_history_stack', [])
+    rows = None
+    if not db_health.is_down():
+        try:
+            if not history:
+                rows = poll_log_tail()
+                next_cursor = rows[-1]['ID'] if rows else None
+                st.caption(f"● LIVE · polling every {LOG_POLL_SECONDS}s · {len(rows)} most recent events")
+            else:
+                rows, next_cursor = get_log_page_hybrid(history[-1])
+                st.caption(f"ARCHIVE PAGE {len(history)} · live tail paused")
+        except Exception as e:
+            print(f"Log Fetch Error: {e}")
+    if rows is None:
+        # Keep showing what this session already has; polling resumes once the DB is back
+        rows = sorted(st.session_state.get('log_tail', []), key=lambda r: r['ID'], reverse=True)
+        next_cursor = None
+        st.caption(f"● PAUSED · database unreachable · showing {len(rows)} buffered events")
+    st.dataframe(pd.DataFrame(rows), width=1000)
+    c_new, c_old = st.columns(2)
+    if c_new.button("<< NEWER", disabled=not history, key="log_newer"):
+        history.pop()
+        st.rerun(scope="fragment")
+    if c_old.button("OLDER >>", disabled=next_cursor is None, key="log_older"):
+        history.append(next_cursor)
+        st.rerun(scope="fragment")
+
+EXPORT_MIMES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+@st.fragment
+def render_data_export():
+    with st.expander(">> EXPORT AUDIT DATA (CSV / PARQUET)"):
+        st.caption("Full tables, streamed from the DB in chunks to a server-side file. "
+                   "For very large ranges run `python exports.py <table> --format parquet` on the server instead.")
+        c_table, c_fmt = st.columns(2)
+        table = c_table.selectbox("TABLE", list(exports.EXPORTS), key="export_table")
+        fmt = c_fmt.radio("FORMAT", list(exports.FORMATS), horizontal=True, key="export_format")
+        c_from, c_to = st.columns(2)
+        since = c_from.date_input("FROM", value=None, key="export_since")
+        until = c_to.date_input("TO", value=None, key="export_until")
+        if st.button(">> PREPARE EXPORT", key="export_prepare"):
+            exports.sweep_exports()  # Files orphaned by a crashed or killed run
+            bar = st.progress(0.0, text="EXPORTING...")
+            path = None
+            try:
+                path, count = exports.export_table(
+                    table, fmt, since=since, until=until,
+                    progress=lambda done: bar.progress(done, text=f"EXPORTING {done:.0%}")
+                )
+            except db_handler.Error as e:
+                st.error(f"EXPORT FAILED: {e}")
+            bar.empty()
+            if path:
+                # Offered only in the run that built it: the bytes reach Streamlit's media store
+                # once and are dropped on the next rerun, and the file is deleted straight away
+                name = exports.export_filename(table, fmt, since, until)
+                try:
+                    with open(path, "rb") as f:
+                        st.download_button(f"DOWNLOAD {count:,} ROWS · {name}", f, file_name=name,
+                                           mime=EXPORT_MIMES[fmt], key="export_download", on_click="ignore")
+                finally:
+                    os.remove(path)
+
+HEALTH_REFRESH_SECONDS = 10
+HEALTH_LABELS = {"healthy": "🟢 HEALTHY", "slow": "🟡 SLOW", "down": "🔴 DOWN", "unknown": "⚪ PROBING"}
+
+@st.fragment(run_every=HEALTH_REFRESH_SECONDS)
+def render_db_health():
+    st.markdown("### 🩺 DATABASE HEALTH")
+    health = db_health.status()
+    st.caption(f"Probed every {db_health.PROBE_SECONDS:.0f}s ({db_health.DOWN_PROBE_SECONDS:.0f}s while degraded) · "
+               f"slow above {db_health.SLOW_MS:.0f} ms · state since {health['since']:%H:%M:%S}")
+    h1, h2, h3, h4, h5 = st.columns(5)
+    h1.metric("STATE", HEALTH_LABELS.get(health['state'], health['state']))
+    h2.metric("LATENCY", "—" if health['last_latency_ms'] is None else f"{health['last_latency_ms']:.0f} ms")
+    h3.metric("P95", "—" if health['p95_latency_ms'] is None else f"{health['p95_latency_ms']:.0f} ms")
+    h4.metric("AVAILABILITY", "—" if health['availability'] is None else f"{health['availability']:.1f}%")
+    h5.metric("QUEUED WRITES", health['queued'], help=f"{health['replayed']} replayed · {health['dropped']} dropped (queue full)")
+    probes = db_health.probe_history()
+    if probes: render_chart(health_chart_spec(probes))
+    changes = db_health.transitions()
+    if changes:
+        st.dataframe(pd.DataFrame(changes), width=1000)
+
+@st.fragment
+def render_db_performance():
+    st.markdown("### ⏱️ DATABASE PERFORMANCE")
+    st.caption(f"Per-statement latency since server start · slow threshold {db_metrics.SLOW_QUERY_MS:.0f} ms")
+    routing = db_handler.replica_status()
+    if routing['configured']:
+        pin_note = " · this session is pinned to primary" if routing['pinned'] else ""
+        st.caption(f"Reads → replica (primary for {routing['pin_seconds']:.0f}s after a write){pin_note}")
+    else:
+        st.caption("Reads → primary (no [mysql_replica] configured)")
+    perf_rows = db_metrics.snapshot()
+    if perf_rows:
+        p1, p2, p3 = st.columns(3)
+        p1.metric("QUERIES", sum(r['Calls'] for r in perf_rows))
+        p2.metric("ERRORS", sum(r['Errors'] for r in perf_rows))
+        p3.metric("SLOW", len(db_metrics.slow_queries()))
+        view = st.radio("PERF VIEW", ["LATENCY", "SLOW QUERIES"], horizontal=True, label_visibility="collapsed", key="perf_view")
+        if view == "LATENCY": st.dataframe(pd.DataFrame(perf_rows), width=1000)
+        else: st.dataframe(pd.DataFrame(db_metrics.slow_queries()), width=1000)
+        if st.button(">> RESET COUNTERS"):
+            db_metrics.reset()
+            st.rerun(scope="fragment")
+    else:
+        st.info("NO QUERIES RECORDED YET")
+
+@st.fragment
+def render_add_user():
+    st.markdown(f"""<div style="display:flex; align-items:center; gap:8px; color:#00E5FF; margin-bottom:15px; font-family:'Rajdhani'; font-size:1.2rem;">
+                    {get_svg('user_plus', 20, 20, '#00E5FF')} <b>INJECT NEW NODE</b></div>""", unsafe_allow_html=True)
+    with st.form("add_user_form", clear_on_submit=True):
+        new_name = st.text_input("NODE IDENTIFIER (Name)")
+        new_email = st.text_input("COMM LINK (Email)")
+        new_password = st.text_input("KEY (Password)", type="password")
+        new_role_ui = st.selectbox("PERMISSION LEVEL", ["User", "Admin"])
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.form_submit_button(">> EXECUTE INJECTION"):
+            if new_name and new_email and new_password:
+                # REAL DB LOGIC
+                if USE_REAL_DB:
+                    db_role = "admin" if new_role_ui == "Admin" else "user"
+                    success = db_handler.create_user(new_name, new_email, new_password, db_role, 1)
+                    if success:
+                        get_users_page_hybrid.clear()
+                        st.success(f"NODE INJECTED INTO DATABASE: {new_name}")
+                    else:
+                        st.error("INJECTION FAILED (Check DB logs or duplicates)")
+                # MOCK LOGIC
+                else:
+                    prefix = "ADM" if new_role_ui == "Admin" else "USR"
+                    new_id = f"{prefix}-{len(st.session_state['user_db']) + 101}"
+                    st.session_state['user_db'].append({"ID": new_id, "Name": new_name, "Email": new_email, "Role": new_role_ui, "Joined": datetime.now().strftime("%Y-%m-%d")})
+                    st.success(f"SIMULATION NODE CREATED: {new_name}")
+            else: st.warning("ALL FIELDS REQUIRED")
+
+@st.fragment
+def render_purge_user():
+    st.markdown(f"""<div style="display:flex; align-items:center; gap:8px; color:#FF0055; margin-bottom:15px; font-family:'Rajdhani'; font-size:1.2rem;">
+                    {get_svg('user_minus', 20, 20, '#FF0055')} <b>PURGE NODE</b></div>""", unsafe_allow_html=True)
+    
+    target_group = st.radio("TARGET CLUSTER:", ["Users", "Admins"], horizontal=True)
+    target_search = st.text_input("FILTER (Name / Email prefix)", key="purge_search")
+    target_roles = db_handler.ADMIN_ROLES if target_group == "Admins" else ('user',)
+    filtered_list, _ = get_users_page_hybrid(roles=target_roles, search=target_search.strip(), page_size=100)
+    # Filter Super Admin from deletion list visually
+    targets = [u for u in filtered_list if u['Name'] != "Chetana Garud"]
+    
+    target_node = None
+    if not targets: st.info("CLUSTER EMPTY")
+    else: target_node = st.selectbox(f"SELECT TARGET", targets, format_func=lambda u: f"{u['Name']} <{u['Email']}>")
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    if st.button(">> INITIALIZE PURGE") and target_node:
+        target_user = target_node['Name']
+        # SUPER ADMIN PROTECTION
+        if target_user == "Chetana Garud":
+            st.error("⛔ ACCESS DENIED: CANNOT PURGE SUPER ADMIN")
+        else:
+            # REAL DB LOGIC
+            if USE_REAL_DB:
+                if db_handler.delete_user(int(target_node['ID'].split('-', 1)[1])):
+                    get_users_page_hybrid.clear()
+                    st.session_state.purge_notice = f"NODE PURGED FROM DB: '{target_user}'"
+                    st.rerun(scope="fragment")
+                else:
+                    st.warning("PURGE FAILED (DB Error or Restricted)")
+            # MOCK LOGIC
+            else:
+                st.session_state['user_db'] = [u for u in st.session_state['user_db'] if u['ID'] != target_node['ID']]
+                st.session_state.purge_notice = f"SIMULATION NODE PURGED: '{target_user}'"
+                st.rerun(scope="fragment")
+    if 'purge_notice' in st.session_state:
+        st.error(st.session_state.pop('purge_notice'))
+
+@st.fragment
+def render_bulk_tools():
+    with st.expander(">> BULK INJECTION (CSV)"):
+        st.caption("Columns: username, email, password, role (user/admin). Imported nodes are pre-verified.")
+        csv_file = st.file_uploader("NODE MANIFEST", type=["csv"], key="bulk_csv")
+        if csv_file and st.button(">> EXECUTE BULK INJECTION"):
+            rows = list(csv.DictReader(io.TextIOWrapper(csv_file, encoding="utf-8-sig")))
+            bar = st.progress(0.0, text="INJECTING...")
+            report = db_handler.bulk_create_users(
+                rows, progress=lambda done, total: bar.progress(done / total, text=f"INJECTED {done}/{total}")
+            )
+            bar.empty()
+            created = sum(1 for r in report if r['status'] == 'created')
+            st.success(f"{created} NODES INJECTED · {len(report) - created} REJECTED")
+            problems = [r for r in report if r['status'] != 'created']
+            if problems: st.dataframe(pd.DataFrame(problems), width=1000)
+            get_users_page_hybrid.clear()
+
+    with st.expander(">> EXPORT NODES (CSV)"):
+        if st.button(">> PREPARE EXPORT"):
+            # Writing pages through the table by keyset, holding one page at a time. The download
+            # itself is not streamed: st.download_button needs the whole file, which Streamlit then
+            # keeps in memory until the next rerun. The temporary file (partial or not) is deleted
+            # when the block exits.
+            with tempfile.TemporaryFile(mode="w+", newline="", encoding="utf-8") as export_file:
+                try:
+                    count = db_handler.export_users_csv(export_file)
+                except Exception as e:
+                    st.error(f"EXPORT FAILED · NO FILE PRODUCED: {e}")
+                    return
+                export_file.seek(0)
+                st.download_button(f"DOWNLOAD {count} NODES", export_file.read(), file_name="bcasprint_users.csv", mime="text/csv")
+
+@st.fragment
+def render_user_browser():
+    # A toggle rather than an expander: expander bodies run (and fetch) even while collapsed
+    if not st.toggle("DECRYPT FULL DATABASE", key="show_user_browser"):
+        return
+    # Keyset paging: the stack holds the cursor that opened each visited page
+    if 'user_page_stack' not in st.session_state: st.session_state.user_page_stack = [None]
+    page_users, next_cursor = get_users_page_hybrid(after_id=st.session_state.user_page_stack[-1])
+    st.dataframe(pd.DataFrame(page_users), width=1000)
+    c_prev, c_page, c_next = st.columns([1, 2, 1])
+    if c_prev.button("<< PREV", disabled=len(st.session_state.user_page_stack) == 1):
+        st.session_state.user_page_stack.pop()
+        st.rerun(scope="fragment")
+    c_page.caption(f"PAGE {len(st.session_state.user_page_stack)}")
+    if c_next.button("NEXT >>", disabled=next_cursor is None):
+        st.session_state.user_page_stack.append(next_cursor)
+        st.rerun(scope="fragment")
 
 # ==========================================
-# 4. MAIN PAGE LOGIC
+# 5. MAIN PAGE LOGIC
 # ==========================================
 def show_admin_page():
     local_css()
-    setup_dark_plots() 
 
-    # --- HYBRID DATA LOADING ---
-    user_db = get_users_hybrid()
-    kpi = get_kpi_data_hybrid()
-    
     # --- HEADER ---
     c_head, c_role = st.columns([3, 1])
     with c_head: render_header("dashboard", "SYSTEM DASHBOARD")
@@ -247,7 +809,13 @@ def show_admin_page():
         st.markdown(f'<span style="color:#00E5FF; font-family:Rajdhani; font-size:1.2rem; font-weight:bold;">{role_label}</span>', unsafe_allow_html=True)
         
         if USE_REAL_DB:
-            st.markdown('<span style="color:#39FF14; font-size:12px;">● LIVE DB CONNECTED</span>', unsafe_allow_html=True)
+            db_state = db_health.state()
+            if db_state == db_health.DOWN:
+                st.markdown('<span style="color:#FF0055; font-size:12px;">● DB DOWN · SERVING LAST-KNOWN DATA</span>', unsafe_allow_html=True)
+            elif db_state == db_health.SLOW:
+                st.markdown('<span style="color:#FFEA00; font-size:12px;">● DB DEGRADED · WRITES QUEUED</span>', unsafe_allow_html=True)
+            else:
+                st.markdown('<span style="color:#39FF14; font-size:12px;">● LIVE DB CONNECTED</span>', unsafe_allow_html=True)
         else:
             st.markdown('<span style="color:#FFEA00; font-size:12px;">● RUNNING IN SIMULATION MODE</span>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -259,67 +827,32 @@ def show_admin_page():
     st.markdown("<br>", unsafe_allow_html=True)
 
     # --- METRICS HUD ---
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("ACTIVE UNITS", kpi['total_users'], "SYNCED")
-    c2.metric("CONTROLLERS", kpi['total_admins'], "SECURE")
-    c3.metric("AI QUERIES", kpi['predictions_24h'], "HIGH LOAD")
-    c4.metric("PENDING FB", kpi['pending_feedback'], "WAITING") 
+    render_metrics_hud()
 
     st.markdown("<br><br>", unsafe_allow_html=True)
 
-    # --- VISUALIZATION (Uses Simulated Data for complex charts to keep UI intact) ---
-    col_a, col_b = st.columns([2, 1])
-    with col_a:
-        st.markdown("### 📈 NETWORK TRAFFIC")
-        growth_data = get_user_growth_data()
-        fig1, ax1 = plt.subplots(figsize=(10, 5))
-        sns.lineplot(data=growth_data, x="Date", y="New Users", color="#00E5FF", linewidth=2, ax=ax1)
-        ax1.fill_between(growth_data["Date"], growth_data["New Users"], color="#00E5FF", alpha=0.05)
-        sns.scatterplot(data=growth_data[::4], x="Date", y="New Users", color="#fff", s=30, ax=ax1, edgecolor="#00E5FF", linewidth=2)
-        ax1.spines['top'].set_visible(False); ax1.spines['right'].set_visible(False); ax1.spines['left'].set_visible(False)
-        ax1.grid(True, linestyle='--', alpha=0.2, color="#00E5FF")
-        plt.xticks(rotation=45)
-        st.pyplot(fig1)
+    render_charts()
 
-    with col_b:
-        st.markdown("### 🧩 ROLE DISTRIBUTION")
-        role_data = get_predictions_by_role_data()
-        fig2, ax2 = plt.subplots(figsize=(6, 6))
-        colors = ["#00E5FF", "#FF00E6", "#39FF14", "#FFEA00", "#7C4DFF"]
-        ax2.pie(role_data["Count"], labels=role_data["Role"], colors=colors, autopct='%1.1f%%', pctdistance=0.85, startangle=140, textprops={'color': "#fff", 'fontsize': 10, 'fontfamily': 'monospace'}, wedgeprops={'edgecolor': '#090510', 'linewidth': 3})
-        fig2.gca().add_artist(plt.Circle((0,0), 0.70, fc='#090510', ec='#2D2D45', linewidth=1))
-        st.pyplot(fig2)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # --- ROW 2 ---
-    col_c, col_d = st.columns(2)
-    with col_c:
-        st.markdown("### 🧬 USER DENSITY")
-        st.caption("Login Frequency Heatmap")
-        login_stats_mock = get_user_login_stats()
-        fig3, ax3 = plt.subplots(figsize=(10, 6))
-        sns.violinplot(x="Role", y="Total Logins", hue="Role", legend=False, data=login_stats_mock, palette="plasma", inner="quart", ax=ax3, linewidth=1)
-        ax3.spines['top'].set_visible(False); ax3.spines['right'].set_visible(False); ax3.spines['left'].set_visible(False)
-        st.pyplot(fig3)
+    # --- MODEL ACCURACY ---
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    render_model_accuracy()
 
-    with col_d:
-        st.markdown("### ⚡ MODULE LOAD")
-        st.caption("System Resource Allocation")
-        module_data = get_module_usage_data()
-        fig4, ax4 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x="Active Users", y="Module", data=module_data, color="#39FF14", ax=ax4, edgecolor=None, alpha=0.8)
-        for container in ax4.containers: ax4.bar_label(container, color='#fff', padding=5, fontsize=10, fontfamily='monospace')
-        ax4.spines['top'].set_visible(False); ax4.spines['right'].set_visible(False); ax4.spines['left'].set_visible(False); ax4.spines['bottom'].set_visible(False)
-        ax4.set_xticks([]) 
-        st.pyplot(fig4)
+    # --- COHORTS ---
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    render_cohorts()
 
     # --- LOGS ---
     st.markdown("<br><br>", unsafe_allow_html=True)
-    st.markdown("### 💾 SYSTEM LOGS")
-    t1, t2 = st.tabs(["ACCESS LOGS", "TRANSMISSIONS"])
-    with t1: st.dataframe(get_logs_hybrid(), width=1000)
-    with t2: st.dataframe(get_hiring_notifications(), width=1000)
+    render_system_logs()
+    if USE_REAL_DB: render_data_export()
+
+    # --- DATABASE HEALTH / PERFORMANCE ---
+    if USE_REAL_DB:
+        st.markdown("<br>", unsafe_allow_html=True)
+        render_db_health()
+    if DB_AVAILABLE:
+        st.markdown("<br>", unsafe_allow_html=True)
+        render_db_performance()
 
     # --- SUPER ADMIN ZONE ---
     # Only show if role is strictly super_admin
@@ -332,73 +865,16 @@ def show_admin_page():
             c_add, c_remove = st.columns(2)
             
             # --- ADD USER ---
-            with c_add:
-                st.markdown(f"""<div style="display:flex; align-items:center; gap:8px; color:#00E5FF; margin-bottom:15px; font-family:'Rajdhani'; font-size:1.2rem;">
-                                {get_svg('user_plus', 20, 20, '#00E5FF')} <b>INJECT NEW NODE</b></div>""", unsafe_allow_html=True)
-                with st.form("add_user_form", clear_on_submit=True):
-                    new_name = st.text_input("NODE IDENTIFIER (Name)")
-                    new_email = st.text_input("COMM LINK (Email)")
-                    new_password = st.text_input("KEY (Password)", type="password")
-                    new_role_ui = st.selectbox("PERMISSION LEVEL", ["User", "Admin"])
-                    st.markdown("<br>", unsafe_allow_html=True)
-                    if st.form_submit_button(">> EXECUTE INJECTION"):
-                        if new_name and new_email and new_password:
-                            # REAL DB LOGIC
-                            if USE_REAL_DB:
-                                db_role = "admin" if new_role_ui == "Admin" else "user"
-                                success = db_handler.create_user(new_name, new_email, new_password, db_role, 1)
-                                if success:
-                                    st.success(f"NODE INJECTED INTO DATABASE: {new_name}")
-                                    st.rerun()
-                                else:
-                                    st.error("INJECTION FAILED (Check DB logs or duplicates)")
-                            # MOCK LOGIC
-                            else:
-                                prefix = "ADM" if new_role_ui == "Admin" else "USR"
-                                new_id = f"{prefix}-{len(st.session_state['user_db']) + 101}"
-                                st.session_state['user_db'].append({"ID": new_id, "Name": new_name, "Email": new_email, "Role": new_role_ui, "Joined": datetime.now().strftime("%Y-%m-%d")})
-                                st.success(f"SIMULATION NODE CREATED: {new_name}")
-                                st.rerun()
-                        else: st.warning("ALL FIELDS REQUIRED")
+            with c_add: render_add_user()
 
             # --- DELETE USER ---
-            with c_remove:
-                st.markdown(f"""<div style="display:flex; align-items:center; gap:8px; color:#FF0055; margin-bottom:15px; font-family:'Rajdhani'; font-size:1.2rem;">
-                                {get_svg('user_minus', 20, 20, '#FF0055')} <b>PURGE NODE</b></div>""", unsafe_allow_html=True)
-                
-                # Filter Super Admin from deletion list visually
-                safe_users = [u for u in user_db if u['Name'] != "Chetana Garud"]
-                
-                target_group = st.radio("TARGET CLUSTER:", ["Users", "Admins"], horizontal=True)
-                filtered_list = [u for u in safe_users if u.get('Role') == ('User' if target_group == "Users" else 'Admin')]
-                user_names = [u['Name'] for u in filtered_list]
-                
-                if not user_names: st.info("CLUSTER EMPTY")
-                else: target_user = st.selectbox(f"SELECT TARGET", user_names)
-                
-                st.markdown("<br>", unsafe_allow_html=True)
-                if st.button(">> INITIALIZE PURGE"):
-                    if 'target_user' in locals() and target_user:
-                        # SUPER ADMIN PROTECTION
-                        if target_user == "Chetana Garud":
-                            st.error("⛔ ACCESS DENIED: CANNOT PURGE SUPER ADMIN")
-                        else:
-                            # REAL DB LOGIC
-                            if USE_REAL_DB:
-                                if db_handler.delete_user(target_user):
-                                    st.error(f"NODE PURGED FROM DB: '{target_user}'")
-                                    st.rerun()
-                                else:
-                                    st.warning("PURGE FAILED (DB Error or Restricted)")
-                            # MOCK LOGIC
-                            else:
-                                st.session_state['user_db'] = [u for u in st.session_state['user_db'] if u['Name'] != target_user]
-                                st.error(f"SIMULATION NODE PURGED: '{target_user}'")
-                                st.rerun()
+            with c_remove: render_purge_user()
+
+            # --- BULK IMPORT / EXPORT ---
+            if USE_REAL_DB: render_bulk_tools()
 
             st.markdown('</div>', unsafe_allow_html=True)
-            with st.expander(">> DECRYPT FULL DATABASE"):
-                 st.dataframe(pd.DataFrame(user_db), width=1000)
+            render_user_browser()
 
     elif current_role == "admin":
         st.markdown("<br>", unsafe_allow_html=True)
@@ -409,4 +885,4 @@ def show_admin_page():
         """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    show_admin_page()
\ No newline at end of file
+    show_admin_page()
@@ -0,0 +1,273 @@
+"""Pre-aggregated analytics for the Admin dashboard.
+
+Raw tables (users, predictions, activity_logs, feedback) are folded into small rollup tables (created in db_handler.create_table) by id
+watermark, so each refresh only reads rows added since the last one and the Admin page reads
+a few hundred pre-aggregated rows instead of scanning users / predictions / activity_logs.
+
+The app refreshes in a background thread; cron can do it instead:  python analytics.py
+"""
+import threading
+from datetime import date, timedelta
+
+import pandas as pd
+import streamlit as st
+from mysql.connector import Error
+
+import db_handler
+
+ROLLUP_INTERVAL = 300  # seconds between background refreshes
+ROLLUP_CHUNK = 50000   # source ids folded per transaction
+LOGIN_SAMPLE = 2000    # users plotted in the login-distribution chart
+COHORT_WEEKS = 12      # weekly signup cohorts shown in the retention / funnel views
+
+# activity_logs.action -> Admin "module" bucket
+MODULE_ACTIONS = {
+    "Prediction Generated": "AI Predictor",
+    "Job Click": "Job Board",
+    "Login": "Sign-in",
+    "Account Created": "Sign-up",
+    "Account Verified": "Sign-up",
+    "Password Reset": "Profile",
+    "Page View": "Job Board",
+}
+ROLE_LABELS = {"user": "Student", "admin": "Admin", "super_admin": "Admin"}
+
+# ==========================================
+# 1. ROLLUP DEFINITIONS
+# ==========================================
+# Each source table feeds one or more upserts over the id range (%s, %s]. Counts are additive,
+# so a chunk adds its GROUP BY totals onto whatever the rollup already holds.
+ROLLUPS = {
+    "users": [
+        "INSERT INTO analytics_daily (metric, bucket_date, dim, value) "
+        "SELECT 'signups', DATE(created_at), '', COUNT(*) FROM users WHERE id > %s AND id <= %s "
+        "GROUP BY DATE(created_at) ON DUPLICATE KEY UPDATE value = value + VALUES(value)",
+    ],
+    "predictions": [
+        "INSERT INTO analytics_daily (metric, bucket_date, dim, value) "
+        "SELECT 'predictions', DATE(created_at), COALESCE(role_predicted, ''), COUNT(*) FROM predictions "
+        "WHERE id > %s AND id <= %s GROUP BY DATE(created_at), COALESCE(role_predicted, '') "
+        "ON DUPLICATE KEY UPDATE value = value + VALUES(value)",
+    ],
+    "activity_logs": [
+        "INSERT INTO analytics_daily (metric, bucket_date, dim, value) "
+        "SELECT 'actions', DATE(timestamp), COALESCE(action, ''), COUNT(*) FROM activity_logs "
+        "WHERE id > %s AND id <= %s GROUP BY DATE(timestamp), COALESCE(action, '') "
+        "ON DUPLICATE KEY UPDATE value = value + VALUES(value)",
+        "INSERT INTO analytics_user_logins (user_id, logins) "
+        "SELECT user_id, COUNT(*) FROM activity_logs WHERE id > %s AND id <= %s "
+        "AND action = 'Login' AND user_id IS NOT NULL GROUP BY user_id "
+        "ON DUPLICATE KEY UPDATE logins = logins + VALUES(logins)",
+    ],
+    # Error sums per day / role / district; error = predicted - actual, so positive bias means we
+    # over-predict. Rows still missing numeric values are skipped, so run
+    # `python migrations.py numeric` before the first refresh on an old database.
+    "feedback": [
+        "INSERT INTO analytics_accuracy (bucket_date, job_role, district, n, n_pct, sum_abs_err, sum_abs_pct_err, sum_err) "
+        "SELECT DATE(f.created_at), COALESCE(f.job_role, ''), COALESCE(p.district, ''), COUNT(*), SUM(f.actual_offer > 0), "
+        "SUM(ABS(f.predicted_center - f.actual_offer)), "
+        "SUM(IF(f.actual_offer > 0, ABS(f.predicted_center - f.actual_offer) / f.actual_offer, 0)), "
+        "SUM(f.predicted_center - f.actual_offer) "
+        "FROM feedback f LEFT JOIN predictions p ON p.id = f.prediction_id "
+        "WHERE f.id > %s AND f.id <= %s AND f.predicted_center IS NOT NULL AND f.actual_offer IS NOT NULL "
+        "GROUP BY DATE(f.created_at), COALESCE(f.job_role, ''), COALESCE(p.district, '') "
+        "ON DUPLICATE KEY UPDATE n = n + VALUES(n), n_pct = n_pct + VALUES(n_pct), "
+        "sum_abs_err = sum_abs_err + VALUES(sum_abs_err), sum_abs_pct_err = sum_abs_pct_err + VALUES(sum_abs_pct_err), "
+        "sum_err = sum_err + VALUES(sum_err)",
+    ],
+    # Per-user funnel milestones and active weeks for the cohort views. They were added after the
+    # rollups above, so they keep their own watermarks ("name:table") and fold from id 0.
+    # Milestones keep the earliest time seen; verified_at falls back to signup for accounts created
+    # pre-verified (admin / bulk import), which never log "Account Verified".
+    "cohorts:users": [
+        "INSERT INTO analytics_user_funnel (user_id, cohort_week, verified_at) "
+        "SELECT id, DATE(created_at) - INTERVAL WEEKDAY(created_at) DAY, IF(is_verified = 1, created_at, NULL) "
+        "FROM users WHERE id > %s AND id <= %s "
+        "ON DUPLICATE KEY UPDATE cohort_week = VALUES(cohort_week), "
+        "verified_at = LEAST(COALESCE(verified_at, VALUES(verified_at)), COALESCE(VALUES(verified_at), verified_at))",
+    ],
+    "cohorts:activity_logs": [
+        "INSERT INTO analytics_user_funnel (user_id, verified_at, first_prediction_at, first_hiring_at, first_job_click_at) "
+        "SELECT user_id, MIN(IF(action = 'Account Verified', timestamp, NULL)), "
+        "MIN(IF(action = 'Prediction Generated', timestamp, NULL)), "
+        "MIN(IF(action = 'Page View' AND details = 'Hiring', timestamp, NULL)), "
+        "MIN(IF(action = 'Job Click', timestamp, NULL)) "
+        "FROM activity_logs WHERE id > %s AND id <= %s AND user_id IS NOT NULL "
+        "AND action IN ('Account Verified', 'Prediction Generated', 'Page View', 'Job Click') GROUP BY user_id "
+        "ON DUPLICATE KEY UPDATE "
+        + ", ".join(
+            f"{c} = LEAST(COALESCE({c}, VALUES({c})), COALESCE(VALUES({c}), {c}))"
+            for c in ("verified_at", "first_prediction_at", "first_hiring_at", "first_job_click_at")
+        ),
+        "INSERT IGNORE INTO analytics_user_weeks (user_id, activity_week) "
+        "SELECT DISTINCT user_id, DATE(timestamp) - INTERVAL WEEKDAY(timestamp) DAY FROM activity_logs "
+        "WHERE id > %s AND id <= %s AND user_id IS NOT NULL",
+    ],
+}
+
+# ==========================================
+# 2. INCREMENTAL REFRESH
+# ==========================================
+def _refresh_source(source, statements):
+    """Folds rows of one source table ("table" or "name:table") into the rollups, one locked chunk at a time.
+
+    Each run only goes up to the highest id seen by the *previous* run (`pending_id`). Any
+    transaction that was still open then has committed by now, so a late commit with a lower
+    id can't slip under the watermark. Fresh rows therefore show up one interval later.
+    """
+    table = source.split(":")[-1]
+    folded = 0
+    while True:
+        with db_handler.transaction() as cursor:
+            cursor.execute("INSERT IGNORE INTO analytics_watermarks (source, last_id, pending_id) VALUES (%s, 0, 0)", (source,))
+            # Row lock: concurrent refreshers (several app processes, cron) take turns instead of double counting
+            cursor.execute("SELECT last_id, pending_id FROM analytics_watermarks WHERE source = %s FOR UPDATE", (source,))
+            last_id, pending_id = cursor.fetchone()
+            if last_id >= pending_id:
+                cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+                newest = cursor.fetchone()[0]
+                cursor.execute("UPDATE analytics_watermarks SET pending_id = %s WHERE source = %s", (newest, source))
+                return folded
+            upper = min(pending_id, last_id + ROLLUP_CHUNK)
+            for sql in statements:
+                cursor.execute(sql, (last_id, upper))
+            cursor.execute("UPDATE analytics_watermarks SET last_id = %s WHERE source = %s", (upper, source))
+        folded += upper - last_id
+
+def refresh_rollups():
+    """Brings every rollup up to date. Returns {source: ids folded}."""
+    return {source: _refresh_source(source, statements) for source, statements in ROLLUPS.items()}
+
+@st.cache_resource
+def start_refresher(interval=ROLLUP_INTERVAL):
+    """Starts one daemon thread per server process that refreshes the rollups every `interval` seconds."""
+    stop = threading.Event()
+
+    def run():
+        while True:
+            try:
+                with db_handler.background_work():
+                    refresh_rollups()
+            except Error as e:
+                print(f"Analytics Refresh Error: {e}")
+            if stop.wait(interval):
+                return
+
+    threading.Thread(target=run, name="analytics-rollup", daemon=True).start()
+    return stop
+
+# ==========================================
+# 3. DASHBOARD READS
+# ==========================================
+def _daily(metric, days):
+    with db_handler.transaction(readonly=True) as cursor:
+        cursor.execute(
+            "SELECT bucket_date, dim, value FROM analytics_daily "
+            "WHERE metric = %s AND bucket_date >= CURDATE() - INTERVAL %s DAY", (metric, days)
+        )
+        return pd.DataFrame(cursor.fetchall(), columns=["Date", "dim", "value"])
+
+def user_growth(days=30):
+    """New signups per day over the last `days` days, zero-filled."""
+    rows = _daily("signups", days)
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=days + 1)
+    daily = rows.assign(Date=pd.to_datetime(rows["Date"])).groupby("Date")["value"].sum()
+    daily = daily.reindex(dates, fill_value=0)
+    return pd.DataFrame({"Date": dates, "New Users": daily.to_numpy(dtype="int64")})
+
+def predictions_by_role(days=30, top=5):
+    """Prediction counts for the `top` roles in the window; the rest are summed as Other."""
+    rows = _daily("predictions", days)
+    counts = rows.groupby("dim")["value"].sum().sort_values(ascending=False)
+    head = counts.head(top)
+    frame = pd.DataFrame({"Role": head.index, "Count": head.to_numpy(dtype="int64")})
+    if len(counts) > top:
+        frame.loc[len(frame)] = ["Other", int(counts.iloc[top:].sum())]
+    return frame
+
+def module_usage(days=30):
+    """activity_logs events per Admin module over the window."""
+    rows = _daily("actions", days)
+    rows["Module"] = rows["dim"].map(MODULE_ACTIONS).fillna("Other")
+    usage = rows.groupby("Module")["value"].sum().sort_values(ascending=False)
+    return pd.DataFrame({"Module": usage.index, "Events": usage.to_numpy(dtype="int64")})
+
+def login_distribution(sample=LOGIN_SAMPLE):
+    """Lifetime login counts of the most recent `sample` users who have logged in, with their role."""
+    with db_handler.transaction(readonly=True) as cursor:
+        cursor.execute(
+            "SELECT u.role, l.logins FROM analytics_user_logins l JOIN users u ON u.id = l.user_id "
+            "ORDER BY l.user_id DESC LIMIT %s", (sample,)
+        )
+        rows = cursor.fetchall()
+    return pd.DataFrame(
+        [(ROLE_LABELS.get(role, "Student"), logins) for role, logins in rows], columns=["Role", "Total Logins"]
+    )
+
+ACCURACY_GROUPS = {"job_role": "job_role", "district": "district", "day": "bucket_date"}
+
+def prediction_accuracy(days=None, by=None):
+    """MAE, MAPE and bias of the salary model against reported offers, from the accuracy rollup.
+
+    `days` limits the window (None = all time); `by` is "job_role", "district", "day" or None
+    for a single overall row.
+    """
+    group = ACCURACY_GROUPS[by] if by else "'All'"
+    where, params = "", ()
+    if days:
+        where, params = "WHERE bucket_date >= CURDATE() - INTERVAL %s DAY", (days,)
+    with db_handler.transaction(readonly=True) as cursor:
+        cursor.execute(
+            f"SELECT {group}, SUM(n), SUM(sum_abs_err) / SUM(n), SUM(sum_abs_pct_err) / NULLIF(SUM(n_pct), 0) * 100, "
+            f"SUM(sum_err) / SUM(n) FROM analytics_accuracy {where} GROUP BY {group} ORDER BY {'1' if by == 'day' else '2 DESC'}",
+            params
+        )
+        rows = cursor.fetchall()
+    frame = pd.DataFrame(rows, columns=["Group", "Feedback", "MAE", "MAPE %", "Bias"])
+    for column in ("MAE", "MAPE %", "Bias"):
+        frame[column] = pd.to_numeric(frame[column]).astype(float).round(1)
+    frame["Feedback"] = pd.to_numeric(frame["Feedback"]).astype("int64")
+    return frame
+
+FUNNEL_STEPS = ["Signed Up", "Verified", "Predicted", "Opened Hiring", "Clicked Job"]
+
+def _first_cohort(weeks):
+    today = date.today()
+    return today - timedelta(days=today.weekday(), weeks=weeks - 1)
+
+def cohort_retention(weeks=COHORT_WEEKS):
+    """Weekly signup cohorts x weeks since signup: how many of each cohort were active that week.
+    Long format (Cohort, Week, Users, Active, Retention %); week 0 is the signup week."""
+    with db_handler.transaction(readonly=True) as cursor:
+        cursor.execute(
+            "WITH cohort AS ("
+            " SELECT user_id, cohort_week, COUNT(*) OVER (PARTITION BY cohort_week) AS size"
+            " FROM analytics_user_funnel WHERE cohort_week >= %s) "
+            "SELECT c.cohort_week, TIMESTAMPDIFF(WEEK, c.cohort_week, w.activity_week) AS week_n, MAX(c.size), COUNT(*) "
+            "FROM cohort c JOIN analytics_user_weeks w ON w.user_id = c.user_id AND w.activity_week >= c.cohort_week "
+            "GROUP BY c.cohort_week, week_n ORDER BY 1, 2", (_first_cohort(weeks),)
+        )
+        rows = cursor.fetchall()
+    frame = pd.DataFrame(rows, columns=["Cohort", "Week", "Users", "Active"])
+    frame = frame.astype({"Week": "int64", "Users": "int64", "Active": "int64"})
+    frame["Retention %"] = (100 * frame["Active"] / frame["Users"]).round(1)
+    return frame
+
+def signup_funnel(weeks=COHORT_WEEKS):
+    """Users per weekly cohort who reached each FUNNEL_STEPS milestone (in any order)."""
+    with db_handler.transaction(readonly=True) as cursor:
+        cursor.execute(
+            "SELECT cohort_week, COUNT(*), COUNT(verified_at), COUNT(first_prediction_at), COUNT(first_hiring_at), "
+            "COUNT(first_job_click_at) FROM analytics_user_funnel WHERE cohort_week >= %s "
+            "GROUP BY cohort_week ORDER BY cohort_week", (_first_cohort(weeks),)
+        )
+        rows = cursor.fetchall()
+    return pd.DataFrame(rows, columns=["Cohort"] + FUNNEL_STEPS).astype({step: "int64" for step in FUNNEL_STEPS})
+
+if __name__ == "__main__":
+    db_handler.create_table()
+    try:
+        for source, count in refresh_rollups().items():
+            print(f"{source}: {count} ids folded")
+    except Error as e:
+        print(f"Analytics Refresh Error: {e}")
@@ -9,6 +9,7 @@ st.set_page_config(
 
 # --- IMPORT MODULES ---
 import db_handler
+import db_health
 # Import all pages
 import preview
 import home_page
@@ -32,6 +33,11 @@ if 'db_init' not in st.session_state:
     except Exception as e:
         st.error(f"Database Connection Failed: {e}")
 
+# Background health prober (one per server process): drives degraded mode when the DB is slow or down.
+# Without [mysql] secrets there is nothing to probe.
+if db_handler.is_configured():
+    db_health.start_monitor()
+
 # Initialize Session State Variables
 if 'logged_in' not in st.session_state: 
     st.session_state.logged_in = False
@@ -52,6 +58,11 @@ if 'forgot_stage' not in st.session_state: st.session_state.forgot_stage = "requ
 if 'reset_email' not in st.session_state: st.session_state.reset_email = ""
 if 'show_success' not in st.session_state: st.session_state.show_success = False
 
+# Sessions signed in before user ids were kept in user_info: look the id up once by email
+if st.session_state.logged_in and 'id' not in st.session_state.user_info and st.session_state.user_info.get('email'):
+    known_user = db_handler.get_user_by_email(st.session_state.user_info['email'])
+    if known_user: st.session_state.user_info['id'] = known_user['id']
+
 # ==========================================
 # 2. ROUTING ENGINE
 # ==========================================
@@ -61,7 +72,10 @@ if "action" in st.query_params and st.query_params["action"] == "log_application
     user = st.query_params.get("user")
     role = st.query_params.get("role")
     status = st.query_params.get("status")
-    db_handler.log_job_application(user, role, "External", status)
+    # Link the click to the account when the signed-in user is the one it was mailed to
+    session_user = st.session_state.user_info
+    user_id = session_user.get('id') if st.session_state.logged_in and session_user.get('username') == user else None
+    db_handler.log_job_application(user, role, "External", status, user_id)
     st.toast(f"✅ Status updated: {status} for {role}")
     st.query_params.clear()
 
@@ -85,6 +99,11 @@ else:
     elif page == "Salary":
         salary_module.show_salary_predictor_page()
     elif page == "Hiring":
+        # First visit per session feeds the "Opened Hiring" step of the Admin signup funnel
+        if 'hiring_view_logged' not in st.session_state:
+            st.session_state.hiring_view_logged = True
+            info = st.session_state.user_info
+            db_handler.log_activity(info.get('username'), "Page View", "Hiring", user_id=info.get('id'))
         hiring_module.show_hiring_aptitude_page()
     elif page == "Study":
         study_module.study_materials()
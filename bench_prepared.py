@@ -0,0 +1,51 @@
+"""Micro-benchmark: plain text queries vs cached server-side prepared statements.
+
+Usage (needs .streamlit/secrets.toml with the [mysql] section):
+    python bench_prepared.py --iterations 2000 --rps 50
+
+Times are wall-clock round trips (time.perf_counter), so the savings include the server's parse
+work and the network, not just this process's CPU.
+"""
+import argparse
+import time
+
+import db_handler
+
+def _time_plain(name, params, iterations):
+    sql = db_handler.HOT_STATEMENTS[name]
+    with db_handler.transaction(readonly=True) as cursor:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            cursor.execute(sql, params)
+            cursor.fetchall()
+        return time.perf_counter() - start
+
+def _time_prepared(name, params, iterations):
+    with db_handler.transaction(readonly=True):
+        db_handler.execute_hot(name, params)  # prepare outside the timed loop, as in steady state
+        start = time.perf_counter()
+        for _ in range(iterations):
+            db_handler.execute_hot(name, params)
+        return time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--rps", type=float, default=50, help="expected hot queries per second in production")
+    parser.add_argument("--email", default="chetanagarud2@gmail.com")
+    parser.add_argument("--user-id", type=int, default=1)
+    args = parser.parse_args()
+
+    cases = [
+        ("user_by_email", (args.email,)),
+        ("user_auth_by_email", (args.email,)),
+        ("user_history", (args.user_id,)),
+        ("dashboard_kpis", ("2000-01-01 00:00:00",)),
+    ]
+    print(f"{'statement':<20} {'plain µs':>10} {'prepared µs':>12} {'saved µs':>9} {'wall-s/day saved':>17}")
+    for name, params in cases:
+        plain = _time_plain(name, params, args.iterations) / args.iterations * 1e6
+        prepared = _time_prepared(name, params, args.iterations) / args.iterations * 1e6
+        saved = plain - prepared
+        per_day = saved / 1e6 * args.rps * 86400
+        print(f"{name:<20} {plain:>10.1f} {prepared:>12.1f} {saved:>9.1f} {per_day:>17.1f}")
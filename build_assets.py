@@ -0,0 +1,92 @@
+"""Builds the content-hashed logo files served from static/ (Streamlit static file serving).
+
+Source images live in assets/logos/<group>/<Name>.<ext>, one folder per page ("hiring", "study").
+Each build copies them to static/logos/<name>.<sha256[:12]>.<ext> and writes
+static/logos/manifest.json ({"<group>/<Name>": file}), which static_assets.py reads at runtime.
+A changed image gets a new file name, so browsers can cache every file indefinitely.
+
+Usage:  python build_assets.py              # rebuild static/logos from assets/logos
+        python build_assets.py --extract    # also move inline base64 logos out of the page modules first
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(ROOT, "assets", "logos")
+OUTPUT_DIR = os.path.join(ROOT, "static", "logos")
+MANIFEST = os.path.join(OUTPUT_DIR, "manifest.json")
+EXTENSIONS = {"jpeg": "jpg", "jpg": "jpg", "png": "png", "svg+xml": "svg", "webp": "webp", "gif": "gif"}
+
+# ==========================================
+# 1. ONE-OFF EXTRACTION OF INLINE DATA URIs
+# ==========================================
+# module -> (group, pattern). Each match is a company name plus a data-URI string literal, which is
+# replaced in the source by a static_assets.logo_url() call.
+_DATA_URI = r'"data:image/([\w+]+);base64,([A-Za-z0-9+/=]+)"'
+INLINE_SOURCES = {
+    "hiring_page.py": ("hiring", re.compile(r'^(")([^"]+)(":\s*)' + _DATA_URI, re.M)),
+    "studymaterial.py": ("study", re.compile(r'^(\s*")([^"]+)(": \{\s*\n(?:\s*#[^\n]*\n)?\s*"logo":\s*)' + _DATA_URI, re.M)),
+}
+
+def extract_inline():
+    """Writes every inline logo to assets/logos/<group>/ and rewrites the module to reference it.
+    Line endings of the module are kept as they are."""
+    for module, (group, pattern) in INLINE_SOURCES.items():
+        path = os.path.join(ROOT, module)
+        with open(path, encoding="utf-8", newline="") as f:
+            source = f.read()
+        os.makedirs(os.path.join(SOURCE_DIR, group), exist_ok=True)
+
+        def replace(match):
+            name, kind, payload = match.group(2), match.group(4), match.group(5)
+            with open(os.path.join(SOURCE_DIR, group, f"{name}.{EXTENSIONS[kind]}"), "wb") as out:
+                out.write(base64.b64decode(payload))
+            return f'{match.group(1)}{name}{match.group(3)}static_assets.logo_url("{group}/{name}")'
+
+        source, count = pattern.subn(replace, source)
+        if count:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(source)
+        print(f"{module}: {count} inline logos extracted")
+
+# ==========================================
+# 2. HASHED BUILD
+# ==========================================
+def _slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+def build():
+    """Rebuilds static/logos and its manifest. Identical images share one file."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    manifest = {}
+    for group in sorted(os.listdir(SOURCE_DIR)):
+        for filename in sorted(os.listdir(os.path.join(SOURCE_DIR, group))):
+            name, ext = os.path.splitext(filename)
+            source = os.path.join(SOURCE_DIR, group, filename)
+            with open(source, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:12]
+            hashed = f"{_slug(name)}.{digest}{ext.lower()}"
+            if not os.path.exists(os.path.join(OUTPUT_DIR, hashed)):
+                shutil.copyfile(source, os.path.join(OUTPUT_DIR, hashed))
+            manifest[f"{group}/{name}"] = hashed
+    stale = set(os.listdir(OUTPUT_DIR)) - set(manifest.values()) - {os.path.basename(MANIFEST)}
+    for filename in stale:
+        os.remove(os.path.join(OUTPUT_DIR, filename))
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"{len(manifest)} logos -> {len(set(manifest.values()))} files in {OUTPUT_DIR} ({len(stale)} stale removed)")
+    return manifest
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build content-hashed static logo files")
+    parser.add_argument("--extract", action="store_true", help="move inline base64 logos out of the page modules first")
+    args = parser.parse_args()
+    if args.extract:
+        extract_inline()
+    build()
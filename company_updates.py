@@ -0,0 +1,218 @@
+"""Hiring updates for the company cards on the Hiring page.
+
+Each company has one source adapter (curated notices in code, or a JSON feed over HTTP). A refresh
+runs every source whose cached result has expired concurrently on a bounded thread pool, so it
+costs about as long as the slowest source instead of the sum of all of them. Results are cached
+per company with the source's own TTL; HTTP feeds are revalidated with If-None-Match /
+If-Modified-Since, and a failing source keeps serving its last good updates.
+
+Try it against the local fixture feeds:  python company_updates.py --fixture
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+import requests
+import streamlit as st
+
+# ==========================================
+# 1. SETTINGS (Tunable from secrets.toml)
+# ==========================================
+# [company_updates]
+# max_workers = 8        # sources fetched in parallel
+# timeout = 5            # seconds per HTTP request
+# ttl = 900              # seconds a feed result stays fresh (curated notices: static_ttl)
+# static_ttl = 3600
+# error_retry = 60       # a failed source is retried after this many seconds
+# [company_updates.feeds]  # company -> JSON feed URL; the feed is a list of {"type", "message"}
+# TCS = "https://example.com/tcs-bca.json"
+def _updates_setting(key, default):
+    try:
+        return type(default)(st.secrets.get("company_updates", {}).get(key, default))
+    except Exception:
+        return default
+
+def _configured_feeds():
+    try:
+        return dict(st.secrets.get("company_updates", {}).get("feeds", {}))
+    except Exception:
+        return {}
+
+MAX_WORKERS = _updates_setting("max_workers", 8)
+REQUEST_TIMEOUT = _updates_setting("timeout", 5.0)
+FEED_TTL = _updates_setting("ttl", 900.0)
+STATIC_TTL = _updates_setting("static_ttl", 3600.0)
+ERROR_RETRY = _updates_setting("error_retry", 60.0)
+
+# ==========================================
+# 2. SOURCE ADAPTERS
+# ==========================================
+class UpdateSource:
+    """One company's update source. fetch(validators) returns (updates, validators), with updates
+    None when the source reports nothing new since the validators were issued."""
+
+    def __init__(self, company, ttl):
+        self.company = company
+        self.ttl = ttl
+
+    def fetch(self, validators):
+        raise NotImplementedError
+
+class StaticSource(UpdateSource):
+    """Curated notices kept in code; {year} / {next_year} are filled in at fetch time."""
+
+    def __init__(self, company, notices, ttl=STATIC_TTL):
+        super().__init__(company, ttl)
+        self.notices = notices
+
+    def fetch(self, validators):
+        year = datetime.now().year
+        return [{"type": kind, "message": message.format(year=year, next_year=year + 1)}
+                for kind, message in self.notices], {}
+
+_http = threading.local()
+
+def _http_session():
+    # requests.Session is not thread-safe; keep one per worker thread (connection reuse included)
+    if not hasattr(_http, "session"):
+        _http.session = requests.Session()
+    return _http.session
+
+class JsonFeedSource(UpdateSource):
+    """A JSON list of {"type", "message"} served over HTTP, fetched with conditional requests."""
+
+    def __init__(self, company, url, ttl=FEED_TTL, timeout=REQUEST_TIMEOUT):
+        super().__init__(company, ttl)
+        self.url = url
+        self.timeout = timeout
+
+    def fetch(self, validators):
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        response = _http_session().get(self.url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return None, validators
+        response.raise_for_status()
+        updates = [{"type": str(item.get("type", "📢 Update")), "message": str(item["message"])} for item in response.json()]
+        return updates, {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+
+# STRICT BCA-RELEVANT CURATED UPDATES (used for any company without a configured feed)
+BCA_NOTICES = {
+    "TCS": [("🎓 BCA Alert", "Smart Hiring for BCA {next_year} Batch open. Registration ends soon.")],
+    "Infosys": [("🎯 Hiring", "Operations Executive (BCA/B.Sc) Drive Live for 2024/2025 graduates.")],
+    "Wipro": [("📢 WILP", "Work Integrated Learning Program 2025: Applications Open Now.")],
+    "HCL": [("⚡ TechBee", "Early Career Program for Science Grads open. Apply before deadline.")],
+    "Capgemini": [("🚀 Exceller", "BCA/B.Sc Hiring Drive scheduled for Jan. Check eligibility.")],
+    "Cognizant": [("📢 GenC", "GenC (Non-Engineering) registration closing soon. Don't miss out.")],
+}
+
+SOURCES = {}
+
+def register(source):
+    """Adds or replaces the source for source.company."""
+    SOURCES[source.company] = source
+
+for _company, _notices in BCA_NOTICES.items():
+    register(StaticSource(_company, _notices))
+for _company, _url in _configured_feeds().items():
+    register(JsonFeedSource(_company, _url))
+
+# ==========================================
+# 3. CONCURRENT REFRESH + PER-SOURCE CACHE
+# ==========================================
+# company -> {"updates", "validators", "expires" (monotonic), "fetched_at", "error"}. Entries are
+# never evicted: an expired entry still carries the validators for the next conditional request.
+_cache = {}
+_inflight = {}  # company -> Future, so sessions refreshing at the same time share one fetch
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="company-updates")
+
+def _refresh(source):
+    with _lock:
+        entry = _cache.get(source.company) or {}
+    validators = entry.get("validators", {})
+    updates, error = None, "fetch interrupted"
+    try:
+        updates, validators = source.fetch(validators)
+        error = None
+    except Exception as e:
+        # Any adapter failure, including register()ed third-party sources, is retried later
+        print(f"Company Update Error ({source.company}): {e}")
+        error = str(e)
+    finally:
+        # Always settle the entry and drop the in-flight future, or the company never refreshes again
+        with _lock:
+            if updates is None:
+                # Not modified, or failed: keep the last good updates
+                updates = entry.get("updates", [])
+            _cache[source.company] = {
+                "updates": updates,
+                "validators": validators,
+                "expires": time.monotonic() + (ERROR_RETRY if error else source.ttl),
+                "fetched_at": datetime.now(),
+                "error": error,
+            }
+            _inflight.pop(source.company, None)
+
+def fetch_all(companies, force=False, timeout=None):
+    """Returns {company: updates}, fetching every expired (or, with force, every) source in parallel.
+    Companies without a source get []. Sources still running after `timeout` seconds
+    (default: the HTTP timeout plus a second) return their previous result."""
+    now = time.monotonic()
+    pending = []
+    with _lock:
+        for company in companies:
+            source = SOURCES.get(company)
+            entry = _cache.get(company)
+            if source is None or (entry and entry["expires"] > now and not force):
+                continue
+            future = _inflight.get(company)
+            if future is None:
+                future = _inflight[company] = _executor.submit(_refresh, source)
+            pending.append(future)
+    if pending:
+        wait(pending, timeout=REQUEST_TIMEOUT + 1 if timeout is None else timeout)
+    with _lock:
+        return {company: list(_cache.get(company, {}).get("updates", [])) for company in companies}
+
+def status():
+    """Per-source cache state, for debugging and the fixture check."""
+    now = time.monotonic()
+    with _lock:
+        return [{
+            "Company": company,
+            "Source": type(SOURCES.get(company)).__name__,
+            "Updates": len(entry["updates"]),
+            "Fresh For s": max(round(entry["expires"] - now), 0),
+            "Fetched": entry["fetched_at"].strftime("%H:%M:%S"),
+            "Error": entry["error"] or "",
+        } for company, entry in sorted(_cache.items())]
+
+def clear():
+    with _lock:
+        _cache.clear()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time a company-update refresh")
+    parser.add_argument("--fixture", action="store_true", help="serve JSON feeds from a local fixture server first")
+    parser.add_argument("--delay", type=float, default=1.0, help="slowest fixture feed delay in seconds")
+    args = parser.parse_args()
+    if args.fixture:
+        import fixture_server
+        server, base_url = fixture_server.start(max_delay=args.delay)
+        for company in fixture_server.FEEDS:
+            register(JsonFeedSource(company, f"{base_url}/feeds/{company}.json"))
+        print(f"Fixture feeds at {base_url} · slowest {args.delay:.1f}s · "
+              f"sum of delays {sum(fixture_server.delays(args.delay).values()):.1f}s")
+    companies = sorted(SOURCES)
+    for label, force in (("cold", False), ("cached", False), ("revalidate", True)):
+        started = time.perf_counter()
+        fetch_all(companies, force=force, timeout=max(args.delay, REQUEST_TIMEOUT) + 1)
+        print(f"{label:>10}: {time.perf_counter() - started:.2f}s for {len(companies)} sources")
+    for row in status():
+        print(row)
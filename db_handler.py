@@ -1,73 +1,553 @@
 import mysql.connector
-from mysql.connector import pooling, Error
-import hashlib
+from mysql.connector import pooling, Error, InterfaceError, OperationalError
+from mysql.connector import cursor as pure_cursor
 import streamlit as st
 import os
+import csv
+import queue
+import password_hasher
+import otp_guard
+import hmac
+import db_metrics
+import db_health
+import functools
+import time
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 
 # ==========================================
 # 1. CONNECTION POOL (The Professional Fix)
 # ==========================================
+# Connections used within VALIDATE_IDLE_AFTER seconds are handed out without a ping; older
+# ones are pinged and, if dead, reconnected on their own. A keepalive thread pings anything
+# idle for KEEPALIVE_INTERVAL seconds so the server's wait_timeout never closes it under us.
+# A connection whose query lost the server goes back marked stale, so its next checkout
+# revives it however recently it was used (otherwise a restarted server would never be
+# noticed by connections in steady use).
+VALIDATE_IDLE_AFTER = 30
+KEEPALIVE_INTERVAL = 240
+LOST_CONNECTION_ERRNOS = (2006, 2013, 2055)  # gone away / lost during query / lost (socket error)
+
+try:
+    from mysql.connector import cursor_cext
+except ImportError:
+    cursor_cext = None
+
+def _connection_lost(error):
+    """True if an error means the server side of the connection is gone."""
+    if not isinstance(error, Error):
+        return False
+    return error.errno in LOST_CONNECTION_ERRNOS or (
+        isinstance(error, (OperationalError, InterfaceError)) and "not available" in str(error))
+
+class IdleAwarePool(pooling.MySQLConnectionPool):
+    """MySQLConnectionPool that only validates connections which have been idle for a while."""
+
+    def __init__(self, *args, **kwargs):
+        self._last_used = weakref.WeakKeyDictionary()  # raw connection -> monotonic time
+        self._stale = weakref.WeakSet()                 # checked out, lost the server
+        self._stop = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _queue_connection(self, cnx):
+        # Called for new connections and for every return to the pool
+        self._last_used[cnx] = 0 if cnx in self._stale else time.monotonic()
+        self._stale.discard(cnx)
+        super()._queue_connection(cnx)
+
+    def mark_stale(self, cnx):
+        """Flags a checked-out raw connection that lost the server; it is revived on next checkout."""
+        with pooling.CONNECTION_POOL_LOCK:
+            self._stale.add(cnx)
+
+    def mark_idle_stale(self):
+        """Makes every idle connection revalidate on its next checkout (e.g. after a server restart)."""
+        with pooling.CONNECTION_POOL_LOCK:
+            for cnx in list(self._cnx_queue.queue):
+                self._last_used[cnx] = 0
+
+    def _take_idle(self):
+        with pooling.CONNECTION_POOL_LOCK:
+            try:
+                return self._cnx_queue.get(block=False)
+            except queue.Empty:
+                raise pooling.PoolError("Failed getting connection; pool exhausted") from None
+
+    def _revive(self, cnx):
+        """Pings a connection and reconnects it in place if the server dropped it."""
+        try:
+            cnx.ping(reconnect=False)
+            return
+        except Error:
+            pass
+        cnx.reconnect(attempts=2, delay=0)
+        _forget_prepared(cnx)  # A new session has no prepared statements
+
+    def get_connection(self):
+        cnx = self._take_idle()
+        idle = time.monotonic() - self._last_used.get(cnx, 0)
+        try:
+            if idle > VALIDATE_IDLE_AFTER or self._config_version != cnx.pool_config_version:
+                if self._config_version != cnx.pool_config_version:
+                    cnx.config(**self._cnx_config)
+                    cnx.pool_config_version = self._config_version
+                self._revive(cnx)
+        except Error:
+            # Could not revive it now; put it back marked stale so the next checkout retries
+            with pooling.CONNECTION_POOL_LOCK:
+                super()._queue_connection(cnx)
+            self._last_used[cnx] = 0
+            raise
+        return pooling.PooledMySQLConnection(self, cnx)
+
+    def keepalive_once(self):
+        """Pings every pooled connection that has sat idle for KEEPALIVE_INTERVAL seconds."""
+        now = time.monotonic()
+        stale = []
+        with pooling.CONNECTION_POOL_LOCK:
+            keep = []
+            while not self._cnx_queue.empty():
+                cnx = self._cnx_queue.get(block=False)
+                (stale if now - self._last_used.get(cnx, 0) > KEEPALIVE_INTERVAL else keep).append(cnx)
+            for cnx in keep:
+                self._cnx_queue.put(cnx, block=False)
+        for cnx in stale:
+            try:
+                self._revive(cnx)
+                last_used = time.monotonic()
+            except Error as e:
+                print(f"Keepalive Error: {e}")
+                last_used = 0  # Validate again on checkout
+            with pooling.CONNECTION_POOL_LOCK:
+                super()._queue_connection(cnx)
+            self._last_used[cnx] = last_used
+
+    def start_keepalive(self):
+        pool_ref = weakref.ref(self)
+        stop = self._stop
+
+        def run():
+            while not stop.wait(KEEPALIVE_INTERVAL / 2):
+                pool = pool_ref()
+                if pool is None:
+                    return
+                pool.keepalive_once()
+                del pool
+
+        threading.Thread(target=run, name="db-keepalive", daemon=True).start()
+
+    def stop_keepalive(self):
+        self._stop.set()
+
+def is_configured():
+    """True if secrets.toml has a [mysql] section; without one the app runs on mock data."""
+    try:
+        return "mysql" in st.secrets
+    except Exception:
+        return False
+
+def _pool_config(section):
+    """Connection settings for one secrets section, with our SSL defaults applied."""
+    db_config = st.secrets[section].to_dict()
+    
+    # SSL Logic
+    local_cert_path = "C:/Users/CHETANA GARUD/OneDrive/Chetana/isrgrootx1.pem"
+    
+    if os.path.exists(local_cert_path):
+        db_config["ssl_ca"] = local_cert_path
+        db_config["ssl_verify_identity"] = True
+    else:
+        db_config["ssl_ca"] = "/etc/ssl/certs/ca-certificates.crt"
+        db_config["ssl_verify_identity"] = True
+    return db_config
+
 # We cache the POOL, not the individual connection.
 @st.cache_resource
 def get_db_pool():
     """Creates a pool of connections that stay alive."""
     try:
-        db_config = st.secrets["mysql"].to_dict()
-        
-        # SSL Logic
-        local_cert_path = "C:/Users/CHETANA GARUD/OneDrive/Chetana/isrgrootx1.pem"
-        
-        if os.path.exists(local_cert_path):
-            db_config["ssl_ca"] = local_cert_path
-            db_config["ssl_verify_identity"] = True
-        else:
-            db_config["ssl_ca"] = "/etc/ssl/certs/ca-certificates.crt"
-            db_config["ssl_verify_identity"] = True
+        db_config = _pool_config("mysql")
 
         # Create a Pool named 'mypool' with 3 connections
         # This keeps connections ready so there is NO LAG.
-        pool = mysql.connector.pooling.MySQLConnectionPool(
+        # Sessions are not reset on return: a reset would deallocate the server-side prepared
+        # statements we cache per connection. Autocommit keeps plain reads from holding a
+        # snapshot open across checkouts; transaction() opens explicit ones for writes.
+        pool = IdleAwarePool(
             pool_name="mypool",
             pool_size=3,
-            pool_reset_session=True,
+            pool_reset_session=False,
+            autocommit=True,
             **db_config
         )
+        pool.start_keepalive()
         print("✅ Database Pool Created!")
         return pool
 
     except Error as e:
-        st.error(f"❌ Pool Creation Error: {e}")
+        _report_error(f"❌ Pool Creation Error: {e}")
         return None
 
-def get_connection():
-    """Gets a fresh connection from the pool."""
+# Daemon threads (rollup refresher, health prober, deferred-write replay) get their own small
+# pool on the primary, so a long rollup chunk never takes a connection a page request is
+# waiting for. Code runs on it inside `with background_work():`.
+BACKGROUND_POOL_SIZE = 2
+_background = ContextVar("db_handler_background", default=False)
+
+@st.cache_resource
+def get_background_pool():
+    """Creates the primary pool reserved for background jobs."""
     try:
-        pool = get_db_pool()
-        if pool:
-            # Get a connection from the pool
-            conn = pool.get_connection()
-            # Ensure it's actually alive
-            if not conn.is_connected():
-                conn.reconnect(attempts=3, delay=0)
-            return conn
+        pool = IdleAwarePool(
+            pool_name="backgroundpool",
+            pool_size=BACKGROUND_POOL_SIZE,
+            pool_reset_session=False,
+            autocommit=True,
+            **_pool_config("mysql")
+        )
+        pool.start_keepalive()
+        print("✅ Background Pool Created!")
+        return pool
+
+    except Error as e:
+        print(f"Background Pool Error: {e}")
+        return None
+
+@contextmanager
+def background_work():
+    """Runs every transaction in the block on the background pool."""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+def _report_error(message):
+    # st.error needs a script run context; daemon threads and CLI scripts only get a log line
+    if get_script_run_ctx(suppress_warning=True) is None:
+        print(message)
+    else:
+        st.error(message)
+
+# Optional read replica. Add a [mysql_replica] section with the same keys as [mysql] (any
+# MySQL instance replicating from the primary, or a second local server in development) and
+# read-only work is served from it. Without the section everything uses the primary pool.
+# [mysql_replica]
+# host = "..."
+# pin_seconds = 5     # after a session writes, its reads stay on the primary this long
+def _replica_configured():
+    try:
+        return "mysql_replica" in st.secrets
+    except Exception:
+        return False
+
+def _pin_seconds():
+    try:
+        return float(st.secrets.get("mysql_replica", {}).get("pin_seconds", 5))
+    except Exception:
+        return 5.0
+
+READ_YOUR_WRITES_SECONDS = _pin_seconds()
+_PIN_KEY = "_db_primary_until"
+
+@st.cache_resource
+def get_replica_pool():
+    """Creates the read-replica pool, or returns None when no replica is configured."""
+    if not _replica_configured():
+        return None
+    try:
+        db_config = _pool_config("mysql_replica")
+        db_config.pop("pin_seconds", None)
+        pool = IdleAwarePool(
+            pool_name="replicapool",
+            pool_size=3,
+            pool_reset_session=False,
+            autocommit=True,
+            **db_config
+        )
+        pool.start_keepalive()
+        print("✅ Replica Pool Created!")
+        return pool
+
+    except Error as e:
+        print(f"Replica Pool Error (reads stay on primary): {e}")
+        return None
+
+def _pinned_to_primary():
+    """True while this browser session is inside its read-your-writes window."""
+    try:
+        return st.session_state.get(_PIN_KEY, 0) > time.monotonic()
+    except Exception:
+        # No Streamlit session (scripts, threads): nothing to pin
+        return False
+
+def _pin_to_primary():
+    try:
+        st.session_state[_PIN_KEY] = time.monotonic() + READ_YOUR_WRITES_SECONDS
+    except Exception:
+        pass
+
+def get_connection(replica=False):
+    """Gets a connection from the pool (validated only if it sat idle).
+    replica=True prefers the read replica and falls back to the primary if it is missing or down."""
+    if replica:
+        replica_pool = get_replica_pool()
+        if replica_pool:
+            try:
+                return replica_pool.get_connection()
+            except Error as e:
+                print(f"Replica Connection Error (using primary): {e}")
+    get_pool = get_background_pool if _background.get() else get_db_pool
+    pool = get_pool()
+    if not pool:
+        # Don't keep a failed pool creation cached; retry it on the next call
+        get_pool.clear()
+        return None
+    try:
+        return pool.get_connection()
     except Error as e:
-        st.error(f"⚠️ Connection Error: {e}")
-        # Force clear cache if pool is broken
-        st.cache_resource.clear()
+        _report_error(f"⚠️ Connection Error: {e}")
         return None
-    return None
+
+def _open_cursor(conn, dictionary=False, prepared=False):
+    """A buffered (or prepared) cursor on a pooled connection, built without conn.cursor():
+    Connector/Python pings the server inside every cursor() call, an extra round trip per
+    transaction. Checkout has already validated the connection if it sat idle, and a dead one
+    fails on its first statement and is marked stale by _release()."""
+    raw = _raw_connection(conn)
+    if isinstance(raw, mysql.connector.MySQLConnection):
+        raw.handle_unread_result()
+        module, prefix = pure_cursor, "MySQLCursor"
+    else:
+        raw.handle_unread_result(prepared)
+        module, prefix = cursor_cext, "CMySQLCursor"
+    kind = "Prepared" if prepared else "Buffered"
+    return getattr(module, f"{prefix}{kind}{'Dict' if dictionary else ''}")(raw)
+
+def _release(conn, error=None):
+    """Returns a checkout to its pool. If `error` shows the server dropped the connection, it is
+    flagged so the next checkout pings and reconnects it instead of trusting its recent use."""
+    pool = getattr(conn, "_cnx_pool", None)
+    if error is not None and _connection_lost(error) and isinstance(pool, IdleAwarePool):
+        pool.mark_stale(_raw_connection(conn))
+    conn.close()
+
+def invalidate_idle_connections():
+    """Called by db_health when the database comes back: idle connections predate the outage,
+    so each is revalidated on its next checkout rather than failing one request first."""
+    for pool in (get_db_pool(), get_replica_pool(), get_background_pool()):
+        if pool:
+            pool.mark_idle_stale()
+
+def ping_primary():
+    """One SELECT 1 round trip to the primary (on the background pool) for db_health. Returns
+    milliseconds, or None if every connection is busy (not a health signal). Raises Error when
+    the database is unreachable."""
+    pool = get_background_pool()
+    if not pool:
+        get_background_pool.clear()
+        raise Error(msg="Pool creation failed")
+    start = time.perf_counter()
+    try:
+        conn = pool.get_connection()
+    except pooling.PoolError as e:
+        if "exhausted" in str(e):
+            return None
+        raise
+    error = None
+    try:
+        cursor = _open_cursor(conn)
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+    except Error as e:
+        error = e
+        raise
+    finally:
+        _release(conn, error)
+    return (time.perf_counter() - start) * 1000
+
+def replica_status():
+    """Routing state for the Admin page."""
+    pool = get_replica_pool()
+    return {
+        "configured": pool is not None,
+        "pinned": _pinned_to_primary(),
+        "pin_seconds": READ_YOUR_WRITES_SECONDS,
+    }
+
+# ==========================================
+# 2. UNIT OF WORK
+# ==========================================
+# One pooled connection and one buffered cursor per logical operation. Every statement in
+# the block shares them and the block commits once on exit (or rolls back on error), so a
+# multi-statement operation costs a single pool checkout and a single COMMIT.
+_current_conn = ContextVar("db_handler_current_conn", default=None)
+_current_op = ContextVar("db_handler_current_op", default="unnamed")
+
+def instrumented(fn):
+    """Names every query run inside fn after it, for the latency histograms in db_metrics."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _current_op.set(fn.__name__)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_op.reset(token)
+    return wrapper
+
+class _TimedCursor:
+    """Cursor proxy that times each execute and records its row count."""
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, attr):
+        return getattr(self._cursor, attr)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, operation, params=()):
+        return self._run(self._cursor.execute, operation, params)
+
+    def executemany(self, operation, seq_params):
+        return self._run(self._cursor.executemany, operation, seq_params)
+
+    def _run(self, method, operation, params):
+        error = False
+        start = time.perf_counter()
+        try:
+            return method(operation, params)
+        except Error:
+            error = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            db_metrics.record_query(_current_op.get(), elapsed_ms, self._cursor.rowcount, operation, error)
+
+@contextmanager
+def transaction(dictionary=False, readonly=False, primary=False):
+    """Yields a cursor bound to one pooled connection; commits on success, rolls back on error.
+    Read-only blocks run in autocommit with no BEGIN/COMMIT and go to the read replica (if any)
+    unless primary=True or the session wrote recently. Raises Error if no connection is available,
+    immediately (without waiting on a connect timeout) while db_health reports the database down."""
+    if db_health.is_down():
+        raise Error(msg="Database unavailable (degraded mode)")
+    use_replica = readonly and not primary and not _pinned_to_primary()
+    with db_metrics.Timer() as wait:
+        conn = get_connection(replica=use_replica)
+    db_metrics.record_wait(_current_op.get(), wait.ms)
+    if not conn:
+        raise Error(msg="No database connection available")
+    cursor = error = None
+    token = _current_conn.set(conn)
+    try:
+        # Inside the try: if the connection is dead this raises, and the slot still goes back
+        cursor = _TimedCursor(_open_cursor(conn, dictionary=dictionary))
+        if not readonly:
+            conn.start_transaction()
+        yield cursor
+        if not readonly:
+            conn.commit()
+            _pin_to_primary()
+    except Exception as e:
+        error = e
+        try:
+            if not _connection_lost(e) and conn.in_transaction:
+                conn.rollback()
+        except Error:
+            pass
+        raise
+    finally:
+        _current_conn.reset(token)
+        try:
+            if cursor is not None:
+                cursor.close()
+        finally:
+            _release(conn, error) # Important: Returns connection to pool
 
 # ==========================================
-# 2. DATABASE OPERATIONS (Updated to use Pool)
+# 3. PREPARED STATEMENT CACHE
 # ==========================================
-# NOTICE: We use 'with' blocks or explicit close() to return connections to the pool.
+# The fixed set of hot statements runs through server-side prepared cursors, so MySQL parses
+# each one once per connection instead of on every call. Cursors are cached against the raw
+# pooled connection, which outlives each checkout wrapper, and are dropped on reconnect.
+USER_PUBLIC_COLUMNS = "id, username, email, role, is_verified, created_at, last_login"
+HOT_STATEMENTS = {
+    "user_by_email": f"SELECT {USER_PUBLIC_COLUMNS} FROM users WHERE email = %s",
+    "user_auth_by_email": "SELECT * FROM users WHERE email = %s",
+    "user_history": "SELECT created_at, role_predicted, prediction_value FROM predictions WHERE user_id = %s ORDER BY created_at DESC LIMIT 5",
+    "insert_activity": "INSERT INTO activity_logs (user_id, username, action, details) VALUES (%s, %s, %s, %s)",
+    "insert_activity_by_email": "INSERT INTO activity_logs (user_id, username, action, details) SELECT id, %s, %s, %s FROM users WHERE email = %s",
+    "insert_prediction": (
+        "INSERT INTO predictions (user_id, username, prediction_value, role_predicted, salary_min, salary_max, salary_center, "
+        "district, company_type, internship_exp, cgpa_range, college_tier, is_custom_role) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+    ),
+    "dashboard_kpis": (
+        "SELECT (SELECT COUNT(*) FROM users WHERE role = 'user'), "
+        "(SELECT COUNT(*) FROM users WHERE role IN ('admin', 'super_admin')), "
+        "(SELECT COUNT(*) FROM predictions WHERE created_at > %s)"
+    ),
+}
+_prepared = weakref.WeakKeyDictionary()  # raw connection -> {(name, dictionary): cursor}
+_prepared_lock = threading.Lock()
+
+def _raw_connection(conn):
+    # PooledMySQLConnection is a per-checkout wrapper; _cnx is the long-lived session
+    return getattr(conn, "_cnx", None) or conn
+
+def _hot_lastrowid(name, dictionary=False):
+    """lastrowid of the most recent execute_hot(name) on the current transaction's connection."""
+    cursors = _prepared.get(_raw_connection(_current_conn.get()), {})
+    cursor = cursors.get((name, dictionary))
+    return cursor.lastrowid if cursor is not None else None
+
+def _forget_prepared(conn):
+    with _prepared_lock:
+        _prepared.pop(_raw_connection(conn), None)
 
+def execute_hot(name, params=(), dictionary=False):
+    """Runs a HOT_STATEMENTS entry on the current transaction's connection through its cached
+    prepared cursor and returns all rows (always fully read, so the connection stays usable)."""
+    conn = _current_conn.get()
+    if conn is None:
+        raise RuntimeError("execute_hot must be called inside transaction()")
+    raw = _raw_connection(conn)
+    with _prepared_lock:
+        cursors = _prepared.setdefault(raw, {})
+    key = (name, dictionary)
+    for attempt in range(2):
+        cursor = cursors.get(key)
+        if cursor is None:
+            cursor = cursors[key] = _open_cursor(raw, dictionary=dictionary, prepared=True)
+        start = time.perf_counter()
+        try:
+            cursor.execute(HOT_STATEMENTS[name], params)
+            rows = cursor.fetchall() if cursor.with_rows else []
+            db_metrics.record_query(_current_op.get(), (time.perf_counter() - start) * 1000,
+                                    len(rows) or cursor.rowcount, HOT_STATEMENTS[name])
+            return rows
+        except Error as e:
+            db_metrics.record_query(_current_op.get(), (time.perf_counter() - start) * 1000,
+                                    0, HOT_STATEMENTS[name], error=True)
+            cursors.pop(key, None)
+            # 1243: unknown statement handler (server restarted or session lost); prepare again once
+            if e.errno != 1243 or attempt:
+                raise
+
+# ==========================================
+# 4. DATABASE SETUP
+# ==========================================
+@instrumented
 def create_table():
     try:
-        conn = get_connection()
-        if conn:
-            cursor = conn.cursor()
+        with transaction() as cursor:
             # Users
             cursor.execute('''CREATE TABLE IF NOT EXISTS users (
                 id INT AUTO_INCREMENT PRIMARY KEY,
@@ -80,6 +560,7 @@ def create_table():
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_login TIMESTAMP DEFAULT NULL
             )''')
+            _ensure_column(cursor, "users", "otp_expires_at", "DATETIME NULL")
             # Predictions
             cursor.execute('''CREATE TABLE IF NOT EXISTS predictions (
                 id INT AUTO_INCREMENT PRIMARY KEY,
@@ -88,6 +569,9 @@ def create_table():
                 role_predicted VARCHAR(255),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )''')
+            for column, ddl in PREDICTION_NUMERIC_COLUMNS:
+                _ensure_column(cursor, "predictions", column, ddl)
+            _ensure_column(cursor, "predictions", "user_id", "INT NULL")
             # Activity Logs
             cursor.execute('''CREATE TABLE IF NOT EXISTS activity_logs (
                 id INT AUTO_INCREMENT PRIMARY KEY,
@@ -96,6 +580,7 @@ def create_table():
                 details TEXT,
                 timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )''')
+            _ensure_column(cursor, "activity_logs", "user_id", "INT NULL")
             # Feedback
             cursor.execute('''CREATE TABLE IF NOT EXISTS feedback (
                 id INT AUTO_INCREMENT PRIMARY KEY,
@@ -106,12 +591,122 @@ def create_table():
                 accuracy_rating VARCHAR(50),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )''')
-            conn.commit()
-            cursor.close()
-            conn.close() # Important: Returns connection to pool
+            for column, ddl in FEEDBACK_NUMERIC_COLUMNS:
+                _ensure_column(cursor, "feedback", column, ddl)
+            _ensure_column(cursor, "feedback", "user_id", "INT NULL")
+            # OTP token buckets, only used when [otp] persist = true
+            cursor.execute('''CREATE TABLE IF NOT EXISTS rate_limits (
+                bucket VARCHAR(320) PRIMARY KEY,
+                tokens DOUBLE NOT NULL,
+                updated_at DOUBLE NOT NULL
+            )''')
+            # Admin dashboard rollups, maintained incrementally by analytics.refresh_rollups()
+            cursor.execute('''CREATE TABLE IF NOT EXISTS analytics_daily (
+                metric VARCHAR(32) NOT NULL,
+                bucket_date DATE NOT NULL,
+                dim VARCHAR(255) NOT NULL DEFAULT '',
+                value BIGINT NOT NULL DEFAULT 0,
+                PRIMARY KEY (metric, bucket_date, dim)
+            )''')
+            cursor.execute('''CREATE TABLE IF NOT EXISTS analytics_user_logins (
+                user_id INT PRIMARY KEY,
+                logins INT NOT NULL DEFAULT 0
+            )''')
+            cursor.execute('''CREATE TABLE IF NOT EXISTS analytics_accuracy (
+                bucket_date DATE NOT NULL,
+                job_role VARCHAR(255) NOT NULL DEFAULT '',
+                district VARCHAR(100) NOT NULL DEFAULT '',
+                n INT NOT NULL DEFAULT 0,
+                n_pct INT NOT NULL DEFAULT 0,
+                sum_abs_err DECIMAL(18,2) NOT NULL DEFAULT 0,
+                sum_abs_pct_err DOUBLE NOT NULL DEFAULT 0,
+                sum_err DECIMAL(18,2) NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket_date, job_role, district)
+            )''')
+            # Cohort / funnel rollups: one row per user, plus one per user per active week
+            cursor.execute('''CREATE TABLE IF NOT EXISTS analytics_user_funnel (
+                user_id INT PRIMARY KEY,
+                cohort_week DATE NULL,
+                verified_at DATETIME NULL,
+                first_prediction_at DATETIME NULL,
+                first_hiring_at DATETIME NULL,
+                first_job_click_at DATETIME NULL,
+                KEY idx_funnel_cohort (cohort_week)
+            )''')
+            cursor.execute('''CREATE TABLE IF NOT EXISTS analytics_user_weeks (
+                user_id INT NOT NULL,
+                activity_week DATE NOT NULL,
+                PRIMARY KEY (user_id, activity_week)
+            )''')
+            cursor.execute('''CREATE TABLE IF NOT EXISTS analytics_watermarks (
+                source VARCHAR(64) PRIMARY KEY,
+                last_id BIGINT NOT NULL DEFAULT 0,
+                pending_id BIGINT NOT NULL DEFAULT 0
+            )''')
+            # Indexes backing the keyset-paginated admin listings
+            _ensure_index(cursor, "users", "idx_users_role", "role, id")
+            _ensure_index(cursor, "users", "idx_users_username", "username")
+            _ensure_index(cursor, "activity_logs", "idx_logs_action", "action, id")
+            # Indexes backing SQL-side prediction analytics
+            _ensure_index(cursor, "predictions", "idx_predictions_role", "role_predicted, created_at")
+            _ensure_index(cursor, "feedback", "idx_feedback_role", "job_role, created_at")
+            # Surrogate user_id keys. Predictions and feedback cascade with their user; activity_logs
+            # keeps its rows as an audit trail (and partitioned tables cannot carry foreign keys).
+            _ensure_index(cursor, "predictions", "idx_predictions_user", "user_id, created_at")
+            _ensure_index(cursor, "activity_logs", "idx_logs_user", "user_id, id")
+            _ensure_index(cursor, "feedback", "idx_feedback_user", "user_id")
+            # Date-range id bounds for exports.py
+            _ensure_index(cursor, "activity_logs", "idx_logs_timestamp", "timestamp")
+            _ensure_index(cursor, "predictions", "idx_predictions_created", "created_at")
+            _ensure_index(cursor, "feedback", "idx_feedback_created", "created_at")
+            _ensure_foreign_key(cursor, "predictions", "fk_predictions_user")
+            _ensure_foreign_key(cursor, "feedback", "fk_feedback_user")
     except Exception as e:
         print(f"Setup Error: {e}")
 
+# Typed columns alongside the legacy VARCHAR display strings, so analytics can aggregate in SQL.
+# Rows written before they existed are filled by migrations.backfill_numeric_columns().
+PREDICTION_NUMERIC_COLUMNS = [
+    ("salary_min", "DECIMAL(12,2) NULL"),
+    ("salary_max", "DECIMAL(12,2) NULL"),
+    ("salary_center", "DECIMAL(12,2) NULL"),
+    ("district", "VARCHAR(100) NULL"),
+    ("company_type", "VARCHAR(100) NULL"),
+    ("internship_exp", "VARCHAR(100) NULL"),
+    ("cgpa_range", "VARCHAR(50) NULL"),
+    ("college_tier", "VARCHAR(50) NULL"),
+    ("is_custom_role", "TINYINT(1) NOT NULL DEFAULT 0"),
+]
+FEEDBACK_NUMERIC_COLUMNS = [
+    ("prediction_id", "INT NULL"),
+    ("predicted_center", "DECIMAL(12,2) NULL"),
+    ("actual_offer", "DECIMAL(12,2) NULL"),
+]
+
+def _ensure_column(cursor, table, column, ddl):
+    """Adds a column once; a duplicate column error means an earlier run already added it."""
+    try:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    except Error as e:
+        if e.errno != 1060:  # ER_DUP_FIELDNAME
+            print(f"Column Error ({table}.{column}): {e}")
+
+def _ensure_foreign_key(cursor, table, name):
+    """Links table.user_id to users.id with ON DELETE CASCADE, once."""
+    try:
+        cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE")
+    except Error as e:
+        if e.errno not in (1826, 1022, 121):  # duplicate constraint name, reported differently by version
+            print(f"Foreign Key Error ({name}): {e}")
+
+def _ensure_index(cursor, table, name, columns):
+    """Creates an index once; MySQL has no CREATE INDEX IF NOT EXISTS, so a duplicate is ignored."""
+    try:
+        cursor.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+    except Error as e:
+        if e.errno != 1061:  # ER_DUP_KEYNAME
+            print(f"Index Error ({name}): {e}")
+
 def ensure_admin():
     admin_email = "chetanagarud2@gmail.com" 
     user = get_user_by_email(admin_email)
@@ -119,252 +714,546 @@ def ensure_admin():
         create_user("Chetana Garud", admin_email, "Chetana2005@", "super_admin", 1)
 
 # ==========================================
-# 3. USER FUNCTIONS
+# 5. USER FUNCTIONS
 # ==========================================
+# Passwords are hashed before a connection is taken so a slow scrypt never pins a pooled connection.
 def hash_password(password):
-    return hashlib.sha256(password.encode()).hexdigest()
+    return password_hasher.hash_password(password)
 
-def get_user_by_email(email):
-    conn = get_connection()
-    user = None
-    if conn:
+@instrumented
+def check_user_password(user, password):
+    """Verifies a login against the stored hash and upgrades legacy SHA-256 hashes on success."""
+    stored = user.get('password') or ''
+    if not password_hasher.verify_password(password, stored):
+        return False
+    if password_hasher.needs_rehash(stored):
+        new_hash = hash_password(password)
         try:
-            cursor = conn.cursor(dictionary=True, buffered=True) 
-            cursor.execute("SELECT * FROM users WHERE email = %s", (email,))
-            user = cursor.fetchone()
-            cursor.close()
-        except Error:
-            pass
-        finally:
-            conn.close() # Return to pool
-    return user
+            with transaction() as cursor:
+                cursor.execute("UPDATE users SET password = %s WHERE email = %s AND password = %s",
+                               (new_hash, user['email'], stored))
+        except Error as e:
+            print(f"Rehash Error: {e}")
+    return True
+
+# Read-through cache of user records keyed by lower-cased email. The password hash and OTP
+# are never cached; callers that need them pass include_password=True and go to the DB.
+# The cache is shared by every session while read-your-writes pinning is per session, so it is
+# always filled from the primary: a lagging replica could otherwise put back a row that a write
+# (and its invalidation) had just replaced, and serve it to the writer too.
+USER_CACHE_TTL = 300
+_user_cache = TTLCache(maxsize=2048, ttl=USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+_MISSING = object()
+
+def _user_key(email):
+    return (email or "").strip().lower()
 
+def invalidate_user_cache(email=None, username=None):
+    """Drops cached records for an email and/or username (both None clears everything)."""
+    with _user_cache_lock:
+        if email is None and username is None:
+            _user_cache.clear()
+            return
+        if email is not None:
+            _user_cache.pop(_user_key(email), None)
+        if username is not None:
+            stale = [k for k, v in _user_cache.items() if v is not _MISSING and v['username'] == username]
+            for k in stale:
+                _user_cache.pop(k, None)
+
+@instrumented
+def get_user_by_email(email, include_password=False):
+    if include_password:
+        return _fetch_user(email, "user_auth_by_email")[1]
+    key = _user_key(email)
+    with _user_cache_lock:
+        cached = _user_cache.get(key)
+    if cached is not None:
+        return None if cached is _MISSING else dict(cached)
+    ok, user = _fetch_user(email, "user_by_email")
+    if ok:
+        # Misses are cached too so repeated signup checks skip the DB; create_* invalidates them.
+        with _user_cache_lock:
+            _user_cache[key] = user if user else _MISSING
+    return dict(user) if user else None
+
+def _fetch_user(email, statement):
+    """Returns (ok, user); ok is False when the DB could not be queried."""
+    try:
+        with transaction(readonly=True, primary=True):
+            rows = execute_hot(statement, (email,), dictionary=True)
+        return True, rows[0] if rows else None
+    except Error:
+        return False, None
+
+@instrumented
 def create_user(username, email, password, role="user", is_verified=0):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            hashed_pw = hash_password(password)
+    hashed_pw = hash_password(password)
+    try:
+        with transaction() as cursor:
             cursor.execute("INSERT INTO users (username, email, password, role, is_verified) VALUES (%s, %s, %s, %s, %s)", 
                            (username, email, hashed_pw, role, is_verified))
-            conn.commit()
-            cursor.close()
-            log_activity(username, "Account Created", f"Role: {role}")
-            return True
-        except Error as e:
-            print(f"Error: {e}")
-            return False
-        finally:
-            conn.close()
-    return False
+            _insert_activity(username, "Account Created", f"Role: {role}", user_id=cursor.lastrowid)
+    except Error as e:
+        print(f"Error: {e}")
+        return False
+    invalidate_user_cache(email=email)
+    return True
 
-def create_user_pending_verification(username, email, password, otp):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            hashed_pw = hash_password(password)
-            cursor.execute("INSERT INTO users (username, email, password, role, is_verified, otp) VALUES (%s, %s, %s, 'user', 0, %s)", 
-                           (username, email, hashed_pw, otp))
-            conn.commit()
-            cursor.close()
-            return True
-        except Error:
-            return False
-        finally:
-            conn.close()
-    return False
+@instrumented
+def create_user_pending_verification(username, email, password, otp, ttl=otp_guard.OTP_TTL_SECONDS):
+    hashed_pw = hash_password(password)
+    try:
+        with transaction() as cursor:
+            cursor.execute("INSERT INTO users (username, email, password, role, is_verified, otp, otp_expires_at) "
+                           "VALUES (%s, %s, %s, 'user', 0, %s, NOW() + INTERVAL %s SECOND)", 
+                           (username, email, hashed_pw, otp, ttl))
+    except Error:
+        return False
+    invalidate_user_cache(email=email)
+    return True
 
+@instrumented
 def verify_user(email, otp_input):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor(dictionary=True, buffered=True)
-            cursor.execute("SELECT otp FROM users WHERE email = %s", (email,))
+    try:
+        with transaction(dictionary=True) as cursor:
+            # Codes without an expiry predate it and count as expired
+            cursor.execute("SELECT id, otp, COALESCE(otp_expires_at > NOW(), 0) AS fresh FROM users WHERE email = %s", (email,))
             result = cursor.fetchone()
-            if result and str(result['otp']) == str(otp_input):
-                cursor.execute("UPDATE users SET is_verified = 1, otp = NULL WHERE email = %s", (email,))
-                conn.commit()
-                cursor.close()
-                log_activity(email, "Account Verified", "Success")
-                return True
-            cursor.close()
-        except Error:
-            pass
-        finally:
-            conn.close()
-    return False
+            if not (result and result['otp'] and result['fresh']
+                    and hmac.compare_digest(str(result['otp']), str(otp_input))):
+                return False
+            cursor.execute("UPDATE users SET is_verified = 1, otp = NULL, otp_expires_at = NULL WHERE id = %s", (result['id'],))
+            _insert_activity(email, "Account Verified", "Success", user_id=result['id'])
+    except Error:
+        return False
+    invalidate_user_cache(email=email)
+    return True
 
-def set_otp_for_reset(email, otp):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("UPDATE users SET otp = %s WHERE email = %s", (otp, email))
-            conn.commit()
-            cursor.close()
-            return True
-        finally:
-            conn.close()
-    return False
+@instrumented
+def set_otp_for_reset(email, otp, ttl=otp_guard.OTP_TTL_SECONDS):
+    try:
+        with transaction() as cursor:
+            cursor.execute("UPDATE users SET otp = %s, otp_expires_at = NOW() + INTERVAL %s SECOND WHERE email = %s",
+                           (otp, ttl, email))
+    except Error as e:
+        print(f"Error: {e}")
+        return False
+    invalidate_user_cache(email=email)
+    return True
 
+@instrumented
 def update_user_password(email, new_password):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            hashed_pw = hash_password(new_password)
-            cursor.execute("UPDATE users SET password = %s, otp = NULL WHERE email = %s", (hashed_pw, email))
-            conn.commit()
-            cursor.close()
-            log_activity(email, "Password Reset", "Success")
-            return True
-        finally:
-            conn.close()
-    return False
+    hashed_pw = hash_password(new_password)
+    try:
+        with transaction() as cursor:
+            cursor.execute("UPDATE users SET password = %s, otp = NULL, otp_expires_at = NULL WHERE email = %s", (hashed_pw, email))
+            execute_hot("insert_activity_by_email", (email, "Password Reset", "Success", email))
+    except Error as e:
+        print(f"Error: {e}")
+        return False
+    invalidate_user_cache(email=email)
+    return True
 
-def delete_user(username):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM users WHERE username = %s", (username,))
-            conn.commit()
-            cursor.close()
-            return True
-        finally:
-            conn.close()
-    return False
+@instrumented
+def delete_user(user_id):
+    """Deletes one user by id; their predictions and feedback go with it via ON DELETE CASCADE."""
+    try:
+        with transaction(dictionary=True) as cursor:
+            cursor.execute("SELECT email FROM users WHERE id = %s", (user_id,))
+            row = cursor.fetchone()
+            if not row:
+                return False
+            cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
+    except Error as e:
+        print(f"Error: {e}")
+        return False
+    invalidate_user_cache(email=row['email'])
+    with _history_lock:
+        _history_cache.pop(user_id, None)
+    return True
+
+@instrumented
+def load_rate_bucket(key):
+    """(tokens, updated_at) of a persisted OTP rate-limit bucket, or None."""
+    try:
+        with transaction(readonly=True, primary=True) as cursor:
+            cursor.execute("SELECT tokens, updated_at FROM rate_limits WHERE bucket = %s", (key,))
+            return cursor.fetchone()
+    except Error:
+        return None
+
+@instrumented
+def save_rate_buckets(rows):
+    try:
+        with transaction() as cursor:
+            cursor.executemany(
+                "INSERT INTO rate_limits (bucket, tokens, updated_at) VALUES (%s, %s, %s) "
+                "ON DUPLICATE KEY UPDATE tokens = VALUES(tokens), updated_at = VALUES(updated_at)", rows
+            )
+    except Error as e:
+        print(f"Rate Limit Store Error: {e}")
 
 # ==========================================
-# 4. DATA FETCHING
+# 6. DATA FETCHING
 # ==========================================
-def get_user_history(username):
-    conn = get_connection()
-    data = []
-    if conn:
-        try:
-            cursor = conn.cursor(buffered=True)
-            query = "SELECT created_at, role_predicted, prediction_value FROM predictions WHERE username = %s ORDER BY created_at DESC LIMIT 5"
-            cursor.execute(query, (username,))
-            rows = cursor.fetchall()
-            for row in rows:
-                date_str = row[0].strftime("%b %d") if isinstance(row[0], datetime) else str(row[0])
-                data.append((date_str, row[1], row[2]))
-            cursor.close()
-        except Error:
-            pass
-        finally:
-            conn.close()
-    return data
+# Write-through cache of each user's latest predictions for the home dashboard. log_prediction
+# prepends to a cached list after its commit; the DB is only read on a cold miss, from the
+# primary for the same reason as the user cache.
+HISTORY_LIMIT = 5  # Matches the LIMIT in HOT_STATEMENTS["user_history"]
+_history_cache = TTLCache(maxsize=4096, ttl=3600)
+_history_lock = threading.Lock()
+
+def _history_entry(created_at, role, value):
+    date_str = created_at.strftime("%b %d") if isinstance(created_at, datetime) else str(created_at)
+    return (date_str, role, value)
+
+@instrumented
+def get_user_history(user_id):
+    if user_id is None:
+        return []
+    with _history_lock:
+        cached = _history_cache.get(user_id)
+    if cached is not None:
+        return list(cached)
+    data = _fetch_user_history(user_id)
+    if data is not None:
+        with _history_lock:
+            _history_cache[user_id] = tuple(data)
+    return data or []
+
+def _fetch_user_history(user_id):
+    """Latest predictions from the DB, or None if the DB could not be queried."""
+    try:
+        with transaction(readonly=True, primary=True):
+            rows = execute_hot("user_history", (user_id,))
+    except Error:
+        return None
+    return [_history_entry(*row) for row in rows]
 
+@instrumented
 def get_dashboard_kpis():
-    conn = get_connection()
-    stats = {'users': 0, 'admins': 0, 'predictions': 0}
-    if conn:
-        try:
-            cursor = conn.cursor(buffered=True)
-            cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'user'")
-            stats['users'] = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM users WHERE role IN ('admin', 'super_admin')")
-            stats['admins'] = cursor.fetchone()[0]
-            yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
-            cursor.execute("SELECT COUNT(*) FROM predictions WHERE created_at > %s", (yesterday,))
-            stats['predictions'] = cursor.fetchone()[0]
-            cursor.close()
-        except Error:
-            pass
-        finally:
-            conn.close()
-    return stats
+    """User, admin and last-24h prediction counters. Raises Error if the DB can't be read, so
+    callers never mistake an outage for an empty system."""
+    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
+    # One round trip for all three counters
+    with transaction(readonly=True):
+        row = execute_hot("dashboard_kpis", (yesterday,))[0]
+    return dict(zip(('users', 'admins', 'predictions'), row))
 
+@instrumented
 def get_all_users():
-    conn = get_connection()
     users = []
-    if conn:
-        try:
-            cursor = conn.cursor(dictionary=True, buffered=True)
+    try:
+        with transaction(dictionary=True, readonly=True) as cursor:
             cursor.execute("SELECT id, username, email, role, created_at, last_login FROM users")
             rows = cursor.fetchall()
-            for row in rows:
-                joined_date = row['created_at'].strftime("%Y-%m-%d") if row['created_at'] else "-"
-                last_log = row['last_login'].strftime("%Y-%m-%d %H:%M") if row.get('last_login') else "Never"
-                users.append({
-                    'id': row['id'], 'username': row['username'], 'email': row['email'], 
-                    'role': row['role'], 'Joined': joined_date, 'Last Login': last_log
-                })
-            cursor.close()
-        except Error:
-            pass
-        finally:
-            conn.close()
+        for row in rows:
+            joined_date = row['created_at'].strftime("%Y-%m-%d") if row['created_at'] else "-"
+            last_log = row['last_login'].strftime("%Y-%m-%d %H:%M") if row.get('last_login') else "Never"
+            users.append({
+                'id': row['id'], 'username': row['username'], 'email': row['email'], 
+                'role': row['role'], 'Joined': joined_date, 'Last Login': last_log
+            })
+    except Error:
+        pass
     return users
 
+@instrumented
 def get_recent_logs(limit=50):
-    conn = get_connection()
     logs = []
-    if conn:
-        try:
-            cursor = conn.cursor(buffered=True)
+    try:
+        with transaction(readonly=True) as cursor:
             cursor.execute("SELECT username, action, details, timestamp FROM activity_logs ORDER BY timestamp DESC LIMIT %s", (limit,))
             rows = cursor.fetchall()
-            for row in rows:
-                logs.append({"User": row[0], "Action": row[1], "Details": row[2], "Time": row[3]})
-            cursor.close()
-        except Error:
-            pass
-        finally:
-            conn.close()
+        for row in rows:
+            logs.append({"User": row[0], "Action": row[1], "Details": row[2], "Time": row[3]})
+    except Error:
+        pass
     return logs
 
+ADMIN_ROLES = ('admin', 'super_admin')
+
+def _like_prefix(text):
+    """Escapes LIKE wildcards so user input is matched as a literal prefix."""
+    return text.replace('\\', '\\\\').replace('%', r'\%').replace('_', r'\_') + '%'
+
+@instrumented
+def get_users_page(roles=None, search=None, joined_from=None, joined_to=None, after_id=None, page_size=50):
+    """Keyset-paginated user listing. Returns (users, next_cursor); next_cursor is None on the last page.
+
+    Filtering happens in SQL: `roles` is a tuple of role names, `search` is a name/email prefix and
+    `joined_from`/`joined_to` bound `created_at`. `after_id` is the next_cursor returned for the previous page.
+    Raises Error if the DB can't be read rather than returning an empty page.
+    """
+    clauses, params = [], []
+    if roles:
+        clauses.append(f"role IN ({', '.join(['%s'] * len(roles))})")
+        params.extend(roles)
+    if search:
+        clauses.append("(username LIKE %s OR email LIKE %s)")
+        params.extend([_like_prefix(search)] * 2)
+    if joined_from:
+        clauses.append("created_at >= %s")
+        params.append(joined_from)
+    if joined_to:
+        clauses.append("created_at < %s")
+        params.append(joined_to)
+    if after_id:
+        clauses.append("id < %s")
+        params.append(after_id)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    query = (
+        "SELECT id, username, email, role, "
+        "COALESCE(DATE_FORMAT(created_at, '%Y-%m-%d'), '-') AS joined, "
+        "COALESCE(DATE_FORMAT(last_login, '%Y-%m-%d %H:%i'), 'Never') AS last_login "
+        f"FROM users {where} ORDER BY id DESC LIMIT %s"
+    )
+    params.append(page_size + 1)
+
+    users, next_cursor = [], None
+    with transaction(dictionary=True, readonly=True) as cursor:
+        cursor.execute(query, tuple(params))
+        rows = cursor.fetchall()
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = rows[-1]['id']
+    for row in rows:
+        users.append({
+            'id': row['id'], 'username': row['username'], 'email': row['email'],
+            'role': row['role'], 'Joined': row['joined'], 'Last Login': row['last_login']
+        })
+    return users, next_cursor
+
+def _log_entry(row):
+    return {"ID": row[0], "User": row[1], "Action": row[2], "Details": row[3], "Time": row[4]}
+
+@instrumented
+def get_logs_page(username=None, action=None, since=None, until=None, after_id=None, page_size=50):
+    """Keyset-paginated activity log listing, newest first. Returns (logs, next_cursor).
+
+    `username` is a prefix match, `action` an exact match and `since`/`until` bound `timestamp`.
+    Paging walks the primary key so every page is an index range scan regardless of table size.
+    Raises Error if the DB can't be read rather than returning an empty page.
+    """
+    clauses, params = [], []
+    if username:
+        clauses.append("username LIKE %s")
+        params.append(_like_prefix(username))
+    if action:
+        clauses.append("action = %s")
+        params.append(action)
+    if since:
+        clauses.append("timestamp >= %s")
+        params.append(since)
+    if until:
+        clauses.append("timestamp < %s")
+        params.append(until)
+    if after_id:
+        clauses.append("id < %s")
+        params.append(after_id)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    params.append(page_size + 1)
+
+    with transaction(readonly=True) as cursor:
+        cursor.execute(f"SELECT id, username, action, details, timestamp FROM activity_logs {where} ORDER BY id DESC LIMIT %s", tuple(params))
+        rows = cursor.fetchall()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = rows[-1][0]
+    return [_log_entry(row) for row in rows], next_cursor
+
+@instrumented
+def get_max_log_id():
+    """Highest activity_logs id (0 for an empty table): where a live tail starts. Raises Error
+    if the DB can't be read."""
+    with transaction(readonly=True) as cursor:
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM activity_logs")
+        return cursor.fetchone()[0]
+
+@instrumented
+def get_logs_since(after_id, limit=200):
+    """Activity rows with id > after_id, oldest first: the delta for a live tail.
+    A primary-key range scan, so each poll costs the same however large the table grows.
+    Raises Error if the DB can't be read."""
+    with transaction(readonly=True) as cursor:
+        cursor.execute("SELECT id, username, action, details, timestamp FROM activity_logs WHERE id > %s ORDER BY id LIMIT %s", (after_id, limit))
+        return [_log_entry(row) for row in cursor.fetchall()]
+
 # ==========================================
-# 5. LOGGING
+# 7. LOGGING
 # ==========================================
-def log_activity(username, action, details=""):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO activity_logs (username, action, details) VALUES (%s, %s, %s)", (username, action, details))
-            conn.commit()
-            cursor.close()
-        finally:
-            conn.close()
+# The writers raise Error: @db_health.deferrable reports it to callers as a failed (None) write,
+# while a replay of a queued write sees it and keeps the write for the next attempt.
+def _insert_activity(username, action, details="", user_id=None):
+    """Queues an activity row on the open transaction (via the prepared insert)."""
+    execute_hot("insert_activity", (user_id, username, action, details))
 
-def log_prediction(username, prediction_val, role):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO predictions (username, prediction_value, role_predicted) VALUES (%s, %s, %s)", (username, prediction_val, role))
-            conn.commit()
-            cursor.close()
-            log_activity(username, "Prediction Generated", f"Role: {role}")
-        finally:
-            conn.close()
+@db_health.deferrable
+@instrumented
+def log_activity(username, action, details="", user_id=None):
+    with transaction():
+        _insert_activity(username, action, details, user_id)
 
-def log_feedback(username, job_role, predicted, actual, accuracy):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO feedback (username, job_role, predicted_salary, actual_salary, accuracy_rating) VALUES (%s, %s, %s, %s, %s)", (username, job_role, predicted, actual, accuracy))
-            conn.commit()
-            cursor.close()
-        finally:
-            conn.close()
+@db_health.deferrable
+@instrumented
+def log_prediction(username, prediction_val, role, salary_min=None, salary_max=None, salary_center=None,
+                   features=None, is_custom_role=False, user_id=None):
+    """Stores a prediction with its display string, typed salary range and the input features
+    (a runner.py input_row dict). Returns the new prediction id, or None on failure."""
+    features = features or {}
+    with transaction():
+        execute_hot("insert_prediction", (
+            user_id, username, prediction_val, role, salary_min, salary_max, salary_center,
+            features.get("District"), features.get("Company_Type"), features.get("Internship_Exp"),
+            features.get("CGPA"), features.get("College_Tier"), int(bool(is_custom_role)),
+        ))
+        prediction_id = _hot_lastrowid("insert_prediction")
+        _insert_activity(username, "Prediction Generated", f"Role: {role}", user_id)
+    with _history_lock:
+        cached = _history_cache.get(user_id)
+        if cached is not None:
+            entry = _history_entry(datetime.now(), role, prediction_val)
+            _history_cache[user_id] = ((entry,) + cached)[:HISTORY_LIMIT]
+    return prediction_id
 
-def log_job_application(username, role, source, status):
-    log_activity(username, "Job Click", f"{role} via {source} ({status})")
+@db_health.deferrable
+@instrumented
+def log_feedback(username, job_role, predicted, actual, accuracy, predicted_center=None, actual_offer=None,
+                 prediction_id=None, user_id=None):
+    with transaction() as cursor:
+        cursor.execute(
+            "INSERT INTO feedback (user_id, username, job_role, predicted_salary, actual_salary, accuracy_rating, "
+            "prediction_id, predicted_center, actual_offer) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            (user_id, username, job_role, predicted, actual, accuracy, prediction_id, predicted_center, actual_offer)
+        )
 
-def log_login(username, email):
-    conn = get_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO activity_logs (username, action, details) VALUES (%s, %s, %s)", (username, "Login", f"Email: {email}"))
+def log_job_application(username, role, source, status, user_id=None):
+    log_activity(username, "Job Click", f"{role} via {source} ({status})", user_id)
+
+@db_health.deferrable
+@instrumented
+def log_login(username, email, user_id=None):
+    with transaction() as cursor:
+        _insert_activity(username, "Login", f"Email: {email}", user_id)
+        if user_id is not None:
+            cursor.execute("UPDATE users SET last_login = NOW() WHERE id = %s", (user_id,))
+        else:
             cursor.execute("UPDATE users SET last_login = NOW() WHERE email = %s", (email,))
-            conn.commit()
-            cursor.close()
-        finally:
-            conn.close()
\ No newline at end of file
+    invalidate_user_cache(email=email)
+
+# ==========================================
+# 8. BULK IMPORT / EXPORT
+# ==========================================
+IMPORT_CHUNK = 500
+VALID_ROLES = ('user', 'admin')
+
+def _validate_import_row(row, seen_emails):
+    username = (row.get('username') or '').strip()
+    email = (row.get('email') or '').strip()
+    password = row.get('password') or ''
+    role = (row.get('role') or 'user').strip().lower()
+    if not username or not email or not password:
+        return None, "username, email and password are required"
+    if '@' not in email or '.' not in email.split('@')[-1]:
+        return None, "invalid email"
+    if role not in VALID_ROLES:
+        return None, f"role must be one of {', '.join(VALID_ROLES)}"
+    if _user_key(email) in seen_emails:
+        return None, "duplicate email in file"
+    seen_emails.add(_user_key(email))
+    return (username, email, password, role), None
+
+def _insert_user_chunk(chunk):
+    """Inserts one chunk in a single transaction with two executemany calls.
+    `chunk` holds (line, username, email, password_hash, role) tuples."""
+    with transaction() as cursor:
+        cursor.executemany(
+            "INSERT INTO users (username, email, password, role, is_verified) VALUES (%s, %s, %s, %s, 1)",
+            [(u, e, h, r) for _, u, e, h, r in chunk]
+        )
+        placeholders = ', '.join(['%s'] * len(chunk))
+        cursor.execute(
+            "INSERT INTO activity_logs (user_id, username, action, details) "
+            f"SELECT id, username, 'Account Created', CONCAT('Role: ', role, ' (bulk import)') FROM users WHERE email IN ({placeholders})",
+            [e for _, _, e, _, _ in chunk]
+        )
+
+@instrumented
+def bulk_create_users(rows, chunk_size=IMPORT_CHUNK, progress=None):
+    """Creates verified users from dicts with username/email/password/role keys.
+
+    Each chunk is one transaction using executemany. If a chunk fails, its rows are retried
+    one by one so the report pins the error to the offending row. `progress(done, total)` is
+    called after every chunk. Returns a list of {line, email, status, error} dicts.
+    """
+    report, valid, seen = [], [], set()
+    for line, row in enumerate(rows, start=2):  # line 1 is the CSV header
+        parsed, error = _validate_import_row(row, seen)
+        if error:
+            report.append({'line': line, 'email': row.get('email', ''), 'status': 'skipped', 'error': error})
+        else:
+            valid.append((line,) + parsed)
+
+    total = len(valid)
+    for start in range(0, total, chunk_size):
+        batch = valid[start:start + chunk_size]
+        # Emails already in the DB are reported up front instead of failing the whole chunk
+        try:
+            with transaction(readonly=True) as cursor:
+                placeholders = ', '.join(['%s'] * len(batch))
+                cursor.execute(f"SELECT email FROM users WHERE email IN ({placeholders})", [b[2] for b in batch])
+                existing = {_user_key(r[0]) for r in cursor.fetchall()}
+        except Error as e:
+            report.extend({'line': b[0], 'email': b[2], 'status': 'failed', 'error': str(e)} for b in batch)
+            continue
+        fresh = []
+        for line, username, email, password, role in batch:
+            if _user_key(email) in existing:
+                report.append({'line': line, 'email': email, 'status': 'skipped', 'error': 'email already registered'})
+            else:
+                fresh.append((line, username, email, password, role))
+        hashes = password_hasher.hash_passwords([b[3] for b in fresh])
+        chunk = [(line, u, e, h, r) for (line, u, e, _, r), h in zip(fresh, hashes)]
+
+        if chunk:
+            try:
+                _insert_user_chunk(chunk)
+                report.extend({'line': c[0], 'email': c[2], 'status': 'created', 'error': ''} for c in chunk)
+            except Error:
+                for c in chunk:
+                    try:
+                        _insert_user_chunk([c])
+                        report.append({'line': c[0], 'email': c[2], 'status': 'created', 'error': ''})
+                    except Error as e:
+                        report.append({'line': c[0], 'email': c[2], 'status': 'failed', 'error': str(e)})
+            for c in chunk:
+                invalidate_user_cache(email=c[2])
+        if progress:
+            progress(min(start + chunk_size, total), total)
+    return sorted(report, key=lambda r: r['line'])
+
+def iter_users(chunk_size=1000, **filters):
+    """Yields every matching user page by page via keyset pagination; memory stays at one page.
+    A DB error partway through propagates, so a truncated listing never looks complete."""
+    after_id = None
+    while True:
+        users, after_id = get_users_page(after_id=after_id, page_size=chunk_size, **filters)
+        if users:
+            yield users
+        if after_id is None:
+            break
+
+def export_users_csv(out, chunk_size=1000, **filters):
+    """Streams users as CSV into the text stream `out` one page at a time. Returns the row count.
+    Raises Error if the DB fails partway; `out` then holds a partial file the caller must discard.
+    Only the DB side is streamed: the Admin page reads the finished file into memory to offer it."""
+    writer = csv.DictWriter(out, fieldnames=['id', 'username', 'email', 'role', 'Joined', 'Last Login'])
+    writer.writeheader()
+    count = 0
+    for page in iter_users(chunk_size, **filters):
+        writer.writerows(page)
+        count += len(page)
+    return count
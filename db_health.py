@@ -0,0 +1,216 @@
+"""Background database health monitor.
+
+A daemon thread pings the primary every few seconds and keeps the app's view of the database
+current. It drives degraded mode:
+
+  healthy  - normal operation
+  slow     - reachable but round trips over slow_ms; log writes are queued instead of run inline
+  down     - unreachable; transactions fail fast, log writes are queued, Admin serves last-known data
+
+The state only changes after several probes in a row agree, so one blip doesn't flap it.
+Queued writes replay in order from the monitor thread once the database is healthy again.
+"""
+import functools
+import threading
+from collections import deque
+from datetime import datetime
+
+import streamlit as st
+from mysql.connector import DataError, Error, IntegrityError, NotSupportedError, ProgrammingError
+
+# ==========================================
+# 1. SETTINGS (Tunable from secrets.toml)
+# ==========================================
+# [health]
+# probe_seconds = 10        # probe interval while healthy ...
+# down_probe_seconds = 3    # ... and while slow or down, to notice recovery quickly
+# slow_ms = 1000            # a probe slower than this counts as slow
+# fail_after = 3            # consecutive bad probes before degrading
+# recover_after = 2         # consecutive good probes before leaving degraded mode
+# queue_size = 5000         # deferred writes kept while degraded (oldest dropped first)
+def _health_setting(key, default):
+    try:
+        return type(default)(st.secrets.get("health", {}).get(key, default))
+    except Exception:
+        return default
+
+PROBE_SECONDS = _health_setting("probe_seconds", 10.0)
+DOWN_PROBE_SECONDS = _health_setting("down_probe_seconds", 3.0)
+SLOW_MS = _health_setting("slow_ms", 1000.0)
+FAIL_AFTER = _health_setting("fail_after", 3)
+RECOVER_AFTER = _health_setting("recover_after", 2)
+QUEUE_SIZE = _health_setting("queue_size", 5000)
+
+HEALTHY, SLOW, DOWN, UNKNOWN = "healthy", "slow", "down", "unknown"
+
+# ==========================================
+# 2. STATE
+# ==========================================
+_lock = threading.Lock()
+_state = UNKNOWN
+_since = datetime.now()
+_streak = (None, 0)                 # (probe verdict, consecutive probes with it)
+_probes = deque(maxlen=360)         # recent probes, oldest first
+_transitions = deque(maxlen=50)     # state changes, newest first
+_deferred = deque(maxlen=QUEUE_SIZE)
+_dropped = 0
+_replayed = 0
+
+def state():
+    return _state
+
+def is_down():
+    return _state == DOWN
+
+def is_degraded():
+    return _state in (SLOW, DOWN)
+
+def _verdict(ok, latency_ms):
+    if not ok:
+        return DOWN
+    return SLOW if latency_ms > SLOW_MS else HEALTHY
+
+def record_probe(ok, latency_ms, error=""):
+    """Feeds one probe result into the state machine. Returns the (possibly new) state."""
+    global _state, _since, _streak
+    verdict = _verdict(ok, latency_ms)
+    with _lock:
+        _probes.append({
+            "Time": datetime.now(),
+            "OK": ok,
+            "Latency ms": round(latency_ms, 1) if ok else None,
+            "Error": error,
+        })
+        last, count = _streak
+        _streak = (verdict, count + 1 if verdict == last else 1)
+        needed = RECOVER_AFTER if verdict == HEALTHY else FAIL_AFTER
+        # First probe sets the state outright; after that a change needs a run of agreeing probes
+        if verdict != _state and (_state == UNKNOWN or _streak[1] >= needed):
+            _transitions.appendleft({"Time": datetime.now(), "From": _state, "To": verdict, "Detail": error})
+            print(f"DB Health: {_state} -> {verdict}")
+            _state, _since = verdict, datetime.now()
+        return _state
+
+# ==========================================
+# 3. DEFERRED WRITES
+# ==========================================
+def defer(fn, *args, **kwargs):
+    """Queues a write to replay after recovery. Oldest entries drop once the queue is full."""
+    global _dropped
+    with _lock:
+        if len(_deferred) == _deferred.maxlen:
+            _dropped += 1
+        _deferred.append((fn, args, kwargs))
+
+# Errors the server raises for the statement itself: retrying the write can never succeed
+REJECTED = (DataError, IntegrityError, NotSupportedError, ProgrammingError)
+
+def replay_deferred():
+    """Runs queued writes in order until the queue is empty or the database degrades again.
+    A write that fails because the database dropped out goes back to the front of the queue."""
+    global _replayed, _dropped
+    while not is_degraded():
+        with _lock:
+            if not _deferred:
+                return
+            item = _deferred.popleft()
+        fn, args, kwargs = item
+        try:
+            fn(*args, **kwargs)
+        except REJECTED as e:
+            print(f"Deferred Write Rejected: {e}")
+            _dropped += 1
+            continue
+        except Error as e:
+            print(f"Deferred Write Error: {e}")
+            with _lock:
+                if len(_deferred) == _deferred.maxlen:
+                    _dropped += 1
+                _deferred.appendleft(item)
+            return
+        _replayed += 1
+
+def deferrable(fn):
+    """Decorator for fire-and-forget writes (activity, prediction and feedback logging): while the
+    database is degraded the call is queued and returns None instead of blocking the page.
+    fn raises Error on failure; callers get None, a replay (which calls fn directly) retries it."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if is_degraded():
+            defer(fn, *args, **kwargs)
+            return None
+        try:
+            return fn(*args, **kwargs)
+        except Error as e:
+            print(f"Log Error: {e}")
+            return None
+    return wrapper
+
+# ==========================================
+# 4. MONITOR THREAD
+# ==========================================
+def probe_once():
+    import db_handler
+    try:
+        latency_ms = db_handler.ping_primary()
+    except Error as e:
+        return record_probe(False, 0.0, str(e))
+    if latency_ms is None:
+        # Pool exhausted by real traffic: the database is clearly answering, skip this sample
+        return _state
+    previous = _state
+    current = record_probe(True, latency_ms)
+    if previous == DOWN and current != DOWN:
+        # The server may have restarted: revalidate pooled connections before traffic resumes
+        db_handler.invalidate_idle_connections()
+    return current
+
+@st.cache_resource
+def start_monitor():
+    """Starts one probing daemon thread per server process."""
+    stop = threading.Event()
+
+    def run():
+        import db_handler
+        while True:
+            try:
+                # Probes and replays use the background pool, never a page request's connection
+                with db_handler.background_work():
+                    current = probe_once()
+                    if current == HEALTHY and _deferred:
+                        replay_deferred()
+            except Exception as e:
+                print(f"DB Health Error: {e}")
+            if stop.wait(PROBE_SECONDS if _state == HEALTHY else DOWN_PROBE_SECONDS):
+                return
+
+    threading.Thread(target=run, name="db-health", daemon=True).start()
+    return stop
+
+# ==========================================
+# 5. REPORTING
+# ==========================================
+def status():
+    """Current state plus probe statistics over the recent window, for the Admin page."""
+    with _lock:
+        probes = list(_probes)
+        queued = len(_deferred)
+    latencies = sorted(p["Latency ms"] for p in probes if p["OK"])
+    return {
+        "state": _state,
+        "since": _since,
+        "last_latency_ms": probes[-1]["Latency ms"] if probes else None,
+        "p95_latency_ms": latencies[int(0.95 * (len(latencies) - 1))] if latencies else None,
+        "availability": 100.0 * sum(p["OK"] for p in probes) / len(probes) if probes else None,
+        "queued": queued,
+        "dropped": _dropped,
+        "replayed": _replayed,
+    }
+
+def probe_history():
+    with _lock:
+        return list(_probes)
+
+def transitions():
+    with _lock:
+        return list(_transitions)
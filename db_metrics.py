@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import streamlit as st
+
+# ==========================================
+# 1. SETTINGS
+# ==========================================
+# [metrics]
+# slow_query_ms = 200
+# slow_query_log = "logs/slow_queries.log"
+def _metrics_setting(key, default):
+    try:
+        return type(default)(st.secrets.get("metrics", {}).get(key, default))
+    except Exception:
+        return default
+
+SLOW_QUERY_MS = _metrics_setting("slow_query_ms", 200.0)
+SLOW_QUERY_LOG = _metrics_setting("slow_query_log", os.path.join("logs", "slow_queries.log"))
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf"))
+
+# ==========================================
+# 2. IN-MEMORY HISTOGRAMS
+# ==========================================
+class _Histogram:
+    __slots__ = ("counts", "total", "n", "max")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+        self.total = 0.0
+        self.n = 0
+        self.max = 0.0
+
+    def add(self, ms):
+        for i, upper in enumerate(BUCKETS_MS):
+            if ms <= upper:
+                self.counts[i] += 1
+                break
+        self.total += ms
+        self.n += 1
+        self.max = max(self.max, ms)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (bucketed, so approximate), capped
+        at the slowest call seen so the overflow bucket reports that instead of inf."""
+        if not self.n:
+            return 0.0
+        target = q * self.n
+        seen = 0
+        for count, upper in zip(self.counts, BUCKETS_MS):
+            seen += count
+            if seen >= target:
+                return round(min(upper, self.max), 1)
+        return round(self.max, 1)
+
+    def mean(self):
+        return self.total / self.n if self.n else 0.0
+
+class _StatementStats:
+    __slots__ = ("calls", "errors", "rows", "exec_ms", "wait_ms")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.exec_ms = _Histogram()
+        self.wait_ms = _Histogram()
+
+_stats = {}
+_slow = deque(maxlen=200)
+_lock = threading.Lock()
+
+def _get(name):
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = _StatementStats()
+    return stats
+
+# ==========================================
+# 3. RECORDING
+# ==========================================
+def record_wait(name, wait_ms):
+    """Time spent waiting for a pooled connection (includes any reconnect)."""
+    with _lock:
+        _get(name).wait_ms.add(wait_ms)
+
+def record_query(name, exec_ms, rows=0, sql="", error=False):
+    with _lock:
+        stats = _get(name)
+        stats.calls += 1
+        stats.rows += max(rows or 0, 0)
+        stats.exec_ms.add(exec_ms)
+        if error:
+            stats.errors += 1
+    if exec_ms >= SLOW_QUERY_MS:
+        _log_slow(name, exec_ms, rows, sql, error)
+
+def _log_slow(name, exec_ms, rows, sql, error):
+    entry = {
+        "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "statement": name,
+        "ms": round(exec_ms, 1),
+        "rows": rows,
+        "error": error,
+        "sql": " ".join(sql.split())[:300],  # SQL text only, never parameter values
+    }
+    _slow.appendleft(entry)
+    try:
+        os.makedirs(os.path.dirname(SLOW_QUERY_LOG) or ".", exist_ok=True)
+        with open(SLOW_QUERY_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError as e:
+        print(f"Slow Query Log Error: {e}")
+
+class Timer:
+    """Context manager: `with Timer() as t: ...` then read t.ms."""
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self.ms = 0.0
+        return self
+
+    def __exit__(self, *exc):
+        self.ms = (time.perf_counter() - self._start) * 1000
+
+# ==========================================
+# 4. REPORTING
+# ==========================================
+def snapshot():
+    """One row per statement name, slowest p95 first."""
+    with _lock:
+        rows = [{
+            "Statement": name,
+            "Calls": s.calls,
+            "Errors": s.errors,
+            "Rows": s.rows,
+            "Avg ms": round(s.exec_ms.mean(), 1),
+            "p50 ms": s.exec_ms.percentile(0.50),
+            "p95 ms": s.exec_ms.percentile(0.95),
+            "p99 ms": s.exec_ms.percentile(0.99),
+            "Avg Pool Wait ms": round(s.wait_ms.mean(), 1),
+            "p95 Pool Wait ms": s.wait_ms.percentile(0.95),
+        } for name, s in _stats.items()]
+    return sorted(rows, key=lambda r: (r["p95 ms"], r["Avg ms"]), reverse=True)
+
+def slow_queries(limit=50):
+    with _lock:
+        return list(_slow)[:limit]
+
+def reset():
+    with _lock:
+        _stats.clear()
+        _slow.clear()
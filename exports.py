@@ -0,0 +1,202 @@
+"""Chunked CSV / Parquet export of the audit tables (activity_logs, predictions, feedback).
+
+Rows are read in keyset chunks of EXPORT_CHUNK ids, each in its own short read-only
+transaction (served by the replica when one is configured), and written straight to the output
+file. Memory stays at one chunk whatever the table size, and a pooled connection is never held
+for longer than one chunk, so a long export doesn't starve other sessions.
+
+The Admin page offers the finished file for download in the run that built it and then deletes it
+(Streamlit holds the bytes in memory until the next rerun); for very large ranges use the CLI.
+
+The id range is fixed when the export starts, so rows inserted meanwhile are left out and the
+file is a consistent cut. Rows already moved to the Parquet cold archive by log_retention.py
+are not in activity_logs any more.
+
+Usage:  python exports.py activity_logs --format parquet --since 2025-01-01 --until 2025-03-31
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from mysql.connector import Error
+
+import db_handler
+
+EXPORT_CHUNK = 20000
+FORMATS = {"csv": ".csv", "parquet": ".parquet"}
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "bcasprint_exports")
+EXPORT_TTL = 3600  # seconds before sweep_exports() deletes a leftover temp export
+
+# ==========================================
+# 1. TABLE DEFINITIONS
+# ==========================================
+# table -> (timestamp column used for the date filter, Arrow schema listing the exported columns)
+_MONEY = pa.decimal128(12, 2)
+EXPORTS = {
+    "activity_logs": ("timestamp", pa.schema([
+        ("id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("username", pa.string()),
+        ("action", pa.string()),
+        ("details", pa.string()),
+        ("timestamp", pa.timestamp("s")),
+    ])),
+    "predictions": ("created_at", pa.schema([
+        ("id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("username", pa.string()),
+        ("prediction_value", pa.string()),
+        ("role_predicted", pa.string()),
+        ("salary_min", _MONEY),
+        ("salary_max", _MONEY),
+        ("salary_center", _MONEY),
+        ("district", pa.string()),
+        ("company_type", pa.string()),
+        ("internship_exp", pa.string()),
+        ("cgpa_range", pa.string()),
+        ("college_tier", pa.string()),
+        ("is_custom_role", pa.int8()),
+        ("created_at", pa.timestamp("s")),
+    ])),
+    "feedback": ("created_at", pa.schema([
+        ("id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("username", pa.string()),
+        ("job_role", pa.string()),
+        ("predicted_salary", pa.string()),
+        ("actual_salary", pa.string()),
+        ("accuracy_rating", pa.string()),
+        ("prediction_id", pa.int64()),
+        ("predicted_center", _MONEY),
+        ("actual_offer", _MONEY),
+        ("created_at", pa.timestamp("s")),
+    ])),
+}
+
+# ==========================================
+# 2. CHUNKED READS
+# ==========================================
+def _date_filter(time_column, since, until):
+    """SQL and params for since <= day <= until (either bound optional, both dates)."""
+    clauses, params = [], []
+    if since:
+        clauses.append(f"{time_column} >= %s")
+        params.append(since)
+    if until:
+        clauses.append(f"{time_column} < %s")
+        params.append(until + timedelta(days=1))
+    return clauses, params
+
+def _id_range(table, clauses, params):
+    # MIN/MAX over the created-at index (which carries the primary key) rather than the rows
+    with db_handler.transaction(readonly=True) as cursor:
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor.execute(f"SELECT MIN(id), MAX(id) FROM {table} {where}", tuple(params))
+        return cursor.fetchone()
+
+def iter_export_chunks(table, since=None, until=None, chunk_size=EXPORT_CHUNK, progress=None):
+    """Yields lists of row tuples (columns as in EXPORTS[table]) in id order.
+    progress(fraction) is called after each chunk."""
+    time_column, schema = EXPORTS[table]
+    clauses, params = _date_filter(time_column, since, until)
+    first_id, last_id = _id_range(table, clauses, params)
+    if first_id is None:
+        return
+    columns = ", ".join(f"`{name}`" for name in schema.names)
+    sql = (f"SELECT {columns} FROM {table} WHERE {' AND '.join(clauses + ['id > %s', 'id <= %s'])} "
+           "ORDER BY id LIMIT %s")
+    after_id, span = first_id - 1, max(last_id - first_id + 1, 1)
+    while after_id < last_id:
+        with db_handler.transaction(readonly=True) as cursor:
+            cursor.execute(sql, tuple(params) + (after_id, last_id, chunk_size))
+            rows = cursor.fetchall()
+        if not rows:
+            break
+        yield rows
+        after_id = rows[-1][0]
+        if progress:
+            progress(min((after_id - first_id + 1) / span, 1.0))
+
+# ==========================================
+# 3. WRITERS
+# ==========================================
+def write_csv(path, table, **filters):
+    """Streams the table into a CSV file. Returns the row count."""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORTS[table][1].names)
+        for rows in iter_export_chunks(table, **filters):
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+def write_parquet(path, table, **filters):
+    """Streams the table into a zstd-compressed Parquet file, one row group per chunk."""
+    schema = EXPORTS[table][1]
+    count = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for rows in iter_export_chunks(table, **filters):
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays([pa.array(c, type=f.type) for c, f in zip(columns, schema)], schema=schema))
+            count += len(rows)
+    return count
+
+WRITERS = {"csv": write_csv, "parquet": write_parquet}
+
+def export_table(table, fmt="csv", path=None, since=None, until=None, progress=None):
+    """Writes one export file (a new file in EXPORT_DIR unless `path` is given). Returns (path, rows).
+    The caller deletes a temp file once it has been handed over."""
+    if path is None:
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        handle, path = tempfile.mkstemp(prefix=f"{table}_", suffix=FORMATS[fmt], dir=EXPORT_DIR)
+        os.close(handle)
+    try:
+        count = WRITERS[fmt](path, table, since=since, until=until, progress=progress)
+    except Exception:
+        os.remove(path)
+        raise
+    return path, count
+
+def sweep_exports(max_age=EXPORT_TTL):
+    """Deletes temp exports older than max_age seconds. Returns how many were removed."""
+    removed = 0
+    cutoff = time.time() - max_age
+    try:
+        names = os.listdir(EXPORT_DIR)
+    except OSError:
+        return 0
+    for name in names:
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass  # Already gone, or still being written by another session
+    return removed
+
+def export_filename(table, fmt, since=None, until=None):
+    span = f"_{since or 'start'}_to_{until or date.today()}" if since or until else ""
+    return f"bcasprint_{table}{span}{FORMATS[fmt]}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export BCAsprint audit tables")
+    parser.add_argument("table", choices=sorted(EXPORTS))
+    parser.add_argument("--format", choices=sorted(FORMATS), default="csv")
+    parser.add_argument("--since", type=date.fromisoformat, help="first day included (YYYY-MM-DD)")
+    parser.add_argument("--until", type=date.fromisoformat, help="last day included (YYYY-MM-DD)")
+    parser.add_argument("--out", help="output file (default: named after the table and range)")
+    args = parser.parse_args()
+    out = args.out or export_filename(args.table, args.format, args.since, args.until)
+    started = datetime.now()
+    try:
+        _, rows = export_table(args.table, args.format, out, args.since, args.until)
+        print(f"{rows} rows -> {out} in {(datetime.now() - started).total_seconds():.1f}s")
+    except Error as e:
+        print(f"Export Error: {e}")
@@ -0,0 +1,83 @@
+"""Local HTTP fixture serving company update feeds, for exercising company_updates.py offline.
+
+GET /feeds/<Company>.json answers after a per-company delay with a JSON list of updates and an
+ETag; a matching If-None-Match gets 304 Not Modified. Request and 304 counts are kept per path.
+
+Usage:  python fixture_server.py --port 8765 --delay 1.0
+        then set [company_updates.feeds] TCS = "http://127.0.0.1:8765/feeds/TCS.json" etc.
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+FEEDS = {
+    "TCS": [{"type": "🎓 BCA Alert", "message": "Smart Hiring for BCA batch open. Registration ends soon."}],
+    "Infosys": [{"type": "🎯 Hiring", "message": "Operations Executive (BCA/B.Sc) drive live."}],
+    "Wipro": [{"type": "📢 WILP", "message": "Work Integrated Learning Program: applications open."}],
+    "HCL": [{"type": "⚡ TechBee", "message": "Early Career Program for Science grads open."}],
+    "Capgemini": [{"type": "🚀 Exceller", "message": "BCA/B.Sc hiring drive scheduled. Check eligibility."}],
+    "Cognizant": [{"type": "📢 GenC", "message": "GenC (Non-Engineering) registration closing soon."}],
+    "Accenture": [{"type": "🧭 ASE", "message": "Associate Software Engineer off-campus window open."}],
+    "IBM": [],
+}
+
+def delays(max_delay):
+    """Spreads delays evenly up to max_delay, so the slowest feed is easy to tell from the sum."""
+    companies = sorted(FEEDS)
+    return {company: max_delay * (i + 1) / len(companies) for i, company in enumerate(companies)}
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.hits[self.path] += 1
+        name = unquote(self.path.rsplit("/", 1)[-1])
+        company = name[:-len(".json")] if self.path.startswith("/feeds/") and name.endswith(".json") else None
+        if company not in FEEDS:
+            self.send_error(404)
+            return
+        time.sleep(self.server.delays.get(company, 0))
+        body = json.dumps(FEEDS[company]).encode()
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.server.not_modified[self.path] += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start(port=0, max_delay=1.0):
+    """Starts the fixture on a daemon thread. Returns (server, base_url); server.hits counts
+    requests and server.not_modified the 304 answers, per path."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FeedHandler)
+    server.daemon_threads = True
+    server.delays = delays(max_delay)
+    server.hits = Counter()
+    server.not_modified = Counter()
+    threading.Thread(target=server.serve_forever, name="fixture-feeds", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve fixture company update feeds")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=1.0, help="slowest feed delay in seconds")
+    args = parser.parse_args()
+    server, base_url = start(args.port, args.delay)
+    print(f"Serving {len(FEEDS)} feeds at {base_url}/feeds/<Company>.json (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -289,7 +289,7 @@ def show_home():
 
         # FETCH USER HISTORY FROM DATABASE
         # This returns a list of tuples: (DateStr, Role, PredictionDetails)
-        user_history = db_handler.get_user_history(current_username)
+        user_history = db_handler.get_user_history(user_info.get('id'))
 
         # 1. DYNAMIC "LATEST INSIGHT" CARD
         if user_history:
@@ -0,0 +1,336 @@
+"""Synthetic data generator for load-testing db_handler reads and the Admin dashboards.
+
+Point it at a throwaway database (its [mysql] secrets), never at production:
+    python loadgen.py --users 1000000 --logs 50000000 --seed 7 --until 2026-01-01
+    python loadgen.py --report-only
+
+Rows are generated in time order (ids grow with timestamps, as in real traffic) from a seeded
+RNG, so the same arguments always produce the same data. New rows get ids after the current
+maximum, and synthetic accounts use the @loadtest.example email domain.
+"""
+import argparse
+import bisect
+import heapq
+import math
+import random
+import statistics
+import time
+from array import array
+from datetime import datetime, timedelta
+
+from mysql.connector import Error
+
+import db_handler
+import password_hasher
+
+LOAD_CHUNK = 5000
+EMAIL_DOMAIN = "loadtest.example"
+
+# ==========================================
+# 1. DISTRIBUTIONS
+# ==========================================
+FIRST_NAMES = ["Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Diya", "Ishaan", "Kavya", "Mihir", "Neha",
+               "Omkar", "Pooja", "Rahul", "Riya", "Rohan", "Sakshi", "Sanket", "Shreya", "Tanvi", "Vedant"]
+LAST_NAMES = ["Patil", "Deshmukh", "Joshi", "Kulkarni", "Pawar", "Shinde", "Jadhav", "More", "Gaikwad", "Chavan",
+              "Kale", "Bhosale", "Sawant", "Naik", "Mehta", "Shah", "Iyer", "Nair", "Garud", "Rao"]
+JOB_ROLES = [  # (role, base salary)
+    ("Software Developer - Graduate Engineer Trainee (GET)", 380000),
+    ("IT Support Specialist - Service Desk Analyst", 260000),
+    ("Data Analyst - Associate", 420000),
+    ("QA Engineer - Trainee", 320000),
+    ("Web Developer - Junior", 300000),
+    ("Cloud Engineer - Associate", 480000),
+]
+DISTRICTS = [("Pune", 40), ("Mumbai Suburban", 25), ("Thane", 20), ("Other", 15)]
+COMPANY_TYPES = [("Service-Based MNC", 45), ("Mid-Sized Indian Co.", 20), ("Startup", 20), ("Product-Based MNC", 10), ("Other", 5)]
+INTERNSHIPS = [("None", 40), ("< 6 months", 30), ("6-12 months", 20), ("> 1 year", 10)]
+CGPA_RANGES = [("< 7.0", 25), ("7.0-7.9", 35), ("8.0-8.9", 30), ("9.0+", 10)]
+COLLEGE_TIERS = [("Tier-3", 50), ("Tier-2", 35), ("Tier-1", 15)]
+TIER_FACTOR = {"Tier-1": 1.35, "Tier-2": 1.1, "Tier-3": 1.0}
+CGPA_FACTOR = {"< 7.0": 0.9, "7.0-7.9": 1.0, "8.0-8.9": 1.1, "9.0+": 1.2}
+# An "Account Created" row is written at each signup; these fill the rest of the log
+LOG_ACTIONS = [("Login", 65), ("Prediction Generated", 20), ("Job Click", 10), ("Password Reset", 5)]
+
+def _weighted(choices):
+    values, weights = zip(*choices)
+    cumulative = []
+    total = 0
+    for w in weights:
+        total += w
+        cumulative.append(total)
+    return values, cumulative
+
+def _pick(rng, table):
+    values, cumulative = table
+    return values[bisect.bisect(cumulative, rng.random() * cumulative[-1])]
+
+_DISTRICTS, _COMPANIES, _INTERNSHIPS, _CGPAS, _TIERS, _ACTIONS = map(
+    _weighted, (DISTRICTS, COMPANY_TYPES, INTERNSHIPS, CGPA_RANGES, COLLEGE_TIERS, LOG_ACTIONS)
+)
+
+def _stamp(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+# ==========================================
+# 2. GENERATOR
+# ==========================================
+class LoadGenerator:
+    """Streams users, predictions (+ feedback) and activity_logs rows into the database in LOAD_CHUNK batches."""
+
+    def __init__(self, seed, days, until):
+        self.seed = seed
+        self.end = until.timestamp()
+        self.start = (until - timedelta(days=days)).timestamp()
+        self.user_times = array("d")  # created_at of each generated user, ascending
+        self.user_names = array("H")  # FIRST_NAMES x LAST_NAMES index, to keep 1M+ users cheap in memory
+        self.admins = set()
+        self.user_offset = 0
+        self.timings = {}
+
+    def _rng(self, table):
+        return random.Random(f"{self.seed}:{table}")
+
+    def _next_id(self, table):
+        with db_handler.transaction(readonly=True, primary=True) as cursor:
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+            return cursor.fetchone()[0]
+
+    def _load(self, table, sql, rows, with_chunk=None):
+        """Multi-row INSERT per chunk (executemany batches VALUES lists), one transaction per chunk.
+        with_chunk(cursor) runs inside each chunk's transaction, for dependent rows of other tables."""
+        def write(chunk):
+            with db_handler.transaction() as cursor:
+                cursor.executemany(sql, chunk)
+                if with_chunk:
+                    with_chunk(cursor)
+
+        loaded = 0
+        started = time.perf_counter()
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == LOAD_CHUNK:
+                write(chunk)
+                loaded += len(chunk)
+                chunk = []
+                if loaded % (LOAD_CHUNK * 100) == 0:
+                    print(f"  {table}: {loaded:,} rows")
+        if chunk:
+            write(chunk)
+            loaded += len(chunk)
+        elapsed = time.perf_counter() - started
+        self.timings[table] = self.timings.get(table, 0.0) + elapsed
+        print(f"  {table}: {loaded:,} rows in {elapsed:.1f}s ({loaded / max(elapsed, 1e-9):,.0f} rows/s)")
+        return loaded
+
+    def _name(self, idx):
+        first, last = divmod(self.user_names[idx], len(LAST_NAMES))
+        return f"{FIRST_NAMES[first]} {LAST_NAMES[last]}"
+
+    def _email(self, idx):
+        # Keyed by the row's id, not its index in this run, so a second run appends new addresses
+        return f"{FIRST_NAMES[self.user_names[idx] // len(LAST_NAMES)].lower()}.{self.user_offset + idx}@{EMAIL_DOMAIN}"
+
+    def _user_at(self, rng, ts):
+        """A user who already existed at `ts`, biased toward recent signups (they are the most active)."""
+        existing = bisect.bisect_right(self.user_times, ts)
+        if not existing:
+            return None
+        return int(existing * math.sqrt(rng.random()))
+
+    # --- users -------------------------------------------------------------
+    def users(self, count):
+        rng = self._rng("users")
+        self.user_offset = self._next_id("users")
+        password = password_hasher.hash_password("loadtest-password")  # scrypt once, shared by every row
+        span = self.end - self.start
+
+        def rows():
+            for i in range(count):
+                # Signups accelerate over the window: the i-th user joins at sqrt(i / count) of it
+                created = self.start + span * math.sqrt(i / count)
+                self.user_times.append(created)
+                self.user_names.append(rng.randrange(len(FIRST_NAMES) * len(LAST_NAMES)))
+                role = "user"
+                if rng.random() < 0.001:
+                    role = "admin"
+                    self.admins.add(i)
+                verified = 1 if rng.random() < 0.9 else 0
+                last_login = _stamp(rng.uniform(created, self.end)) if verified and rng.random() < 0.7 else None
+                yield (self.user_offset + i, self._name(i), self._email(i), password, role,
+                       verified, _stamp(created), last_login)
+
+        return self._load("users",
+                          "INSERT INTO users (id, username, email, password, role, is_verified, created_at, last_login) "
+                          "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)", rows())
+
+    # --- predictions + feedback -------------------------------------------
+    def predictions(self, count, feedback_ratio):
+        rng = self._rng("predictions")
+        first_id = self._next_id("predictions")
+        span = self.end - self.start
+        # Feedback arrives up to a day after its prediction. Rows wait in a heap until the
+        # predictions pass their created_at and are then written with that chunk, so feedback ids
+        # stay in time order while at most about a day of feedback is held in memory.
+        pending = []     # (created_at ts, prediction_id, row)
+        reached = [0.0]  # created_at of the newest prediction generated so far
+        written = [0]
+
+        def write_feedback(cursor, until=math.inf):
+            due = []
+            while pending and pending[0][0] <= until:
+                due.append(heapq.heappop(pending)[2])
+            if due:
+                cursor.executemany(
+                    "INSERT INTO feedback (user_id, username, job_role, predicted_salary, actual_salary, accuracy_rating, "
+                    "prediction_id, predicted_center, actual_offer, created_at) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)", due)
+                written[0] += len(due)
+
+        def rows():
+            for i in range(count):
+                ts = self.start + span * (i + rng.random()) / count
+                reached[0] = ts
+                idx = self._user_at(rng, ts)
+                if idx is None:
+                    continue
+                role, base = rng.choice(JOB_ROLES)
+                tier, cgpa = _pick(rng, _TIERS), _pick(rng, _CGPAS)
+                center = round(base * TIER_FACTOR[tier] * CGPA_FACTOR[cgpa] * rng.lognormvariate(0, 0.15), -3)
+                low, high = round(center * 0.85, 2), round(center * 1.15, 2)
+                value = f"₹ {low:,.0f} - {high:,.0f} (Center: {center:,.0f})"
+                prediction_id = first_id + i
+                if rng.random() < feedback_ratio:
+                    actual = round(center * rng.normalvariate(1.0, 0.18), -3)
+                    error = abs(actual - center) / center
+                    rating = "High" if error < 0.1 else "Good" if error < 0.25 else "Low"
+                    created = min(ts + rng.uniform(60, 86400), self.end)
+                    heapq.heappush(pending, (created, prediction_id, (
+                        self.user_offset + idx, self._name(idx), role, str(int(center)), str(int(actual)),
+                        rating, prediction_id, center, actual, _stamp(created))))
+                yield (prediction_id, self.user_offset + idx, self._name(idx), value, role, low, high, center,
+                       _pick(rng, _DISTRICTS), _pick(rng, _COMPANIES), _pick(rng, _INTERNSHIPS), cgpa, tier,
+                       1 if rng.random() < 0.05 else 0, _stamp(ts))
+
+        loaded = self._load(
+            "predictions",
+            "INSERT INTO predictions (id, user_id, username, prediction_value, role_predicted, salary_min, salary_max, "
+            "salary_center, district, company_type, internship_exp, cgpa_range, college_tier, is_custom_role, created_at) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)", rows(),
+            with_chunk=lambda cursor: write_feedback(cursor, reached[0]))
+        with db_handler.transaction() as cursor:
+            write_feedback(cursor)  # the tail dated after the last prediction
+        print(f"  feedback: {written[0]:,} rows (written with the predictions)")
+        return loaded
+
+    # --- activity_logs -----------------------------------------------------
+    def _signup(self, idx):
+        role = "admin" if idx in self.admins else "user"
+        return (self.user_offset + idx, self._name(idx), "Account Created", f"Role: {role}", _stamp(self.user_times[idx]))
+
+    def logs(self, count):
+        rng = self._rng("activity_logs")
+        span = self.end - self.start
+
+        def rows():
+            signed_up = 0
+            for i in range(count):
+                ts = self.start + span * (i + rng.random()) / count
+                # Interleave each account's signup row at its created_at so ids stay in time order
+                while signed_up < len(self.user_times) and self.user_times[signed_up] <= ts:
+                    yield self._signup(signed_up)
+                    signed_up += 1
+                idx = self._user_at(rng, ts)
+                if idx is None:
+                    continue
+                action = _pick(rng, _ACTIONS)
+                if action == "Login":
+                    details = f"Email: {self._email(idx)}"
+                elif action == "Prediction Generated":
+                    details = f"Role: {rng.choice(JOB_ROLES)[0]}"
+                elif action == "Job Click":
+                    details = f"{rng.choice(JOB_ROLES)[0]} via External (Applied)"
+                else:
+                    details = "Success"
+                yield (self.user_offset + idx, self._name(idx), action, details, _stamp(ts))
+            for idx in range(signed_up, len(self.user_times)):
+                yield self._signup(idx)
+
+        return self._load(
+            "activity_logs",
+            "INSERT INTO activity_logs (user_id, username, action, details, timestamp) VALUES (%s, %s, %s, %s, %s)",
+            rows())
+
+# ==========================================
+# 3. READ TIMINGS
+# ==========================================
+def _time_call(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def read_timings(repeat=5, seed=0):
+    """Times each db_handler read at the current table sizes (caches bypassed). Returns rows for printing."""
+    rng = random.Random(seed)
+    with db_handler.transaction(readonly=True) as cursor:
+        counts = {}
+        for table in ("users", "predictions", "activity_logs", "feedback"):
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            counts[table] = cursor.fetchone()[0]
+        cursor.execute("SELECT MIN(id), MAX(id) FROM users")
+        low, high = cursor.fetchone()
+    user_ids = [rng.randint(low or 1, high or 1) for _ in range(repeat)]
+    _, second_page = db_handler.get_users_page(page_size=50)
+    cases = [
+        ("get_all_users", db_handler.get_all_users),
+        ("get_recent_logs(50)", lambda: db_handler.get_recent_logs(50)),
+        ("get_dashboard_kpis", db_handler.get_dashboard_kpis),
+        ("get_user_history", lambda: db_handler._fetch_user_history(user_ids[rng.randrange(repeat)])),
+        ("get_users_page (first)", lambda: db_handler.get_users_page(page_size=50)),
+        ("get_users_page (next)", lambda: db_handler.get_users_page(after_id=second_page, page_size=50)),
+        ("get_users_page (search)", lambda: db_handler.get_users_page(search="Riya", page_size=50)),
+        ("get_logs_page (first)", lambda: db_handler.get_logs_page(page_size=50)),
+        ("get_logs_page (action)", lambda: db_handler.get_logs_page(action="Login", page_size=50)),
+    ]
+    report = []
+    for name, fn in cases:
+        samples = _time_call(fn, repeat)
+        report.append({"read": name, "min_ms": min(samples), "median_ms": statistics.median(samples), "max_ms": max(samples)})
+    return counts, report
+
+def print_timings(counts, report):
+    print("Table sizes: " + ", ".join(f"{t}={n:,}" for t, n in counts.items()))
+    print(f"{'read':<26} {'min ms':>10} {'median ms':>10} {'max ms':>10}")
+    for row in report:
+        print(f"{row['read']:<26} {row['min_ms']:>10.1f} {row['median_ms']:>10.1f} {row['max_ms']:>10.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--predictions", type=int, default=None, help="default: 3 per user")
+    parser.add_argument("--logs", type=int, default=None, help="default: 50 per user")
+    parser.add_argument("--feedback-ratio", type=float, default=0.15, help="share of predictions that get feedback")
+    parser.add_argument("--days", type=int, default=365, help="time window the rows are spread over")
+    parser.add_argument("--until", type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+                        default=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0),
+                        help="end of the window (YYYY-MM-DD); pin it for reproducible timestamps")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per read function")
+    parser.add_argument("--report-only", action="store_true", help="skip generation, only time the reads")
+    args = parser.parse_args()
+
+    db_handler.create_table()
+    try:
+        if not args.report_only:
+            gen = LoadGenerator(args.seed, args.days, args.until)
+            print(f"Generating with seed {args.seed}")
+            gen.users(args.users)
+            gen.predictions(args.predictions if args.predictions is not None else args.users * 3, args.feedback_ratio)
+            gen.logs(args.logs if args.logs is not None else args.users * 50)
+            print("Load time: " + ", ".join(f"{t}={s:.1f}s" for t, s in gen.timings.items()))
+        print_timings(*read_timings(args.repeat, args.seed))
+    except Error as e:
+        print(f"Load Generator Error: {e}")
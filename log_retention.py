@@ -0,0 +1,170 @@
+"""Monthly partitioning, retention and cold archive for activity_logs.
+
+Run from cron (e.g. nightly):  python log_retention.py --days 90
+"""
+import argparse
+import os
+from datetime import date, datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from mysql.connector import Error
+
+import db_handler
+
+ARCHIVE_DIR = os.path.join("archive", "activity_logs")
+ARCHIVE_CHUNK = 50000
+MONTHS_AHEAD = 3
+LOG_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("user_id", pa.int64()),
+    ("username", pa.string()),
+    ("action", pa.string()),
+    ("details", pa.string()),
+    ("timestamp", pa.timestamp("s")),
+])
+
+# ==========================================
+# 1. PARTITION HELPERS
+# ==========================================
+def _month_start(d):
+    return date(d.year, d.month, 1)
+
+def _add_months(d, months):
+    month = d.month - 1 + months
+    return date(d.year + month // 12, month % 12 + 1, 1)
+
+def _partition_name(month):
+    return f"p{month:%Y%m}"
+
+def _partition_clause(month):
+    upper = _add_months(month, 1)
+    return f"PARTITION {_partition_name(month)} VALUES LESS THAN (UNIX_TIMESTAMP('{upper:%Y-%m-%d}'))"
+
+def get_partitions():
+    """Returns the monthly partition names of activity_logs, oldest first (empty if unpartitioned)."""
+    # Maintenance always reads the primary: a lagging replica could hide a partition we are about to drop
+    with db_handler.transaction(readonly=True, primary=True) as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'activity_logs' AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+# ==========================================
+# 2. PARTITION MAINTENANCE
+# ==========================================
+def ensure_log_partitions(months_ahead=MONTHS_AHEAD):
+    """Partitions activity_logs by month on first run, then keeps `months_ahead` empty months ready.
+
+    MySQL requires the partition column in every unique key, so the first run widens the
+    primary key to (id, timestamp). That rebuild is a one-off copy of the table.
+    """
+    partitions = get_partitions()
+    this_month = _month_start(datetime.now())
+    wanted_until = _add_months(this_month, months_ahead)
+
+    if not partitions:
+        with db_handler.transaction(readonly=True, primary=True) as cursor:
+            cursor.execute("SELECT MIN(timestamp) FROM activity_logs")
+            oldest = cursor.fetchone()[0]
+        month = _month_start(oldest) if oldest else this_month
+        clauses = []
+        while month <= wanted_until:
+            clauses.append(_partition_clause(month))
+            month = _add_months(month, 1)
+        clauses.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+        with db_handler.transaction() as cursor:
+            cursor.execute("ALTER TABLE activity_logs MODIFY timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP")
+            cursor.execute("ALTER TABLE activity_logs DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+            cursor.execute(
+                "ALTER TABLE activity_logs PARTITION BY RANGE (UNIX_TIMESTAMP(timestamp)) ("
+                + ", ".join(clauses) + ")"
+            )
+        print(f"Partitioned activity_logs into {len(clauses)} partitions")
+        return
+
+    # Split future months off the catch-all partition
+    monthly = [p for p in partitions if p != "pmax"]
+    newest = datetime.strptime(monthly[-1][1:], "%Y%m").date() if monthly else _add_months(this_month, -1)
+    month = _add_months(newest, 1)
+    clauses = []
+    while month <= wanted_until:
+        clauses.append(_partition_clause(month))
+        month = _add_months(month, 1)
+    if clauses:
+        with db_handler.transaction() as cursor:
+            cursor.execute(
+                "ALTER TABLE activity_logs REORGANIZE PARTITION pmax INTO ("
+                + ", ".join(clauses) + ", PARTITION pmax VALUES LESS THAN MAXVALUE)"
+            )
+        print(f"Added {len(clauses)} activity_logs partitions")
+
+# ==========================================
+# 3. RETENTION + COLD ARCHIVE
+# ==========================================
+def _export_partition(partition, path):
+    """Streams one partition into a zstd-compressed Parquet file in keyset chunks."""
+    tmp_path = path + ".tmp"
+    rows_written = 0
+    last_id = 0
+    with pq.ParquetWriter(tmp_path, LOG_SCHEMA, compression="zstd") as writer:
+        while True:
+            with db_handler.transaction(readonly=True, primary=True) as cursor:
+                cursor.execute(
+                    f"SELECT id, user_id, username, action, details, timestamp FROM activity_logs PARTITION ({partition}) "
+                    "WHERE id > %s ORDER BY id LIMIT %s", (last_id, ARCHIVE_CHUNK)
+                )
+                rows = cursor.fetchall()
+            if not rows:
+                break
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays([pa.array(c, type=f.type) for c, f in zip(columns, LOG_SCHEMA)], schema=LOG_SCHEMA))
+            rows_written += len(rows)
+            last_id = rows[-1][0]
+    os.replace(tmp_path, path)
+    return rows_written
+
+def archive_old_logs(retention_days=90, archive_dir=ARCHIVE_DIR):
+    """Moves every monthly partition that ended more than `retention_days` ago into
+    archive_dir/YYYY-MM.parquet, then drops it. A partition is dropped only after its file is written."""
+    os.makedirs(archive_dir, exist_ok=True)
+    cutoff = datetime.now().date().toordinal() - retention_days
+    archived = []
+    for partition in get_partitions():
+        if partition == "pmax":
+            continue
+        month = datetime.strptime(partition[1:], "%Y%m").date()
+        if _add_months(month, 1).toordinal() > cutoff:
+            break
+        path = os.path.join(archive_dir, f"{month:%Y-%m}.parquet")
+        count = _export_partition(partition, path)
+        with db_handler.transaction() as cursor:
+            cursor.execute(f"ALTER TABLE activity_logs DROP PARTITION {partition}")
+        archived.append((partition, count, path))
+        print(f"Archived {count} rows from {partition} -> {path}")
+    return archived
+
+def read_archived_logs(start=None, end=None, archive_dir=ARCHIVE_DIR):
+    """Loads archived logs between two dates (inclusive months) as a DataFrame for offline analysis."""
+    import pandas as pd
+    files = sorted(f for f in os.listdir(archive_dir) if f.endswith(".parquet")) if os.path.isdir(archive_dir) else []
+    if start:
+        files = [f for f in files if f[:7] >= f"{start:%Y-%m}"]
+    if end:
+        files = [f for f in files if f[:7] <= f"{end:%Y-%m}"]
+    if not files:
+        return pd.DataFrame(columns=LOG_SCHEMA.names)
+    return pd.concat([pd.read_parquet(os.path.join(archive_dir, f)) for f in files], ignore_index=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="activity_logs partition maintenance and retention")
+    parser.add_argument("--days", type=int, default=90, help="keep this many days in the hot table")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    args = parser.parse_args()
+    try:
+        ensure_log_partitions()
+        archive_old_logs(args.days, args.archive_dir)
+    except Error as e:
+        print(f"Retention Error: {e}")
@@ -0,0 +1,128 @@
+"""One-off data migrations. Schema changes themselves live in db_handler.create_table().
+
+Usage:  python migrations.py numeric
+        python migrations.py user_ids
+"""
+import argparse
+import re
+
+from mysql.connector import Error
+
+import db_handler
+
+BACKFILL_CHUNK = 1000
+
+# ==========================================
+# 1. NUMERIC PREDICTION / FEEDBACK COLUMNS
+# ==========================================
+# prediction_value looks like "₹ 180,000 - 250,000 (Center: 215,000)"
+_RANGE_RE = re.compile(r"([\d,]+(?:\.\d+)?)\s*-\s*(?:₹\s*)?([\d,]+(?:\.\d+)?)")
+_CENTER_RE = re.compile(r"Center:\s*([\d,]+(?:\.\d+)?)")
+
+def _number(text):
+    try:
+        return float(str(text).replace(",", "").replace("₹", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+def parse_prediction_value(value):
+    """Returns (salary_min, salary_max, salary_center) from the legacy display string."""
+    value = value or ""
+    found = _RANGE_RE.search(value)
+    salary_min, salary_max = (_number(found.group(1)), _number(found.group(2))) if found else (None, None)
+    center = _CENTER_RE.search(value)
+    salary_center = _number(center.group(1)) if center else None
+    if salary_center is None and salary_min is not None and salary_max is not None:
+        salary_center = (salary_min + salary_max) / 2
+    return salary_min, salary_max, salary_center
+
+def _backfill(select_sql, update_sql, convert, label):
+    """Walks rows needing a backfill by primary key and updates them one chunk per transaction."""
+    last_id, total = 0, 0
+    while True:
+        with db_handler.transaction(readonly=True, primary=True) as cursor:
+            cursor.execute(select_sql, (last_id, BACKFILL_CHUNK))
+            rows = cursor.fetchall()
+        if not rows:
+            break
+        updates = [convert(row) + (row[0],) for row in rows]
+        with db_handler.transaction() as cursor:
+            cursor.executemany(update_sql, updates)
+        last_id = rows[-1][0]
+        total += len(rows)
+        print(f"{label}: {total} rows backfilled")
+    return total
+
+def backfill_numeric_columns():
+    predictions = _backfill(
+        "SELECT id, prediction_value FROM predictions WHERE id > %s AND salary_center IS NULL "
+        "AND prediction_value IS NOT NULL ORDER BY id LIMIT %s",
+        "UPDATE predictions SET salary_min = %s, salary_max = %s, salary_center = %s WHERE id = %s",
+        lambda row: parse_prediction_value(row[1]),
+        "predictions",
+    )
+    feedback = _backfill(
+        "SELECT id, predicted_salary, actual_salary FROM feedback WHERE id > %s "
+        "AND (predicted_center IS NULL OR actual_offer IS NULL) ORDER BY id LIMIT %s",
+        "UPDATE feedback SET predicted_center = %s, actual_offer = %s WHERE id = %s",
+        lambda row: (_number(row[1]), _number(row[2])),
+        "feedback",
+    )
+    return predictions, feedback
+
+# ==========================================
+# 2. SURROGATE user_id KEYS
+# ==========================================
+# Older rows only carry the username string (activity rows written around signup carry the email).
+# Usernames are not unique, so duplicates resolve to the oldest account. Each users column is
+# matched in its own pass (idx_users_username, the email unique key) rather than one OR join,
+# which MySQL can't serve from either index and would scan users for every chunk.
+USER_ID_BACKFILLS = (
+    ("predictions", ("username",)),
+    ("feedback", ("username",)),
+    ("activity_logs", ("username", "email")),
+)
+
+def _backfill_user_id(table, columns):
+    # Each pass yields its first chunk of ids; an id missing from a pass's chunk is past the
+    # end of the merged chunk too, so the merged MIN(user_id) sees every match
+    passes = " UNION ALL ".join(
+        f"(SELECT p.id, MIN(u.id) AS user_id FROM {table} p JOIN users u ON u.{column} = p.username "
+        "WHERE p.id > %s AND p.user_id IS NULL GROUP BY p.id ORDER BY p.id LIMIT %s)"
+        for column in columns
+    )
+    last_id, total = 0, 0
+    while True:
+        with db_handler.transaction(readonly=True, primary=True) as cursor:
+            cursor.execute(
+                f"SELECT id, MIN(user_id) FROM ({passes}) m GROUP BY id ORDER BY id LIMIT %s",
+                (last_id, BACKFILL_CHUNK) * len(columns) + (BACKFILL_CHUNK,)
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            break
+        with db_handler.transaction() as cursor:
+            cursor.executemany(f"UPDATE {table} SET user_id = %s WHERE id = %s", [(uid, pid) for pid, uid in rows])
+        last_id = rows[-1][0]
+        total += len(rows)
+        print(f"{table}: {total} rows linked to users")
+    return total
+
+def backfill_user_ids():
+    """Fills user_id on rows written before the column existed. Rows whose user is gone stay NULL."""
+    return {table: _backfill_user_id(table, columns) for table, columns in USER_ID_BACKFILLS}
+
+MIGRATIONS = {
+    "numeric": backfill_numeric_columns,
+    "user_ids": backfill_user_ids,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BCAsprint data migrations")
+    parser.add_argument("name", choices=sorted(MIGRATIONS))
+    args = parser.parse_args()
+    db_handler.create_table()  # Make sure the target columns exist first
+    try:
+        MIGRATIONS[args.name]()
+    except Error as e:
+        print(f"Migration Error: {e}")
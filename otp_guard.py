@@ -0,0 +1,124 @@
+import secrets
+import threading
+import time
+import uuid
+
+import streamlit as st
+from cachetools import TTLCache
+
+# ==========================================
+# 1. SETTINGS (Tunable from secrets.toml)
+# ==========================================
+# [otp]
+# ttl_seconds = 600           # a code is valid this long after it is sent
+# send_per_email = 3          # burst of codes per address ...
+# send_email_refill = 120     # ... then one more every N seconds
+# send_per_client = 10        # burst of codes per browser/IP, across addresses
+# send_client_refill = 30
+# verify_per_email = 5        # wrong guesses allowed per address ...
+# verify_email_refill = 300   # ... then one more every N seconds
+# verify_per_client = 20
+# verify_client_refill = 15
+# persist = false             # also keep buckets in MySQL so limits survive restarts
+# trusted_proxies = 0         # reverse proxies in front of the app that append to X-Forwarded-For
+def _otp_setting(key, default):
+    try:
+        return type(default)(st.secrets.get("otp", {}).get(key, default))
+    except Exception:
+        return default
+
+OTP_TTL_SECONDS = _otp_setting("ttl_seconds", 600)
+PERSIST_BUCKETS = _otp_setting("persist", False)
+TRUSTED_PROXIES = _otp_setting("trusted_proxies", 0)
+
+# (capacity, seconds per token)
+LIMITS = {
+    "send:email": (_otp_setting("send_per_email", 3), _otp_setting("send_email_refill", 120.0)),
+    "send:client": (_otp_setting("send_per_client", 10), _otp_setting("send_client_refill", 30.0)),
+    "verify:email": (_otp_setting("verify_per_email", 5), _otp_setting("verify_email_refill", 300.0)),
+    "verify:client": (_otp_setting("verify_per_client", 20), _otp_setting("verify_client_refill", 15.0)),
+}
+
+# ==========================================
+# 2. TOKEN BUCKETS
+# ==========================================
+# Each key holds (tokens, last refill time). Buckets refill continuously; an idle bucket is
+# full again after capacity * refill seconds, so entries expire from the cache after a day.
+_buckets = TTLCache(maxsize=50000, ttl=86400)
+_lock = threading.Lock()
+
+def _current(key, capacity, refill, now, stored=None):
+    state = _buckets.get(key) or stored
+    if state is None:
+        return float(capacity)
+    tokens, updated = state
+    return min(float(capacity), tokens + (now - updated) / refill)
+
+def _load_persisted(keys):
+    """Persisted state of the buckets not held in memory. Runs outside _lock so one slow DB
+    round trip never holds up every other OTP request in the process."""
+    with _lock:
+        missing = [key for key in keys if _buckets.get(key) is None]
+    import db_handler
+    return {key: state for key in missing if (state := db_handler.load_rate_bucket(key)) is not None}
+
+def _take(checks):
+    """Takes one token from every (kind, identity) bucket, or from none of them.
+    Returns (allowed, seconds until the emptiest bucket has a token again)."""
+    now = time.time()
+    keys = [(kind, f"{kind}:{identity}") for kind, identity in checks]
+    stored = _load_persisted([key for _, key in keys]) if PERSIST_BUCKETS else {}
+    with _lock:
+        levels = []
+        for kind, key in keys:
+            capacity, refill = LIMITS[kind]
+            levels.append((key, refill, _current(key, capacity, refill, now, stored.get(key))))
+        short = [(1 - tokens) * refill for _, refill, tokens in levels if tokens < 1]
+        if short:
+            return False, max(short)
+        for key, _, tokens in levels:
+            _buckets[key] = (tokens - 1, now)
+    if PERSIST_BUCKETS:
+        import db_handler
+        db_handler.save_rate_buckets([(key, tokens - 1, now) for key, _, tokens in levels])
+    return True, 0.0
+
+def client_key():
+    """Best identifier for the caller: client IP behind the proxy, else a per-session id.
+    Only X-Forwarded-For entries appended by our own TRUSTED_PROXIES count; everything to their
+    left is whatever the client sent, so a fresh fake IP per request must not buy a new bucket."""
+    try:
+        forwarded = st.context.headers.get("X-Forwarded-For")
+        hops = [hop.strip() for hop in forwarded.split(",")] if forwarded and TRUSTED_PROXIES else []
+        if len(hops) >= TRUSTED_PROXIES > 0:
+            return hops[-TRUSTED_PROXIES]
+        if st.context.ip_address:
+            return st.context.ip_address
+    except Exception:
+        pass
+    if "_client_id" not in st.session_state:
+        st.session_state._client_id = uuid.uuid4().hex
+    return st.session_state._client_id
+
+def _email_key(email):
+    return (email or "").strip().lower()
+
+# ==========================================
+# 3. PUBLIC API
+# ==========================================
+def allow_send(email):
+    """Call before writing or mailing a new code. Returns (allowed, retry_after_seconds)."""
+    return _take([("send:email", _email_key(email)), ("send:client", client_key())])
+
+def allow_verify(email):
+    """Call before checking a submitted code. Returns (allowed, retry_after_seconds)."""
+    return _take([("verify:email", _email_key(email)), ("verify:client", client_key())])
+
+def new_otp():
+    """Six-digit code from the OS CSPRNG."""
+    return f"{secrets.randbelow(1000000):06d}"
+
+def retry_message(retry_after):
+    minutes, seconds = divmod(int(retry_after) + 1, 60)
+    wait = f"{minutes} min {seconds} s" if minutes else f"{seconds} s"
+    return f"Too many attempts. Please try again in {wait}."
@@ -0,0 +1,142 @@
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+# ==========================================
+# 1. SETTINGS (Tunable from secrets.toml)
+# ==========================================
+# [security]
+# scrypt_n = 16384      # CPU/memory cost, power of two (16 MiB per hash at r=8)
+# hash_workers = 2      # Parallel hashes; keep <= CPU cores
+# hash_queue = 16       # Max logins waiting for a worker before we answer "busy"
+def _security_setting(key, default):
+    try:
+        return int(st.secrets.get("security", {}).get(key, default))
+    except Exception:
+        return default
+
+SCRYPT_N = _security_setting("scrypt_n", 2 ** 14)
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+HASH_WORKERS = _security_setting("hash_workers", 2)
+HASH_QUEUE = _security_setting("hash_queue", 16)
+QUEUE_TIMEOUT = 5  # seconds a caller waits for a free slot
+
+# ==========================================
+# 2. BOUNDED WORKER POOL
+# ==========================================
+# hashlib.scrypt releases the GIL, so hashes run truly in parallel on the workers
+# while the semaphore caps how many requests can pile up behind them.
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="pwhash")
+_slots = threading.BoundedSemaphore(HASH_WORKERS + HASH_QUEUE)
+
+class HashingBusy(RuntimeError):
+    """Raised when the hashing queue is full; callers should ask the user to retry."""
+
+def _submit(fn, *args):
+    """Queues fn on the workers once a slot is free; the slot is released when fn finishes."""
+    if not _slots.acquire(timeout=QUEUE_TIMEOUT):
+        raise HashingBusy("Password hashing queue is full")
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+def _run(fn, *args):
+    return _submit(fn, *args).result()
+
+# ==========================================
+# 3. HASH FORMAT
+# ==========================================
+# New hashes:    scrypt$<n>$<r>$<p>$<salt hex>$<hash hex>
+# Legacy hashes: 64 hex chars of unsalted SHA-256
+def _scrypt(password, salt, n, r, p):
+    maxmem = 128 * r * (n + p + 2) + 1024 * 1024
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=maxmem)
+
+def _hash(password, n):
+    salt = os.urandom(SALT_BYTES)
+    digest = _scrypt(password, salt, n, SCRYPT_R, SCRYPT_P)
+    return f"scrypt${n}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+def _verify(password, stored):
+    if stored.startswith("scrypt$"):
+        _, n, r, p, salt, digest = stored.split("$")
+        candidate = _scrypt(password, bytes.fromhex(salt), int(n), int(r), int(p))
+        return hmac.compare_digest(candidate.hex().encode(), digest.encode())
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    # Bytes, not str: compare_digest rejects non-ASCII str, and a corrupted row may hold some
+    return hmac.compare_digest(legacy.encode(), stored.encode())
+
+def is_legacy_hash(stored):
+    return not stored.startswith("scrypt$")
+
+def needs_rehash(stored):
+    """True for SHA-256 hashes and for scrypt hashes made with an older cost setting."""
+    if is_legacy_hash(stored):
+        return True
+    return int(stored.split("$")[1]) != SCRYPT_N
+
+# ==========================================
+# 4. PUBLIC API
+# ==========================================
+def hash_password(password):
+    """Salted scrypt hash, computed on the worker pool."""
+    return _run(_hash, password, SCRYPT_N)
+
+def hash_passwords(passwords):
+    """Hashes many passwords for bulk imports, HASH_WORKERS at a time so queued logins interleave."""
+    hashes = []
+    for i in range(0, len(passwords), HASH_WORKERS):
+        batch = passwords[i:i + HASH_WORKERS]
+        futures = [_submit(_hash, pw, SCRYPT_N) for pw in batch]
+        hashes.extend(f.result() for f in futures)
+    return hashes
+
+def verify_password(password, stored):
+    """Checks a password against a stored scrypt or legacy SHA-256 hash on the worker pool."""
+    if not stored:
+        return False
+    try:
+        return _run(_verify, password, stored)
+    except (ValueError, TypeError):
+        # Malformed stored hash
+        return False
+
+# ==========================================
+# 5. COST BENCHMARK
+# ==========================================
+def benchmark(target_logins_per_sec=20, costs=(2 ** 13, 2 ** 14, 2 ** 15, 2 ** 16), rounds=20):
+    """Times each scrypt cost on the worker pool and reports which ones meet the login target."""
+    results = []
+    for n in costs:
+        start = time.perf_counter()
+        futures = [_executor.submit(_hash, "benchmark-password", n) for _ in range(rounds)]
+        for f in futures:
+            f.result()
+        elapsed = time.perf_counter() - start
+        throughput = rounds / elapsed
+        results.append({
+            "n": n,
+            "memory_mib": 128 * SCRYPT_R * n / (1024 * 1024),
+            "ms_per_hash": elapsed / rounds * 1000 * HASH_WORKERS,
+            "logins_per_sec": throughput,
+            "meets_target": throughput >= target_logins_per_sec,
+        })
+    return results
+
+if __name__ == "__main__":
+    print(f"Workers: {HASH_WORKERS}, current scrypt_n: {SCRYPT_N}")
+    for row in benchmark():
+        mark = "OK " if row["meets_target"] else "LOW"
+        print(f"[{mark}] n={row['n']:>6}  {row['memory_mib']:5.0f} MiB  "
+              f"{row['ms_per_hash']:7.1f} ms/hash  {row['logins_per_sec']:6.1f} logins/s")
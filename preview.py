@@ -1,6 +1,5 @@
 import streamlit as st
 import time
-import random
 import json
 import os 
 import smtplib 
@@ -9,8 +8,10 @@ from email.mime.multipart import MIMEMultipart
 from db_handler import ( 
     get_user_by_email, create_user_pending_verification, 
     verify_user, set_otp_for_reset, update_user_password,
-    log_login, ensure_admin, create_table
+    log_login, ensure_admin, create_table, check_user_password
 ) 
+from password_hasher import HashingBusy
+import otp_guard
 
 # Ensure tables exist 
 
@@ -351,7 +352,7 @@ def show_log_page():
                     st.error("Please enter both email and password.")
                     return
                 
-                user = get_user_by_email(email)
+                user = get_user_by_email(email, include_password=True)
                 
                 if user is None:
                     st.error("Email not found.")
@@ -364,18 +365,22 @@ def show_log_page():
                     st.rerun()
                     return
                 
-                import hashlib
-                hashed_input = hashlib.sha256(password.encode()).hexdigest()
+                try:
+                    password_ok = check_user_password(user, password)
+                except HashingBusy:
+                    st.error("Too many login attempts right now. Please try again in a moment.")
+                    return
                 
-                if hashed_input == user['password']:
+                if password_ok:
                     st.session_state.logged_in = True 
                     st.session_state.user_info = {
+                        'id': user['id'],
                         'username': user['username'], 
                         'email': user['email'], 
                         'role': user['role'],
                         'is_verified': user['is_verified']
                     }
-                    log_login(user['username'], user['email']) 
+                    log_login(user['username'], user['email'], user_id=user['id']) 
                     close_modal_and_reset_states() 
                 else:
                     st.error("Incorrect password. Please try again.")
@@ -438,26 +443,37 @@ def show_log_page():
                     elif get_user_by_email(su_email):
                             st.error("This email is already registered.")
                     else:
-                        otp = str(random.randint(100000, 999999)) 
+                        # Checked before the insert and the SMTP call, so floods never reach either
+                        allowed, retry_after = otp_guard.allow_send(su_email)
+                        if not allowed:
+                            st.error(otp_guard.retry_message(retry_after))
+                        else:
+                            otp = otp_guard.new_otp()
                         
-                        success_db = create_user_pending_verification(su_name, su_email, su_pass, otp)
+                            try:
+                                success_db = create_user_pending_verification(su_name, su_email, su_pass, otp)
+                            except HashingBusy:
+                                success_db = False
                         
-                        if success_db:
-                            send_success = send_otp_email(su_email, otp, purpose="verification")
+                            if success_db:
+                                send_success = send_otp_email(su_email, otp, purpose="verification")
                             
-                            st.session_state.signup_pending = {
-                                "name": su_name, "email": su_email, "password": su_pass
-                            }
-                            st.rerun() 
-                        else:
-                            st.error("Failed to create user record. Please try again.")
+                                st.session_state.signup_pending = {
+                                    "name": su_name, "email": su_email, "password": su_pass
+                                }
+                                st.rerun() 
+                            else:
+                                st.error("Failed to create user record. Please try again.")
                         
                 st.button("← Back to Login", key="signup_back_btn", type="secondary", use_container_width=True, on_click=go_back_to_login)
 
             # SIGNUP STEP 2
             else:
                 def handle_verify_otp(otp_in):
-                  if verify_user(st.session_state.signup_pending['email'], otp_in.strip()): 
+                  allowed, retry_after = otp_guard.allow_verify(st.session_state.signup_pending['email'])
+                  if not allowed:
+                    st.error(otp_guard.retry_message(retry_after))
+                  elif verify_user(st.session_state.signup_pending['email'], otp_in.strip()): 
                     st.session_state.signup_pending = None
                     st.session_state.show_success = True
                     st.session_state.page = "login"
@@ -478,10 +494,14 @@ def show_log_page():
                 
                 with col_resend:
                     if st.button("Resend Code", type="secondary", use_container_width=True):
-                        new_otp = str(random.randint(100000, 999999)) 
-                        set_otp_for_reset(st.session_state.signup_pending['email'], new_otp) 
-                        send_otp_email(st.session_state.signup_pending['email'], new_otp, purpose="verification")
-                        st.info("New code sent.")
+                        allowed, retry_after = otp_guard.allow_send(st.session_state.signup_pending['email'])
+                        if not allowed:
+                            st.error(otp_guard.retry_message(retry_after))
+                        else:
+                            new_otp = otp_guard.new_otp()
+                            set_otp_for_reset(st.session_state.signup_pending['email'], new_otp) 
+                            send_otp_email(st.session_state.signup_pending['email'], new_otp, purpose="verification")
+                            st.info("New code sent.")
                 
                 with col_cancel:
                     st.button("Cancel", type="secondary", use_container_width=True, on_click=cancel_signup)
@@ -506,11 +526,13 @@ def show_log_page():
 
                 if submit_reset_code:
                     if email.strip():
-                        user = get_user_by_email(email)
-                        if user is None:
+                        allowed, retry_after = otp_guard.allow_send(email)
+                        if not allowed:
+                            st.error(otp_guard.retry_message(retry_after))
+                        elif get_user_by_email(email) is None:
                             st.error("Email not found in our system.")
                         else:
-                            otp = str(random.randint(100000, 999999)) 
+                            otp = otp_guard.new_otp()
                             set_otp_for_reset(email, otp)
                             send_otp_email(email, otp, purpose="password_reset")
                             
@@ -526,7 +548,10 @@ def show_log_page():
             elif st.session_state.forgot_stage == "verify_otp":
                 
                 def handle_verify_reset_code(otp_input):
-                    if verify_user(st.session_state.reset_email, otp_input): 
+                    allowed, retry_after = otp_guard.allow_verify(st.session_state.reset_email)
+                    if not allowed:
+                        st.error(otp_guard.retry_message(retry_after))
+                    elif verify_user(st.session_state.reset_email, otp_input): 
                         st.session_state.forgot_stage = "reset_password"
                         st.rerun()
                     else:
@@ -545,11 +570,15 @@ def show_log_page():
                 
                 with col_resend:
                     if st.button("Resend Code", type="secondary", use_container_width=True):
-                        new_otp = str(random.randint(100000, 999999)) 
-                        set_otp_for_reset(st.session_state.reset_email, new_otp)
-                        send_otp_email(st.session_state.reset_email, new_otp, purpose="password_reset")
-                        st.info("New code sent.")
-                        st.rerun()
+                        allowed, retry_after = otp_guard.allow_send(st.session_state.reset_email)
+                        if not allowed:
+                            st.error(otp_guard.retry_message(retry_after))
+                        else:
+                            new_otp = otp_guard.new_otp()
+                            set_otp_for_reset(st.session_state.reset_email, new_otp)
+                            send_otp_email(st.session_state.reset_email, new_otp, purpose="password_reset")
+                            st.info("New code sent.")
+                            st.rerun()
                 
                 with col_cancel:
                     st.button("Cancel", type="secondary", use_container_width=True, on_click=cancel_forgot)
@@ -563,7 +592,11 @@ def show_log_page():
                     elif password_issues(new_password):
                             st.error(f"Password requirements not met: {', '.join(password_issues(new_password))}")
                     else:
-                        if update_user_password(st.session_state.reset_email, new_password):
+                        try:
+                            password_updated = update_user_password(st.session_state.reset_email, new_password)
+                        except HashingBusy:
+                            password_updated = False
+                        if password_updated:
                             st.success("Password successfully reset! You can now log in.")
                             st.session_state.forgot_stage = "request_email"
                             st.session_state.page = "login"
@@ -857,10 +857,16 @@ def show_salary_predictor_page():
 
                     try:
                         # --- CORRECTED LINE: USE USER_INFO DICTIONARY ---
-                        db.log_prediction(
+                        st.session_state.last_prediction_id = db.log_prediction(
                             st.session_state.get('user_info', {}).get('username', 'Guest'), 
                             f"₹ {salary_min:,.0f} - {salary_max:,.0f} (Center: {center_salary:,.0f})",
-                            input_row["Job_Role_Level"]
+                            input_row["Job_Role_Level"],
+                            salary_min=round(float(salary_min), 2),
+                            salary_max=round(float(salary_max), 2),
+                            salary_center=round(float(center_salary), 2),
+                            features=input_row,
+                            is_custom_role=is_custom_role_flag,
+                            user_id=st.session_state.get('user_info', {}).get('id')
                         )
                     except Exception as log_e:
                         print(f"Database logging failed: {log_e}")
@@ -1064,7 +1070,11 @@ def show_salary_predictor_page():
                                 input_row["Job_Role_Level"],
                                 str(int(center_salary)),
                                 str(actual_offer),
-                                accuracy_rating
+                                accuracy_rating,
+                                predicted_center=round(float(center_salary), 2),
+                                actual_offer=float(actual_offer),
+                                prediction_id=st.session_state.get('last_prediction_id'),
+                                user_id=st.session_state.get('user_info', {}).get('id')
                             )
                             st.success("Thank you! Feedback recorded in System Database.")
                         except Exception as e:
@@ -0,0 +1,30 @@
+"""URLs for the content-hashed files in static/ (see build_assets.py).
+
+Needs `enableStaticServing = true` under [server] in .streamlit/config.toml. Files are then
+served at app/static/... The ?v=<hash> suffix gets a long max-age from the Tornado static handler
+(Streamlit 1.51 as pinned); servers without it still answer repeat requests with a 304 via ETag.
+Either way a changed image gets a new URL, so nothing stale is ever shown.
+"""
+import json
+import os
+
+STATIC_URL = "app/static"
+MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "logos", "manifest.json")
+
+def _load_manifest():
+    try:
+        with open(MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Logo Manifest Error (run build_assets.py): {e}")
+        return {}
+
+_manifest = _load_manifest()
+
+def logo_url(key, fallback=None):
+    """URL of a built logo ("<group>/<Company>"), or `fallback` if it isn't in the manifest."""
+    filename = _manifest.get(key)
+    if not filename:
+        return fallback
+    digest = filename.split(".")[-2]
+    return f"{STATIC_URL}/logos/{filename}?v={digest}"
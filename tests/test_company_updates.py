@@ -0,0 +1,87 @@
+"""company_updates.fetch_all against the local fixture feeds (fixture_server.py)."""
+import time
+
+import pytest
+
+import company_updates
+import fixture_server
+
+MAX_DELAY = 0.8
+
+class FlakySource(company_updates.UpdateSource):
+    """Raises a non-HTTP error on its first `failures` fetches, then returns one update."""
+
+    def __init__(self, company, failures=1):
+        super().__init__(company, ttl=60)
+        self.failures = failures
+        self.calls = 0
+
+    def fetch(self, validators):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("adapter bug")
+        return [{"type": "📢 Update", "message": f"call {self.calls}"}], {}
+
+@pytest.fixture(scope="module")
+def feeds():
+    server, base_url = fixture_server.start(max_delay=MAX_DELAY)
+    yield server, base_url
+    server.shutdown()
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    monkeypatch.setattr(company_updates, "SOURCES", {})
+    company_updates.clear()
+    yield
+    company_updates.clear()
+
+def _register_feeds(base_url):
+    for company in fixture_server.FEEDS:
+        company_updates.register(company_updates.JsonFeedSource(company, f"{base_url}/feeds/{company}.json"))
+    return sorted(fixture_server.FEEDS)
+
+def test_sources_are_fetched_concurrently(feeds):
+    server, base_url = feeds
+    companies = _register_feeds(base_url)
+    started = time.perf_counter()
+    result = company_updates.fetch_all(companies, timeout=MAX_DELAY + 5)
+    elapsed = time.perf_counter() - started
+    assert result == fixture_server.FEEDS
+    # About as long as the slowest feed, far below the sum of all delays
+    assert elapsed < sum(fixture_server.delays(MAX_DELAY).values()) / 2
+
+    # Fresh entries are served from the cache without another request
+    hits = sum(server.hits.values())
+    assert company_updates.fetch_all(companies) == fixture_server.FEEDS
+    assert sum(server.hits.values()) == hits
+
+def test_forced_refresh_revalidates_with_etag(feeds):
+    server, base_url = feeds
+    companies = _register_feeds(base_url)
+    company_updates.fetch_all(companies, timeout=MAX_DELAY + 5)
+    before = sum(server.not_modified.values())
+    result = company_updates.fetch_all(companies, force=True, timeout=MAX_DELAY + 5)
+    # Every feed answered 304 and the cached updates were kept
+    assert sum(server.not_modified.values()) - before == len(companies)
+    assert result == fixture_server.FEEDS
+
+def test_failing_source_keeps_last_updates_and_is_retried(feeds, monkeypatch):
+    server, base_url = feeds
+    monkeypatch.setattr(company_updates, "ERROR_RETRY", 0.0)
+    good = company_updates.JsonFeedSource("TCS", f"{base_url}/feeds/TCS.json")
+    company_updates.register(good)
+    first = company_updates.fetch_all(["TCS"], timeout=MAX_DELAY + 5)["TCS"]
+
+    good.url = f"{base_url}/feeds/Missing.json"  # now answers 404
+    assert company_updates.fetch_all(["TCS"], force=True, timeout=MAX_DELAY + 5)["TCS"] == first
+    assert company_updates.status()[0]["Error"]
+
+def test_unexpected_adapter_error_does_not_block_refreshes(monkeypatch):
+    monkeypatch.setattr(company_updates, "ERROR_RETRY", 0.0)
+    flaky = FlakySource("Acme")
+    company_updates.register(flaky)
+    assert company_updates.fetch_all(["Acme"]) == {"Acme": []}
+    assert "Acme" not in company_updates._inflight
+    # The failed entry expired at once (ERROR_RETRY = 0), so the next call fetches again
+    assert company_updates.fetch_all(["Acme"]) == {"Acme": [{"type": "📢 Update", "message": "call 2"}]}
+    assert flaky.calls == 2
@@ -0,0 +1,164 @@
+"""Pool recovery after a MySQL restart, against in-process stand-ins for the server connections."""
+import pytest
+from mysql.connector import Error, InterfaceError, MySQLConnection, OperationalError
+
+import db_handler
+import db_health
+
+POOL_SIZE = 3
+
+class FakeServer:
+    def __init__(self):
+        self.up = True
+        self.generation = 0  # bumped on restart; sessions from older generations are gone
+
+    def restart(self):
+        self.generation += 1
+
+class FakeConnection(MySQLConnection):
+    """A MySQLConnection whose session lives and dies with FakeServer instead of a socket."""
+
+    def __init__(self, server):
+        super().__init__()
+        self.server = server
+        self.session = server.generation
+        self.pings = 0
+
+    def _alive(self):
+        return self.server.up and self.session == self.server.generation
+
+    def cmd_ping(self):
+        self.pings += 1
+        if not self._alive():
+            raise OperationalError(msg="MySQL Connection not available.")
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        self.cmd_ping()
+
+    def reconnect(self, attempts=1, delay=0):
+        if not self.server.up:
+            raise InterfaceError(msg="Can't connect to MySQL server", errno=2003)
+        self.session = self.server.generation
+
+    def config(self, **kwargs):
+        pass
+
+    def cmd_query(self, query, *args, **kwargs):
+        if not self._alive():
+            raise OperationalError(msg="Lost connection to MySQL server during query", errno=2013)
+        return {"columns": [("1", 8, None, None, None, None, 0, 1, 63)], "eof": {"status_flag": 0, "warning_count": 0}}
+
+    def get_rows(self, *args, **kwargs):
+        return [(1,)], {"status_flag": 0, "warning_count": 0}
+
+    def close(self):
+        pass
+
+    disconnect = close
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+def _fake_pool(server, name, size):
+    pool = db_handler.IdleAwarePool(pool_name=name, pool_size=size, pool_reset_session=False)
+    pool.set_config(host="db.invalid")
+    for _ in range(size):
+        cnx = FakeConnection(server)
+        cnx.pool_config_version = pool._config_version
+        pool.add_connection(cnx)
+    return pool
+
+@pytest.fixture
+def background(server):
+    return _fake_pool(server, "test_background", db_handler.BACKGROUND_POOL_SIZE)
+
+@pytest.fixture
+def pool(server, background, monkeypatch):
+    pool = _fake_pool(server, "test_recovery", POOL_SIZE)
+    monkeypatch.setattr(db_handler, "get_db_pool", lambda: pool)
+    monkeypatch.setattr(db_handler, "get_replica_pool", lambda: None)
+    monkeypatch.setattr(db_handler, "get_background_pool", lambda: background)
+    monkeypatch.setattr(db_health, "_state", db_health.UNKNOWN)
+    monkeypatch.setattr(db_health, "_streak", (None, 0))
+    return pool
+
+def _connections(pool):
+    return list(pool._cnx_queue.queue)
+
+def _select_one():
+    with db_handler.transaction(readonly=True) as cursor:
+        cursor.execute("SELECT 1")
+        return cursor.fetchall()
+
+def test_recently_used_connections_skip_the_ping(pool):
+    for _ in range(2 * POOL_SIZE):
+        assert _select_one() == [(1,)]
+    assert sum(cnx.pings for cnx in _connections(pool)) == 0
+
+def test_dead_connection_goes_back_to_the_pool_and_is_revived(pool, server):
+    server.restart()
+    failures = 0
+    for _ in range(3 * POOL_SIZE):
+        try:
+            _select_one()
+        except Error:
+            failures += 1
+        assert pool._cnx_queue.qsize() == POOL_SIZE  # every slot returned, even after a failure
+    # Each connection fails once, comes back stale and is reconnected on its next checkout
+    assert failures == POOL_SIZE
+    assert _select_one() == [(1,)]
+
+def test_idle_connections_revalidated_after_recovery(pool, server):
+    server.restart()
+    db_handler.invalidate_idle_connections()
+    for _ in range(POOL_SIZE):
+        assert _select_one() == [(1,)]
+
+def test_background_work_uses_its_own_pool(pool, background):
+    with db_handler.background_work():
+        held = [db_handler.get_connection() for _ in range(db_handler.BACKGROUND_POOL_SIZE)]
+        assert all(conn._cnx_pool is background for conn in held)
+    assert _select_one() == [(1,)]  # page requests are unaffected by a fully busy background pool
+    for conn in held:
+        conn.close()
+
+def test_prober_recovers_after_restart(pool, background, server):
+    """Probing faster than VALIDATE_IDLE_AFTER keeps every connection 'recent'; the prober must
+    still reconnect them once the server is back, or the app stays in degraded mode for good."""
+    assert db_health.probe_once() == db_health.HEALTHY
+    server.up = False
+    server.restart()
+    for _ in range(db_health.FAIL_AFTER):
+        db_health.probe_once()
+    assert db_health.is_down()
+    with pytest.raises(Error):
+        _select_one()  # fails fast while down
+
+    server.up = True
+    for _ in range(db_handler.BACKGROUND_POOL_SIZE + db_health.RECOVER_AFTER):
+        if db_health.probe_once() == db_health.HEALTHY:
+            break
+    assert db_health.state() == db_health.HEALTHY
+    # Connections idle through the outage were revalidated, so no request pays for the restart
+    for _ in range(POOL_SIZE):
+        assert _select_one() == [(1,)]
+
+def test_replay_keeps_writes_the_database_did_not_take(monkeypatch):
+    monkeypatch.setattr(db_health, "_state", db_health.HEALTHY)
+    monkeypatch.setattr(db_health, "_deferred", type(db_health._deferred)(maxlen=10))
+    written, outage = [], [True]
+
+    def write(n):
+        if outage[0]:
+            raise OperationalError(msg="Lost connection to MySQL server during query", errno=2013)
+        written.append(n)
+
+    for n in range(3):
+        db_health.defer(write, n)
+    db_health.replay_deferred()
+    assert written == [] and len(db_health._deferred) == 3  # nothing lost, order kept
+
+    outage[0] = False
+    db_health.replay_deferred()
+    assert written == [0, 1, 2] and not db_health._deferred
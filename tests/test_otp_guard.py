@@ -0,0 +1,132 @@
+"""OTP token buckets (burst, refill, lockout, idle expiry), client keys and code expiry (no DB needed)."""
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from cachetools import TTLCache
+
+import db_handler
+import otp_guard
+
+CLIENT = "203.0.113.7"
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(otp_guard.time, "time", clock)
+    monkeypatch.setattr(otp_guard, "_buckets", TTLCache(maxsize=100, ttl=86400, timer=clock))
+    monkeypatch.setattr(otp_guard, "PERSIST_BUCKETS", False)
+    monkeypatch.setattr(otp_guard, "client_key", lambda: CLIENT)
+    monkeypatch.setattr(otp_guard, "LIMITS", {
+        "send:email": (3, 120.0),
+        "send:client": (10, 30.0),
+        "verify:email": (5, 300.0),
+        "verify:client": (20, 15.0),
+    })
+    return clock
+
+def test_burst_then_lockout_with_retry_hint(clock):
+    assert [otp_guard.allow_send("a@example.com")[0] for _ in range(3)] == [True] * 3
+    allowed, retry_after = otp_guard.allow_send("A@Example.com ")  # same address, normalised
+    assert not allowed and retry_after == pytest.approx(120.0)
+    assert "try again in 2 min 1 s" in otp_guard.retry_message(retry_after)
+
+def test_bucket_refills_one_token_per_interval(clock):
+    for _ in range(3):
+        otp_guard.allow_send("a@example.com")
+    clock.now += 119
+    assert otp_guard.allow_send("a@example.com") == (False, pytest.approx(1.0))
+    clock.now += 1
+    assert otp_guard.allow_send("a@example.com") == (True, 0.0)
+    assert not otp_guard.allow_send("a@example.com")[0]
+
+def test_blocked_request_takes_no_tokens(clock):
+    # The client bucket runs dry across addresses; denied calls must not drain the email buckets
+    for i in range(10):
+        assert otp_guard.allow_send(f"user{i}@example.com")[0]
+    assert otp_guard.allow_send("fresh@example.com") == (False, pytest.approx(30.0))
+    assert "send:email:fresh@example.com" not in otp_guard._buckets
+    clock.now += 30
+    assert otp_guard.allow_send("fresh@example.com")[0]
+    assert [otp_guard.allow_send("fresh@example.com")[0] for _ in range(2)] == [False, False]  # client dry again
+
+def test_wrong_guesses_lock_the_address_not_other_addresses(clock):
+    assert all(otp_guard.allow_verify("a@example.com")[0] for _ in range(5))
+    assert not otp_guard.allow_verify("a@example.com")[0]
+    assert otp_guard.allow_verify("b@example.com")[0]
+
+def test_idle_buckets_expire_full(clock):
+    for _ in range(3):
+        otp_guard.allow_send("a@example.com")
+    clock.now += 86400 + 1
+    assert otp_guard.allow_send("a@example.com")[0]
+    assert "send:email:a@example.com" in otp_guard._buckets  # a fresh entry, not the drained one
+    assert otp_guard._buckets["send:email:a@example.com"][0] == 2
+
+def test_new_otp_is_six_digits():
+    codes = {otp_guard.new_otp() for _ in range(50)}
+    assert all(len(code) == 6 and code.isdigit() for code in codes)
+    assert len(codes) > 1
+
+@pytest.fixture
+def request_from(monkeypatch):
+    def request_from(forwarded, peer="10.0.0.2", proxies=1):
+        monkeypatch.setattr(otp_guard, "TRUSTED_PROXIES", proxies)
+        headers = {"X-Forwarded-For": forwarded} if forwarded else {}
+        context = SimpleNamespace(headers=headers, ip_address=peer)
+        monkeypatch.setattr(otp_guard, "st", SimpleNamespace(context=context, session_state={}))
+        return otp_guard.client_key()
+    return request_from
+
+def test_client_key_ignores_spoofed_forwarded_hops(request_from):
+    # Our proxy appends the real peer; anything the client put in front is ignored
+    assert request_from("1.1.1.1, 198.51.100.4") == "198.51.100.4"
+    assert request_from("9.9.9.9, 198.51.100.4") == "198.51.100.4"
+    assert request_from("1.1.1.1, 198.51.100.4, 10.0.0.9", proxies=2) == "198.51.100.4"
+    # Without trusted proxies the header is not trusted at all
+    assert request_from("1.1.1.1", proxies=0) == "10.0.0.2"
+
+class CodeRow:
+    """Cursor stand-in for verify_user: answers the code lookup with `row` and records updates."""
+
+    def __init__(self, row):
+        self.row = row
+        self.updates = []
+
+    def execute(self, sql, params=()):
+        if sql.startswith("UPDATE"):
+            self.updates.append(params)
+
+    def fetchone(self):
+        return self.row
+
+@pytest.fixture
+def code_row(monkeypatch):
+    cursor = CodeRow(None)
+
+    @contextmanager
+    def transaction(*args, **kwargs):
+        yield cursor
+
+    monkeypatch.setattr(db_handler, "transaction", transaction)
+    monkeypatch.setattr(db_handler, "_insert_activity", lambda *args, **kwargs: None)
+    return cursor
+
+@pytest.mark.parametrize("row, code, verified", [
+    ({"id": 1, "otp": "123456", "fresh": 1}, "123456", True),
+    ({"id": 1, "otp": "123456", "fresh": 0}, "123456", False),  # expired
+    ({"id": 1, "otp": "123456", "fresh": 1}, "654321", False),  # wrong code
+    ({"id": 1, "otp": None, "fresh": 0}, "123456", False),      # already used
+    (None, "123456", False),                                    # no such user
+], ids=["fresh", "expired", "wrong", "used", "unknown"])
+def test_verify_user_accepts_only_fresh_matching_codes(code_row, row, code, verified):
+    code_row.row = row
+    assert db_handler.verify_user("a@example.com", code) is verified
+    assert code_row.updates == ([(1,)] if verified else [])
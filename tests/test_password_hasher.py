@@ -0,0 +1,89 @@
+"""Scrypt hashing, legacy SHA-256 upgrade and verify failure paths (no DB needed)."""
+import hashlib
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+import db_handler
+import password_hasher
+
+FAST_N = 2 ** 10
+
+@pytest.fixture(autouse=True)
+def cheap_scrypt(monkeypatch):
+    monkeypatch.setattr(password_hasher, "SCRYPT_N", FAST_N)
+
+def _legacy(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+def test_scrypt_hashes_are_salted_and_verify():
+    first = password_hasher.hash_password("s3cret!")
+    second = password_hasher.hash_password("s3cret!")
+    assert first.startswith(f"scrypt${FAST_N}$") and first != second
+    assert password_hasher.verify_password("s3cret!", first)
+    assert not password_hasher.verify_password("s3cret?", first)
+    assert not password_hasher.needs_rehash(first)
+
+def test_legacy_and_outdated_hashes_need_a_rehash(monkeypatch):
+    legacy = _legacy("old-password")
+    assert password_hasher.verify_password("old-password", legacy)
+    assert password_hasher.needs_rehash(legacy)
+    outdated = password_hasher.hash_password("pw")
+    monkeypatch.setattr(password_hasher, "SCRYPT_N", FAST_N * 2)
+    assert password_hasher.needs_rehash(outdated)
+
+@pytest.mark.parametrize("stored", [
+    "",
+    None,
+    "scrypt$1024$8",
+    "scrypt$1024$8$1$zz$00",
+    "é" * 64,
+    f"scrypt${FAST_N}$8$1$00ff${'é' * 64}",
+], ids=["empty", "null", "truncated", "salt-not-hex", "non-ascii-legacy", "non-ascii-digest"])
+def test_malformed_stored_hash_fails_verification(stored):
+    assert password_hasher.verify_password("anything", stored) is False
+
+def test_bulk_hashing_waits_for_the_shared_slots(monkeypatch):
+    monkeypatch.setattr(password_hasher, "_slots", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(password_hasher, "QUEUE_TIMEOUT", 0.05)
+    hashes = password_hasher.hash_passwords(["a", "b", "c"])
+    assert [password_hasher.verify_password(pw, h) for pw, h in zip("abc", hashes)] == [True] * 3
+
+    password_hasher._slots.acquire()  # every slot taken, e.g. by queued logins
+    try:
+        with pytest.raises(password_hasher.HashingBusy):
+            password_hasher.hash_passwords(["d"])
+    finally:
+        password_hasher._slots.release()
+
+class RecordingCursor:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, sql, params=()):
+        self.statements.append((sql, params))
+
+@pytest.fixture
+def writes(monkeypatch):
+    cursor = RecordingCursor()
+
+    @contextmanager
+    def transaction(*args, **kwargs):
+        yield cursor
+
+    monkeypatch.setattr(db_handler, "transaction", transaction)
+    return cursor.statements
+
+def test_login_upgrades_a_legacy_hash(writes):
+    user = {"email": "a@example.com", "password": _legacy("hunter2")}
+    assert db_handler.check_user_password(user, "hunter2")
+    (sql, (new_hash, email, old_hash)), = writes
+    assert sql.startswith("UPDATE users SET password")
+    assert (email, old_hash) == ("a@example.com", user["password"])
+    assert new_hash.startswith("scrypt$") and password_hasher.verify_password("hunter2", new_hash)
+
+def test_failed_login_leaves_the_hash_alone(writes):
+    assert not db_handler.check_user_password({"email": "a@example.com", "password": _legacy("hunter2")}, "hunter3")
+    assert not db_handler.check_user_password({"email": "a@example.com", "password": None}, "hunter2")
+    assert writes == []